@@ -0,0 +1 @@
+from .console import HeadlessApplication
\ No newline at end of file
@@ -0,0 +1,109 @@
+from datetime import datetime
+from sys import stdout, stderr
+from typing import Callable, Iterable, List, TextIO, override
+
+from .overlay import NullOverlay
+from core import CommandManager, ThemeManager, WindowManager
+from infrastructure import Directory, MessageHub, MigrationPipeline, StartupTracer
+from infrastructure.interfaces import IConsole
+
+class HeadlessApplication(IConsole):
+    
+    def __init__(self):
+        Directory.create_data_dirs()
+        with StartupTracer.phase("migrations"):
+            MigrationPipeline.run_all_migrations()
+        
+        self._msg_provider: MessageHub = MessageHub()
+        self._quit_requested: bool = False
+        self._failure_reported: bool = False
+        self._setup_text_config()
+        
+        self._msg_provider.link_callback(self._print_output)
+        
+        self._cmd_manager: CommandManager = CommandManager(
+            console=self,
+            overlay=NullOverlay(),
+            theme_manager=ThemeManager(),
+            window_manager=WindowManager()
+        ) # the trace is finished by the first command, which builds the core services
+    
+    
+    _PREFIX: chr = ">"
+    _COMMENT_PREFIX: chr = "#"
+    _FAILURE_TYPES: set = {"invalid", "error"}
+    _DIAGNOSTIC_TYPES: set = {"invalid", "warning", "error"}
+    _UNSUPPORTED_COMMANDS: tuple = ("tracking new", "tracking continue", "tracking bank", "keybinds config") # depend on global hotkeys and the overlay
+    
+    
+    @override
+    def add_to_input_history(self, console_input: str) -> None:
+        pass # scripted inputs are not added to the interactive history
+    
+    
+    @override
+    def quit(self) -> None:
+        self._quit_requested = True
+    
+    
+    def _setup_text_config(self) -> None:
+        self._text_config: dict = {
+            "list": self._format_list,
+            "command": lambda text: f"\n{datetime.now().time().strftime('%H:%M:%S')}{HeadlessApplication._PREFIX} {text}",
+            "request": lambda text: f"<{text}>",
+            "success": lambda text: f"[SUCCESS] {text}",
+            "invalid": lambda text: f"[INVALID] {text}",
+            "note": lambda text: f"[NOTE] {text}",
+            "warning": lambda text: f"[WARNING] {text}",
+            "error": lambda text: f"[ERROR] {text}"
+        }
+    
+    
+    def run(self, console_inputs: Iterable[str]) -> int:
+        for console_input in console_inputs:
+            cleaned_console_input: str = console_input.strip()
+            
+            if not cleaned_console_input or cleaned_console_input.startswith(HeadlessApplication._COMMENT_PREFIX):
+                continue
+            
+            if self._get_unsupported(cleaned_console_input):
+                self._msg_provider.invoke(cleaned_console_input, "command")
+                self._msg_provider.invoke(f"The command '{cleaned_console_input}' requires the graphical interface and is not available in headless mode", "invalid")
+                continue
+            
+            with StartupTracer.phase(f"command '{cleaned_console_input}'"): # only recorded for the first command
+                self._cmd_manager.process_input(cleaned_console_input)
+            StartupTracer.finish() # covers the json loads and the db setup of the lazily built core services
+            
+            if self._quit_requested:
+                break
+        
+        StartupTracer.finish() # e.g. if no command was executed
+        
+        if not self._quit_requested:
+            self._cmd_manager.quit() # additionally closes the db connection
+        return 1 if self._failure_reported else 0
+    
+    
+    def _print_output(self, text: str, text_type: str, optional_arg: str | None = None) -> None:
+        if text_type in HeadlessApplication._FAILURE_TYPES:
+            self._failure_reported = True
+        
+        format_method: Callable[[str], str] | None = self._text_config.get(text_type)
+        output: TextIO = stderr if text_type in HeadlessApplication._DIAGNOSTIC_TYPES else stdout
+        
+        print(format_method(text) if format_method is not None else text, file=output, flush=True)
+    
+    
+    # helper methods below
+    
+    def _get_unsupported(self, cleaned_console_input: str) -> bool:
+        if self._cmd_manager.get_is_intercepting():
+            return False # the input answers a request of the previous command
+        return cleaned_console_input.lower().startswith(HeadlessApplication._UNSUPPORTED_COMMANDS)
+    
+    
+    @staticmethod
+    def _format_list(text: str) -> str:
+        lines: List[str] = text.split("\n")
+        return "\n".join(f"• {line}" if line else "" for line in lines)
\ No newline at end of file
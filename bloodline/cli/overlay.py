@@ -0,0 +1,49 @@
+from typing import Any, override
+
+from infrastructure.interfaces import IOverlay
+
+class NullOverlay(IOverlay):
+    
+    @override
+    def update_counter_label(self, count: int) -> None:
+        pass
+    
+    
+    @override
+    def update_timer_label(self, formated_time: str) -> None:
+        pass
+    
+    
+    @override
+    def update_segment_label(self, segment_text: str) -> None:
+        pass
+    
+    
+    @override
+    def update_slot_label(self, slot_text: str) -> None:
+        pass
+    
+    
+    @override
+    def update_metrics_label(self, metrics_text: str) -> None:
+        pass
+    
+    
+    @override
+    def add_mainloop_task(self, delay: int, task: Any) -> None:
+        pass # there is no mainloop in headless mode, so scheduled tasks are dropped
+    
+    
+    @override
+    def display_lock_animation(self, animation_time: int, lock_state: bool) -> None:
+        pass
+    
+    
+    @override
+    def create_instance(self) -> None:
+        pass
+    
+    
+    @override
+    def destroy_instance(self) -> None:
+        pass
\ No newline at end of file
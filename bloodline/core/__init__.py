@@ -1 +1,4 @@
-from .command_manager import CommandManager
\ No newline at end of file
+from .command_manager import CommandManager
+from .theme_compiler import ThemeCompiler
+from .theme_manager import ThemeManager
+from .window_manager import WindowManager
\ No newline at end of file
@@ -1,15 +1,19 @@
 from functools import partial
-from typing import Any, List, Callable
+from typing import Any, Dict, List, Callable, Tuple
 
-from .commands import BaseInterceptCommand, TrackingCommands, SetupCommands, StatsCommands, KeybindCommands, SettingsCommands
+from .commands import BaseCommand, BaseInterceptCommand, TrackingCommands, SetupCommands, StatsCommands, KeybindCommands, SettingsCommands, DebugCommands
 from .counter import Counter
+from .counter_bank import CounterBank
 from .hotkey_manager import HotkeyManager
 from .key_listener import KeyListener
 from .save_file import SaveFile
+from .segment_table import SegmentTable
+from .session_journal import SessionJournal
+from .session_metrics import SessionMetrics
 from .timer import Timer
 from infrastructure import MessageHub
 from infrastructure.interfaces import IConsole, IOverlay, IThemeManager, IWindowManager
-from schemas import HotkeyNames
+from schemas import HotkeyNames, TimerPrecision
 
 class CommandManager:
     
@@ -21,58 +25,70 @@ class CommandManager:
         
         self._msg_provider: MessageHub = MessageHub()
         
-        self._setup_core_instances()
-        self._setup_command_instances()
+        self._setup_lazy_instance_vars() # core services and command categories are only created once they are needed
         self._setup_input_vars()
         
         # category action -scope-filter arg1 -sort-filter arg2 -order-filter arg3
         self._commands: dict = { # const that is only changed when cancel commands are added/deleted to/from itself
             "help": self._help,
-            "tracking": self._tracking_cmds.info,
-            "tracking new": self._tracking_cmds.new,
-            "tracking continue": self._tracking_cmds.carry_on,
-            "setup": self._setup_cmds.info,
-            "setup add": self._setup_cmds.add,
-            "setup identify boss": self._setup_cmds.identify_boss,
-            "setup move boss": self._setup_cmds.move_boss,
-            "setup rename boss": self._setup_cmds.rename_boss,
-            "setup rename game": self._setup_cmds.rename_game,
-            "setup delete boss": self._setup_cmds.delete_boss,
-            "setup delete game": self._setup_cmds.delete_game,
-            "setup import preset": self._setup_cmds.import_preset,
-            "stats": self._stats_cmds.info,
-            "stats list bosses": self._bind_method_params(self._stats_cmds.list_bosses_by, "id", "asc"),
-            "stats list bosses -s deaths -o desc": self._bind_method_params(self._stats_cmds.list_bosses_by, "deaths", "desc"),
-            "stats list bosses -s deaths -o asc": self._bind_method_params(self._stats_cmds.list_bosses_by, "deaths", "asc"),
-            "stats list bosses -s time -o desc": self._bind_method_params(self._stats_cmds.list_bosses_by, "requiredTime", "desc"),
-            "stats list bosses -s time -o asc": self._bind_method_params(self._stats_cmds.list_bosses_by, "requiredTime", "asc"),
-            "stats list bosses -a": self._bind_method_params(self._stats_cmds.list_all_bosses_by, "id", "asc"),
-            "stats list bosses -a -s deaths -o desc": self._bind_method_params(self._stats_cmds.list_all_bosses_by, "deaths", "desc"),
-            "stats list bosses -a -s deaths -o asc": self._bind_method_params(self._stats_cmds.list_all_bosses_by, "deaths", "asc"),
-            "stats list bosses -a -s time -o desc": self._bind_method_params(self._stats_cmds.list_all_bosses_by, "requiredTime", "desc"),
-            "stats list bosses -a -s time -o asc": self._bind_method_params(self._stats_cmds.list_all_bosses_by, "requiredTime", "asc"),
-            "stats list games": self._bind_method_params(self._stats_cmds.list_games_by, "gameId", "asc"),
-            "stats list games -s deaths -o desc": self._bind_method_params(self._stats_cmds.list_games_by, "deaths", "desc"),
-            "stats list games -s deaths -o asc": self._bind_method_params(self._stats_cmds.list_games_by, "deaths", "asc"),
-            "stats list games -s time -o desc": self._bind_method_params(self._stats_cmds.list_games_by, "requiredTime", "desc"),
-            "stats list games -s time -o asc": self._bind_method_params(self._stats_cmds.list_games_by, "requiredTime", "asc"),
-            "stats save": self._stats_cmds.save,
-            "stats export": self._bind_method_params(self._stats_cmds.export_by, "id", "asc"),
-            "keybinds": self._keybind_cmds.info,
-            "keybinds list": self._keybind_cmds.list,
-            f"keybinds config {HotkeyNames.COUNTER_INC.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.COUNTER_INC),
-            f"keybinds config {HotkeyNames.COUNTER_DEC.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.COUNTER_DEC),
-            f"keybinds config {HotkeyNames.COUNTER_RESET.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.COUNTER_RESET),
-            f"keybinds config {HotkeyNames.TIMER_START.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.TIMER_START),
-            f"keybinds config {HotkeyNames.TIMER_PAUSE.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.TIMER_PAUSE),
-            f"keybinds config {HotkeyNames.TIMER_STOP.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.TIMER_STOP),
-            f"keybinds config {HotkeyNames.TIMER_RESET.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.TIMER_RESET),
-            f"keybinds config {HotkeyNames.LISTENER_END.value}": self._bind_method_params(self._keybind_cmds.config, HotkeyNames.LISTENER_END),
-            "settings": self._settings_cmds.info,
-            "settings lock overlay": self._bind_method_params(self._settings_cmds.set_overlay_locked, True),
-            "settings unlock overlay": self._bind_method_params(self._settings_cmds.set_overlay_locked, False),
-            "settings import theme": self._settings_cmds.import_theme,
-            "settings preview theme": self._settings_cmds.preview_theme,
+            "tracking": self._bind_category_method("tracking", "info"),
+            "tracking new": self._bind_category_method("tracking", "new"),
+            "tracking continue": self._bind_category_method("tracking", "carry_on"),
+            "tracking bank": self._bind_category_method("tracking", "bank"),
+            "setup": self._bind_category_method("setup", "info"),
+            "setup add": self._bind_category_method("setup", "add"),
+            "setup identify boss": self._bind_category_method("setup", "identify_boss"),
+            "setup move boss": self._bind_category_method("setup", "move_boss"),
+            "setup rename boss": self._bind_category_method("setup", "rename_boss"),
+            "setup rename game": self._bind_category_method("setup", "rename_game"),
+            "setup delete boss": self._bind_category_method("setup", "delete_boss"),
+            "setup delete game": self._bind_category_method("setup", "delete_game"),
+            "setup import preset": self._bind_category_method("setup", "import_preset"),
+            "stats": self._bind_category_method("stats", "info"),
+            "stats list bosses": self._bind_category_method("stats", "list_bosses_by", "id", "asc"),
+            "stats list bosses -s deaths -o desc": self._bind_category_method("stats", "list_bosses_by", "deaths", "desc"),
+            "stats list bosses -s deaths -o asc": self._bind_category_method("stats", "list_bosses_by", "deaths", "asc"),
+            "stats list bosses -s time -o desc": self._bind_category_method("stats", "list_bosses_by", "requiredTime", "desc"),
+            "stats list bosses -s time -o asc": self._bind_category_method("stats", "list_bosses_by", "requiredTime", "asc"),
+            "stats list bosses -a": self._bind_category_method("stats", "list_all_bosses_by", "id", "asc"),
+            "stats list bosses -a -s deaths -o desc": self._bind_category_method("stats", "list_all_bosses_by", "deaths", "desc"),
+            "stats list bosses -a -s deaths -o asc": self._bind_category_method("stats", "list_all_bosses_by", "deaths", "asc"),
+            "stats list bosses -a -s time -o desc": self._bind_category_method("stats", "list_all_bosses_by", "requiredTime", "desc"),
+            "stats list bosses -a -s time -o asc": self._bind_category_method("stats", "list_all_bosses_by", "requiredTime", "asc"),
+            "stats list games": self._bind_category_method("stats", "list_games_by", "gameId", "asc"),
+            "stats list games -s deaths -o desc": self._bind_category_method("stats", "list_games_by", "deaths", "desc"),
+            "stats list games -s deaths -o asc": self._bind_category_method("stats", "list_games_by", "deaths", "asc"),
+            "stats list games -s time -o desc": self._bind_category_method("stats", "list_games_by", "requiredTime", "desc"),
+            "stats list games -s time -o asc": self._bind_category_method("stats", "list_games_by", "requiredTime", "asc"),
+            "stats list segments": self._bind_category_method("stats", "list_segments"),
+            "stats save": self._bind_category_method("stats", "save"),
+            "stats export": self._bind_category_method("stats", "export_by", "id", "asc"),
+            "keybinds": self._bind_category_method("keybinds", "info"),
+            "keybinds list": self._bind_category_method("keybinds", "list"),
+            f"keybinds config {HotkeyNames.COUNTER_INC.value}": self._bind_category_method("keybinds", "config", HotkeyNames.COUNTER_INC),
+            f"keybinds config {HotkeyNames.COUNTER_DEC.value}": self._bind_category_method("keybinds", "config", HotkeyNames.COUNTER_DEC),
+            f"keybinds config {HotkeyNames.COUNTER_RESET.value}": self._bind_category_method("keybinds", "config", HotkeyNames.COUNTER_RESET),
+            f"keybinds config {HotkeyNames.TIMER_START.value}": self._bind_category_method("keybinds", "config", HotkeyNames.TIMER_START),
+            f"keybinds config {HotkeyNames.TIMER_PAUSE.value}": self._bind_category_method("keybinds", "config", HotkeyNames.TIMER_PAUSE),
+            f"keybinds config {HotkeyNames.TIMER_STOP.value}": self._bind_category_method("keybinds", "config", HotkeyNames.TIMER_STOP),
+            f"keybinds config {HotkeyNames.TIMER_RESET.value}": self._bind_category_method("keybinds", "config", HotkeyNames.TIMER_RESET),
+            f"keybinds config {HotkeyNames.TIMER_SPLIT.value}": self._bind_category_method("keybinds", "config", HotkeyNames.TIMER_SPLIT),
+            f"keybinds config {HotkeyNames.SLOT_NEXT.value}": self._bind_category_method("keybinds", "config", HotkeyNames.SLOT_NEXT),
+            f"keybinds config {HotkeyNames.SLOT_PREVIOUS.value}": self._bind_category_method("keybinds", "config", HotkeyNames.SLOT_PREVIOUS),
+            f"keybinds config {HotkeyNames.LISTENER_END.value}": self._bind_category_method("keybinds", "config", HotkeyNames.LISTENER_END),
+            "settings": self._bind_category_method("settings", "info"),
+            "settings lock overlay": self._bind_category_method("settings", "set_overlay_locked", True),
+            "settings unlock overlay": self._bind_category_method("settings", "set_overlay_locked", False),
+            "settings import theme": self._bind_category_method("settings", "import_theme"),
+            "settings preview theme": self._bind_category_method("settings", "preview_theme"),
+            f"settings timer precision {TimerPrecision.SECONDS.value}": self._bind_category_method("settings", "set_timer_precision", TimerPrecision.SECONDS),
+            f"settings timer precision {TimerPrecision.TENTHS.value}": self._bind_category_method("settings", "set_timer_precision", TimerPrecision.TENTHS),
+            f"settings timer precision {TimerPrecision.HUNDREDTHS.value}": self._bind_category_method("settings", "set_timer_precision", TimerPrecision.HUNDREDTHS),
+            "debug": self._bind_category_method("debug", "info"),
+            "debug latency": self._bind_category_method("debug", "latency"),
+            "debug latency reset": self._bind_category_method("debug", "reset_latency"),
+            "debug hotkeys": self._bind_category_method("debug", "hotkeys"),
+            "debug events": self._bind_category_method("debug", "events"),
             "quit": self.quit
         }
         self._cancel_commands: dict = {"cancel": self._cancel}
@@ -80,36 +96,86 @@ class CommandManager:
         self._list_of_commands: List[str] = list(self._commands.keys()) # const that is only changed when cancel commands are added/deleted from _commands
     
     
-    def _setup_core_instances(self) -> None:
-        self._hk_manager: HotkeyManager = HotkeyManager()
-        self._counter: Counter = Counter(self._overlay)
-        self._timer: Timer = Timer(self._overlay)
-        self._key_listener: KeyListener = KeyListener(
-            hk_manager=self._hk_manager,
-            counter=self._counter,
-            timer=self._timer,
-            overlay=self._overlay
-        )
-        self._save_file: SaveFile = SaveFile()
+    _COMMAND_CATEGORIES: dict = {
+        "tracking": TrackingCommands,
+        "setup": SetupCommands,
+        "stats": StatsCommands,
+        "keybinds": KeybindCommands,
+        "settings": SettingsCommands,
+        "debug": DebugCommands
+    }
+    _HOTKEY_CATEGORIES: Tuple[str, ...] = ("tracking", "keybinds", "debug") # the only categories that use the hotkeys or the key listener
+    
+    
+    def _setup_lazy_instance_vars(self) -> None:
+        self._core_instances: dict | None = None
+        self._category_instances: Dict[str, BaseCommand] = {}
     
     
-    def _setup_command_instances(self) -> None:
-        core_instances: dict = {
+    def _setup_core_instances(self) -> None:
+        journal: SessionJournal = SessionJournal()
+        segments: SegmentTable = SegmentTable()
+        metrics: SessionMetrics = SessionMetrics(self._overlay)
+        counter: Counter = Counter(self._overlay, journal, metrics)
+        timer: Timer = Timer(self._overlay, self._window_manager.get_timer_precision(), journal=journal, segments=segments, metrics=metrics)
+        metrics.set_sources(counter.get_count, timer.get_time_state)
+        counter_bank: CounterBank = CounterBank(self._overlay, counter, timer, journal, segments)
+        
+        self._core_instances = {
             "overlay": self._overlay,
             "theme_manager": self._theme_manager,
             "window_manager": self._window_manager,
-            "hk_manager": self._hk_manager,
-            "counter": self._counter,
-            "timer": self._timer,
-            "key_listener": self._key_listener,
-            "save_file": self._save_file
+            "counter": counter,
+            "timer": timer,
+            "save_file": SaveFile(),
+            "journal": journal,
+            "segments": segments,
+            "counter_bank": counter_bank
         }
+        self._recover_session(journal, counter, timer, counter_bank)
+    
+    
+    def _setup_hotkey_instances(self) -> None:
+        hk_manager: HotkeyManager = HotkeyManager()
         
-        self._tracking_cmds: TrackingCommands = TrackingCommands(core_instances)
-        self._setup_cmds: SetupCommands = SetupCommands(core_instances)
-        self._stats_cmds: StatsCommands = StatsCommands(core_instances)
-        self._keybind_cmds: KeybindCommands = KeybindCommands(core_instances)
-        self._settings_cmds: SettingsCommands = SettingsCommands(core_instances)
+        self._core_instances["hk_manager"] = hk_manager
+        self._core_instances["key_listener"] = KeyListener(
+            hk_manager=hk_manager,
+            counter=self._core_instances.get("counter"),
+            timer=self._core_instances.get("timer"),
+            overlay=self._overlay,
+            counter_bank=self._core_instances.get("counter_bank")
+        )
+    
+    
+    def _recover_session(self, journal: SessionJournal, counter: Counter, timer: Timer, counter_bank: CounterBank) -> None:
+        session: dict | None = journal.replay()
+        
+        if session is None:
+            return
+        
+        if "bosses" in session:
+            recovered_bosses: int = counter_bank.restore(session) # 'stats save' then saves every recovered boss of the bank
+            self._msg_provider.invoke(
+                f"The last counter bank session of the game \"{session.get("game")}\" was not saved and has been recovered ({recovered_bosses} tracked boss(es)). "
+                "Make sure to save the data using the 'stats save' command", "warning"
+            )
+            return
+        
+        deaths: int | None = session.get("count") if session.get("count") is not None else session.get("deaths")
+        required_time: int | None = session.get("time")
+        
+        if session.get("elapsed_ns") is not None:
+            required_time = (required_time or 0) + session.get("elapsed_ns") // 1_000_000_000
+        
+        counter.restore_count(deaths)
+        timer.restore_time(required_time)
+        
+        boss_meta: str = f" of the boss \"{session.get("boss")}\" ({session.get("game")})" if session.get("boss") is not None else ""
+        self._msg_provider.invoke(
+            f"The last tracking session{boss_meta} was not saved and has been recovered (deaths: {deaths if deaths is not None else "N/A"}, time: {required_time if required_time is not None else "N/A"}s). "
+            "Make sure to save the data using the 'stats save' command", "warning"
+        )
     
     
     def _setup_input_vars(self) -> None:
@@ -118,17 +184,47 @@ class CommandManager:
         self._active_category: BaseInterceptCommand | None = None
     
     
-    @staticmethod
-    def _bind_method_params(target_method: Callable[..., bool | None], *params: Any) -> partial:
-        partial_method = partial(target_method, *params)
-        partial_method.__self__ = target_method.__self__
+    def _bind_category_method(self, category: str, method_name: str, *params: Any) -> partial:
+        partial_method = partial(self._execute_category_method, category, method_name, *params)
+        partial_method.category = category
         return partial_method
     
     
+    def _execute_category_method(self, category: str, method_name: str, *params: Any) -> bool | None:
+        return getattr(self._get_category(category), method_name)(*params)
+    
+    
+    def _get_category(self, category: str) -> BaseCommand:
+        if category not in self._category_instances:
+            if self._core_instances is None:
+                self._setup_core_instances()
+            if category in CommandManager._HOTKEY_CATEGORIES and "key_listener" not in self._core_instances:
+                self._setup_hotkey_instances()
+            self._category_instances[category] = CommandManager._COMMAND_CATEGORIES.get(category)(self._core_instances)
+        return self._category_instances[category]
+    
+    
+    def warm_up(self) -> None:
+        for category in CommandManager._COMMAND_CATEGORIES:
+            self._get_category(category)
+    
+    
+    def install_key_listener(self) -> None:
+        if self._core_instances is None:
+            self._setup_core_instances()
+        if "key_listener" not in self._core_instances:
+            self._setup_hotkey_instances()
+        self._core_instances.get("key_listener").install()
+    
+    
     def get_list_of_commands(self) -> List[str]:
         return self._list_of_commands
     
     
+    def get_is_intercepting(self) -> bool:
+        return self._intercept_next_input
+    
+    
     def process_input(self, console_input: str) -> None:
         if not console_input:
             return
@@ -174,7 +270,7 @@ class CommandManager:
         
         if isInterceptMethod:
             self._intercept_next_input = True
-            self._active_category = command_method.__self__
+            self._active_category = self._get_category(command_method.category)
             self._activate_cancel_commands()
     
     
@@ -200,12 +296,16 @@ class CommandManager:
             "stats: Lists all stats actions\n"
             "keybinds: Lists all keybind actions\n"
             "settings: Lists all settings actions\n"
+            "debug: Lists all debug actions\n"
             "quit: Quits the application", "list"
         )
     
     
     def quit(self) -> None:
-        self._save_file.close_connection()
+        if self._core_instances is not None:
+            if "key_listener" in self._core_instances:
+                self._core_instances.get("key_listener").uninstall()
+            self._core_instances.get("save_file").close_connection()
         self._console.quit()
     
     
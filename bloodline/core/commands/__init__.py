@@ -1,4 +1,5 @@
-from .base_command import BaseInterceptCommand
+from .base_command import BaseCommand, BaseInterceptCommand
+from .debug_commands import DebugCommands
 from .keybind_commands import KeybindCommands
 from .settings_commands import SettingsCommands
 from .setup_commands import SetupCommands
@@ -2,9 +2,12 @@ from re import compile, fullmatch, Match, IGNORECASE
 from typing import List
 
 from ..counter import Counter
+from ..counter_bank import CounterBank
 from ..hotkey_manager import HotkeyManager
 from ..key_listener import KeyListener
 from ..save_file import SaveFile
+from ..segment_table import SegmentTable
+from ..session_journal import SessionJournal
 from ..timer import Timer
 from infrastructure import MessageHub
 from infrastructure.interfaces import IOverlay, IThemeManager, IWindowManager
@@ -20,6 +23,9 @@ class BaseCommand:
         self._timer: Timer = instances.get("timer")
         self._key_listener: KeyListener = instances.get("key_listener")
         self._save_file: SaveFile = instances.get("save_file")
+        self._journal: SessionJournal = instances.get("journal")
+        self._segments: SegmentTable = instances.get("segments")
+        self._counter_bank: CounterBank = instances.get("counter_bank")
         
         self._msg_provider: MessageHub = MessageHub()
 
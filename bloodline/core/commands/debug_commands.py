@@ -0,0 +1,82 @@
+from typing import Dict, List, Tuple
+
+from .base_command import BaseCommand
+from infrastructure import EventBus, LatencyMonitor, Subscription
+
+class DebugCommands(BaseCommand):
+    
+    def __init__(self, instances: dict):
+        super().__init__(instances)
+    
+    
+    def info(self) -> None:
+        self._msg_provider.invoke("This is a list of all debug commands:", "normal")
+        self._msg_provider.invoke(
+            "'debug latency': Lists the hotkey to overlay latency of each action since the key press\n"
+            "'debug latency reset': Clears the recorded latencies\n"
+            "'debug hotkeys': Lists the key presses that were suppressed as auto-repeats or bounces\n"
+            "'debug events': Lists the subscribers of the event bus with their queued and dropped events", "list"
+        )
+    
+    
+    def latency(self) -> None:
+        report: Dict[str, List[Tuple[str, int, int, int, int]]] = LatencyMonitor.get_report()
+        
+        if not report:
+            self._msg_provider.invoke("No hotkey was pressed in this session yet", "note")
+            return
+        
+        self._msg_provider.invoke("This is the latency of each stage since the key press (p50 | p99 | max):", "normal")
+        
+        for action, stages in report.items():
+            self._msg_provider.invoke(
+                "\n".join(
+                    f"{action} {stage} ({count}x): {DebugCommands._format_ms(p50)} | {DebugCommands._format_ms(p99)} | {DebugCommands._format_ms(max_value)}"
+                    for stage, count, p50, p99, max_value in stages
+                ), "list"
+            )
+    
+    
+    def hotkeys(self) -> None:
+        suppressed_counts: Dict[str, Dict[str, int]] = self._key_listener.get_suppressed_counts()
+        
+        if not suppressed_counts:
+            self._msg_provider.invoke("No key press was suppressed in this session yet", "note")
+            return
+        
+        self._msg_provider.invoke("This is the number of suppressed key presses of each action:", "normal")
+        self._msg_provider.invoke(
+            "\n".join(
+                f"{hotkey}: {", ".join(f"{count}x {reason}" for reason, count in counts.items())}"
+                for hotkey, counts in suppressed_counts.items()
+            ), "list"
+        )
+    
+    
+    def events(self) -> None:
+        subscriptions: List[Subscription] = EventBus.get_subscriptions()
+        
+        if not subscriptions:
+            self._msg_provider.invoke("There are no subscribers of the event bus", "note")
+            return
+        
+        self._msg_provider.invoke("This is a list of all subscribers of the event bus (queued | dropped events):", "normal")
+        self._msg_provider.invoke(
+            "\n".join(
+                f"{subscription.get_name()} ({", ".join(topic.value for topic in subscription.get_topics())}): "
+                f"{subscription.get_queued_events()} | {subscription.get_dropped_events()}"
+                for subscription in subscriptions
+            ), "list"
+        )
+    
+    
+    def reset_latency(self) -> None:
+        LatencyMonitor.reset()
+        self._msg_provider.invoke("The recorded latencies have been cleared", "normal")
+    
+    
+    # helper methods below
+    
+    @staticmethod
+    def _format_ms(value_ns: int) -> str:
+        return f"{value_ns / 1_000_000:.2f} ms"
\ No newline at end of file
@@ -15,8 +15,9 @@ class SettingsCommands(BaseInterceptCommand):
         self._msg_provider.invoke("This is a list of all settings commands:", "normal")
         self._msg_provider.invoke(
             "'settings unlock|lock overlay': Enables|Disables the ability to move the overlay\n"
-            "'settings import theme': Imports and changes the programs theme"
-            "'settings preview theme': Displays the current color theme", "list"
+            "'settings import theme': Imports and changes the programs theme\n"
+            "'settings preview theme': Displays the current color theme\n"
+            "'settings timer precision seconds|tenths|hundredths': Changes the precision of the overlay timer", "list"
         )
     
     
@@ -28,6 +29,14 @@ class SettingsCommands(BaseInterceptCommand):
         self._overlay.display_lock_animation(1500, lock_state)
     
     
+    def set_timer_precision(self, precision: str) -> None:
+        if not self._window_manager.set_timer_precision(precision):
+            self._msg_provider.invoke(f"The timer precision is already set to {precision.value}", "invalid")
+            return
+        self._timer.set_precision(precision)
+        self._msg_provider.invoke(f"The timer precision has been set to {precision.value}", "normal")
+    
+    
     def import_theme(self) -> bool:
         if self._current_step == 0:
             self._msg_provider.invoke("Please enter the <\"file path\"> of the theme file you want to import <...>", "normal")
@@ -42,12 +51,14 @@ class SettingsCommands(BaseInterceptCommand):
         if not ExternalJsonHandler.check_external_file_props(src_file_path):
             return False
         
-        loaded_theme: dict | None = ExternalJsonHandler.load_and_validate_data(src_file_path, ThemeModel)
-        raw_loaded_theme: dict | None = ExternalJsonHandler.load_and_validate_data(src_file_path, ThemeModel, strict_load=True, silent=True)
+        validated_theme: ThemeModel | None = ExternalJsonHandler.load_and_validate_model(src_file_path, ThemeModel)
         
-        if loaded_theme is None or raw_loaded_theme is None:
+        if validated_theme is None:
             return False
         
+        # the file is only validated once, both views are dumped from the same model
+        loaded_theme: dict = validated_theme.model_dump()
+        raw_loaded_theme: dict = validated_theme.model_dump(exclude_unset=True)
         curr_theme: dict = self._theme_manager.get_theme()
         
         if not raw_loaded_theme:
@@ -59,7 +70,7 @@ class SettingsCommands(BaseInterceptCommand):
             return False
         
         self._theme_manager.set_theme(loaded_theme)
-        self._msg_provider.invoke("The imported theme was applied. Make sure to restart the program for the changes to display", "success")
+        self._msg_provider.invoke("The imported theme was applied", "success")
         return False
     
     
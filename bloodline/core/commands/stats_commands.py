@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import List, Callable
 
 from .base_command import BaseInterceptCommand
+from ..segment_table import SegmentTable
 from file_io import CsvFileOperations
 from infrastructure import Directory
 
@@ -20,6 +21,7 @@ class StatsCommands(BaseInterceptCommand):
         self._msg_provider.invoke(
             "'stats list bosses [-a] [-s deaths|time -o desc|asc]': Lists bosses by the selected filters. By default all bosses will be listed in the order they were added\n"
             "'stats list games [-s deaths|time -o desc|asc]': Lists all games by the selected filters. By default the games will be listed in the order they were added\n"
+            "'stats list segments': Lists the best and average duration of each segment of a boss\n"
             "'stats save': Saves the tracking values to the selected boss in the save file\n"
             "'stats export': Exports all bosses with their corresponding values from the selected game to a .csv file", "list"
         )
@@ -111,8 +113,42 @@ class StatsCommands(BaseInterceptCommand):
         self._msg_provider.invoke(self._get_total_summary_block(all_games_avg, all_games_sum), "list")
     
     
+    def list_segments(self) -> bool:
+        if self._current_step == 0:
+            self._msg_provider.invoke("Please enter the <\"boss name\", \"game title\"> of the boss you want the segments listed from <...>", "normal")
+            return True
+        
+        pattern_result: List[str] = self._get_input_pattern_result("double")
+        
+        if not pattern_result:
+            return False
+        
+        boss_name: str = pattern_result[0]
+        game_title: str = pattern_result[1]
+        
+        if not self._save_file.get_boss_exists(boss_name, game_title):
+            self._msg_provider.invoke(f"There is no boss \"{boss_name}\" of the game \"{game_title}\" in the save file so far", "invalid")
+            return False
+        
+        list_of_segments: List[tuple] = self._save_file.get_boss_segments(boss_name, game_title)
+        
+        if not list_of_segments:
+            self._msg_provider.invoke(f"There are no segments saved for the boss \"{boss_name}\" so far", "invalid")
+            return False
+        
+        for segment_index, best_duration, duration_sum, duration_count in list_of_segments:
+            self._msg_provider.invoke(
+                f"Segment {segment_index + 1}  best {SegmentTable.format_duration(best_duration)}  "
+                f"avg {SegmentTable.format_duration(round(duration_sum / duration_count))}  ({duration_count}x)", "list"
+            )
+        return False
+    
+    
     def save(self) -> bool:
-        if self._counter.get_is_none() and self._timer.get_is_none():
+        if self._counter_bank.get_is_loaded():
+            return self._save_counter_bank() # the bosses of the bank are already known
+        
+        if self._counter.get_is_none() and self._timer.get_end_time() is None: # a recovered session only has the time already required
             self._msg_provider.invoke("There are no values to be saved. Make sure to start a tracking session and try saving again afterwards", "invalid")
             return False
         
@@ -135,11 +171,13 @@ class StatsCommands(BaseInterceptCommand):
             boss_name=pattern_result[0],
             game_title=pattern_result[1],
             deaths=self._counter.get_count(),
-            required_time=self._timer.get_end_time()
+            required_time=self._timer.get_end_time(),
+            segments=self._segments.get_pending_segments()
         )
         if update_successful:
             self._counter.reset(hard_reset=True)
             self._timer.reset(hard_reset=True)
+            self._journal.clear()
         return False
     
     
@@ -160,6 +198,7 @@ class StatsCommands(BaseInterceptCommand):
             return False
         
         file_name: str = f"{game_title.lower().replace(" ", "_")}.csv"
+        Directory.create_export_dir()
         dst_file_path: Path = Directory.get_export_path() / file_name
         headers: List[str] = [header[0] for header in self._save_file.get_boss_table_description()]
         
@@ -228,6 +267,21 @@ class StatsCommands(BaseInterceptCommand):
     
     # helper methods below
     
+    def _save_counter_bank(self) -> bool:
+        changed_bosses: List[tuple] = self._counter_bank.get_changed_bosses()
+        
+        if not changed_bosses:
+            self._msg_provider.invoke("There are no values to be saved. None of the bosses in the counter bank were tracked", "invalid")
+            return False
+        
+        if self._save_file.update_bosses(changed_bosses, self._counter_bank.get_pending_segments()):
+            self._counter.reset(hard_reset=True)
+            self._timer.reset(hard_reset=True)
+            self._counter_bank.clear()
+            self._journal.clear()
+        return False
+    
+    
     def _process_count_value(self) -> bool | None:
         if not self._counter.get_is_none() or self._counter.get_question_answered():
             return False
@@ -12,15 +12,19 @@ class TrackingCommands(BaseInterceptCommand):
         self._msg_provider.invoke("This is a list of all tracking commands:", "normal")
         self._msg_provider.invoke(
             "'tracking new': Starts a new global tracking session\n"
-            "'tracking continue': Continues an existing global tracking session", "list"
+            "'tracking continue': Continues an existing global tracking session\n"
+            "'tracking bank': Starts a tracking session for all bosses of a game, which can be switched between using hotkeys", "list"
         )
     
     
     def new(self) -> None:
+        self._counter_bank.clear()
         self._save_file.add_unknown()
         self._overlay.create_instance()
         self._counter.set_count_already_required(None)
         self._timer.set_time_already_required(None)
+        self._segments.reset()
+        self._journal.start_session(None, None, None, None)
         self._key_listener.start_key_listener()
     
     
@@ -42,8 +46,40 @@ class TrackingCommands(BaseInterceptCommand):
             self._msg_provider.invoke(f"There is no boss \"{boss_name}\" of the game \"{game_title}\" in the save file so far", "invalid")
             return False
         
+        self._counter_bank.clear()
+        deaths: int | None = self._save_file.get_boss_deaths(boss_name, game_title)
+        required_time: int | None = self._save_file.get_boss_time(boss_name, game_title)
+        
+        self._overlay.create_instance()
+        self._counter.set_count_already_required(deaths)
+        self._timer.set_time_already_required(required_time)
+        self._segments.load(self._save_file.get_boss_segments(boss_name, game_title)) # the splits are compared to the saved segments of the boss
+        self._journal.start_session(boss_name, game_title, deaths, required_time)
+        self._key_listener.start_key_listener()
+        return False
+    
+    
+    def bank(self) -> bool:
+        if self._current_step == 0:
+            self._msg_provider.invoke("Please enter the <\"game title\"> whose bosses you want to track <...>", "normal")
+            return True
+        
+        pattern_result: List[str] = self._get_input_pattern_result("single")
+        
+        if not pattern_result:
+            return False
+        
+        game_title: str = pattern_result[0]
+        list_of_bosses: List[tuple] = self._save_file.get_bank_bosses(game_title) # all slots are loaded with a single query
+        
+        if not list_of_bosses:
+            self._msg_provider.invoke(f"There are no bosses linked to the game \"{game_title}\" so far", "invalid")
+            return False
+        
+        self._counter_bank.load(game_title, list_of_bosses, self._save_file.get_bank_segments(game_title))
+        self._segments.reset()
+        
         self._overlay.create_instance()
-        self._counter.set_count_already_required(self._save_file.get_boss_deaths(boss_name, game_title))
-        self._timer.set_time_already_required(self._save_file.get_boss_time(boss_name, game_title))
+        self._counter_bank.activate() # also starts the journal of the bank
         self._key_listener.start_key_listener()
         return False
\ No newline at end of file
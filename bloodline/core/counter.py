@@ -1,10 +1,14 @@
-from infrastructure import MessageHub
+from .session_journal import SessionJournal
+from .session_metrics import SessionMetrics
+from infrastructure import CounterChanged, EventBus, LatencyMonitor, MessageHub, Topic
 from infrastructure.interfaces import IOverlay
 
 class Counter:
     
-    def __init__(self, overlay: IOverlay):
+    def __init__(self, overlay: IOverlay, journal: SessionJournal | None = None, metrics: SessionMetrics | None = None):
         self._overlay: IOverlay = overlay
+        self._journal: SessionJournal | None = journal
+        self._metrics: SessionMetrics | None = metrics
         
         self._msg_provider: MessageHub = MessageHub()
         self._counter: int | None = None
@@ -17,13 +21,29 @@ class Counter:
             self._overlay.update_counter_label(self._counter)
     
     
+    def swap_count(self, count: int | None) -> None:
+        self._counter = count
+        self._publish("counter_swap")
+        self._overlay.update_counter_label(self._counter if self._counter is not None else 0)
+    
+    
+    def restore_count(self, count: int | None) -> None:
+        self._counter = count # the overlay is updated once a session continues
+    
+    
     def increase(self) -> None:
         if self._counter is None:
             self._counter = 0
         
         self._counter += 1
+        LatencyMonitor.mark("state")
+        self._record("counter_inc")
+        self._publish("counter_inc")
         self._msg_provider.invoke(f"The counter was increased: {self.get_count()}", "counter", "counter_inc")
         self._overlay.update_counter_label(self._counter)
+        
+        if self._metrics is not None:
+            self._metrics.count_death()
     
     
     def decrease(self) -> None:
@@ -32,8 +52,14 @@ class Counter:
         
         if self._counter > 0:
             self._counter -= 1
+            LatencyMonitor.mark("state")
+            self._record("counter_dec")
+            self._publish("counter_dec")
             self._msg_provider.invoke(f"The counter was decreased: {self.get_count()}", "counter", "counter_dec")
             self._overlay.update_counter_label(self._counter)
+            
+            if self._metrics is not None:
+                self._metrics.uncount_death()
     
     
     def reset(self, hard_reset: bool = False) -> None:
@@ -42,8 +68,14 @@ class Counter:
             self._question_answered = False
         elif self._counter > 0:
             self._counter = 0
+            LatencyMonitor.mark("state")
+            self._record("counter_reset")
+            self._publish("counter_reset")
             self._msg_provider.invoke("The counter has been reset", "normal")
             self._overlay.update_counter_label(self._counter)
+            
+            if self._metrics is not None:
+                self._metrics.restart()
     
     
     def get_count(self) -> int | None:
@@ -63,4 +95,16 @@ class Counter:
     
     
     def get_is_none(self) -> bool:
-        return self._counter is None
\ No newline at end of file
+        return self._counter is None
+    
+    
+    # helper methods below
+    
+    def _record(self, event: str) -> None:
+        if self._journal is not None:
+            self._journal.record(event, count=self._counter)
+    
+    
+    def _publish(self, action: str) -> None:
+        if EventBus.get_has_subscribers(Topic.COUNTER_CHANGED): # no event is built while nothing listens
+            EventBus.publish(Topic.COUNTER_CHANGED, CounterChanged(self._counter, action))
\ No newline at end of file
@@ -0,0 +1,182 @@
+from typing import Dict, List, Set, Tuple
+
+from .counter import Counter
+from .segment_table import SegmentTable
+from .session_journal import SessionJournal
+from .timer import Timer
+from infrastructure import LatencyMonitor, MessageHub
+from infrastructure.interfaces import IOverlay
+
+class CounterBank:
+    
+    def __init__(self, overlay: IOverlay, counter: Counter, timer: Timer, journal: SessionJournal | None = None, segments: SegmentTable | None = None):
+        self._overlay: IOverlay = overlay
+        self._counter: Counter = counter
+        self._timer: Timer = timer
+        self._journal: SessionJournal | None = journal
+        self._segments: SegmentTable | None = segments # the table of a single boss session, handed back to the timer once the bank is cleared
+        
+        self._msg_provider: MessageHub = MessageHub()
+        self._game_title: str | None = None
+        self._active_slot: int = 0
+        
+        # the slots are kept in parallel lists, so switching is an index lookup instead of a db query
+        self._boss_ids: List[int] = []
+        self._boss_names: List[str] = []
+        self._counts: List[int | None] = []
+        self._times: List[int | None] = [] # time already required in s
+        self._live_times: List[int] = [] # time tracked in this session in ns
+        self._segment_tables: List[SegmentTable] = [] # every boss compares its splits to its own segments
+        self._changed_slots: Set[int] = set()
+    
+    
+    _NS_PER_SECOND: int = 1_000_000_000
+    
+    
+    def load(self, game_title: str, list_of_bosses: List[tuple], list_of_segments: List[tuple] = ()) -> None:
+        self.clear()
+        self._game_title = game_title
+        segment_stats: Dict[int, List[tuple]] = {}
+        
+        # (boss id, segment index, best duration, sum of durations, number of durations) of all bosses of the game
+        for boss_id, *segment_values in list_of_segments:
+            segment_stats.setdefault(boss_id, []).append(tuple(segment_values))
+        
+        for boss_id, boss_name, deaths, required_time in list_of_bosses:
+            segment_table: SegmentTable = SegmentTable()
+            segment_table.load(segment_stats.get(boss_id, []))
+            
+            self._boss_ids.append(boss_id)
+            self._boss_names.append(boss_name)
+            self._counts.append(deaths)
+            self._times.append(required_time)
+            self._live_times.append(0)
+            self._segment_tables.append(segment_table)
+    
+    
+    def activate(self) -> None:
+        if self._journal is not None:
+            self._journal.start_bank(self._game_title, list(zip(self._boss_ids, self._boss_names, self._counts, self._times)))
+        
+        self._active_slot = 0
+        self._swap_slot()
+        self._update_slot_label()
+    
+    
+    def restore(self, session: dict) -> int:
+        self.load(session.get("game"), [tuple(boss) for boss in session.get("bosses")])
+        
+        # the time of a recovered slot is folded into its required time, as the timer of the new process starts at zero
+        for slot, values in session.get("slots").items():
+            if slot >= len(self._boss_ids):
+                continue
+            
+            if values.get("count") is not None:
+                self._counts[slot] = values.get("count")
+            if values.get("elapsed_ns"):
+                self._times[slot] = (self._times[slot] or 0) + values.get("elapsed_ns") // CounterBank._NS_PER_SECOND
+            self._changed_slots.add(slot)
+        
+        self._active_slot = min(session.get("active_slot"), len(self._boss_ids) - 1)
+        self._counter.restore_count(self._counts[self._active_slot])
+        self._timer.restore_time(self._times[self._active_slot])
+        return len(self._changed_slots)
+    
+    
+    def select_next(self) -> None:
+        self._select(self._active_slot + 1)
+    
+    
+    def select_previous(self) -> None:
+        self._select(self._active_slot - 1)
+    
+    
+    def get_is_loaded(self) -> bool:
+        return bool(self._boss_ids)
+    
+    
+    def get_changed_bosses(self) -> List[Tuple[int | None, int | None, int]]:
+        self._store_active_slot(self._counter.get_count(), *self._timer.get_time_state())
+        changed_bosses: List[Tuple[int | None, int | None, int]] = []
+        
+        # (deaths, required time, boss id) of every slot that was tracked, in the order of the update statement
+        for slot in sorted(self._changed_slots):
+            required_time: int | None = self._times[slot]
+            
+            if self._live_times[slot]:
+                required_time = (required_time or 0) + self._live_times[slot] // 1_000_000_000
+            changed_bosses.append((self._counts[slot], required_time, self._boss_ids[slot]))
+        return changed_bosses
+    
+    
+    def get_pending_segments(self) -> List[Tuple[int, int, int, int]]:
+        # (boss id, attempt, segment index, duration) of the splits of every slot
+        return [
+            (self._boss_ids[slot], *pending_segment)
+            for slot, segment_table in enumerate(self._segment_tables) for pending_segment in segment_table.get_pending_segments()
+        ]
+    
+    
+    def clear(self) -> None:
+        for slot_list in (self._boss_ids, self._boss_names, self._counts, self._times, self._live_times, self._segment_tables):
+            slot_list.clear()
+        self._changed_slots.clear()
+        self._game_title = None
+        self._active_slot = 0
+        
+        if self._segments is not None:
+            self._timer.swap_segments(self._segments)
+    
+    
+    # helper methods below
+    
+    def _select(self, slot: int) -> None:
+        if not self._boss_ids:
+            self._msg_provider.invoke("There is no counter bank loaded. Use 'tracking bank' to load the bosses of a game", "invalid")
+            return
+        
+        slot %= len(self._boss_ids) # cycles through the slots in both directions
+        
+        if slot == self._active_slot:
+            return
+        
+        previous_count: int | None = self._counter.get_count()
+        previous_time, previous_live_time = self._timer.get_time_state()
+        self._store_active_slot(previous_count, previous_time, previous_live_time)
+        
+        if self._journal is not None and self._active_slot in self._changed_slots:
+            # the final values of the left slot, the timer only journals its time periodically
+            self._journal.record("slot", slot=self._active_slot, count=previous_count, elapsed_ns=previous_live_time)
+        
+        self._active_slot = slot
+        self._swap_slot()
+        LatencyMonitor.mark("state")
+        
+        self._msg_provider.invoke(f"Switched to \"{self._boss_names[slot]}\" ({slot + 1}/{len(self._boss_ids)})", "normal")
+        self._update_slot_label()
+    
+    
+    def _store_active_slot(self, count: int | None, required_time: int | None, live_time: int) -> None:
+        slot: int = self._active_slot
+        
+        if count != self._counts[slot] or live_time != self._live_times[slot]:
+            self._changed_slots.add(slot)
+        
+        self._counts[slot] = count
+        self._times[slot] = required_time
+        self._live_times[slot] = live_time
+    
+    
+    def _swap_slot(self) -> None:
+        slot: int = self._active_slot
+        
+        self._counter.swap_count(self._counts[slot])
+        self._timer.swap_segments(self._segment_tables[slot])
+        self._timer.swap_time(self._times[slot], self._live_times[slot])
+        
+        if self._journal is not None:
+            self._journal.record("select", slot=slot) # the following counter and timer events belong to this slot
+    
+    
+    def _update_slot_label(self) -> None:
+        self._overlay.update_slot_label(f"{self._active_slot + 1}/{len(self._boss_ids)} {self._boss_names[self._active_slot]}")
\ No newline at end of file
@@ -0,0 +1,56 @@
+from queue import Empty, SimpleQueue
+from threading import Lock
+from typing import Callable, Dict, Tuple
+
+from infrastructure import LatencyMonitor
+from infrastructure.interfaces import IOverlay
+
+class HotkeyDispatcher:
+    
+    def __init__(self, overlay: IOverlay, hotkey_actions: Dict[str, Callable[[], None]]):
+        self._overlay: IOverlay = overlay
+        self._hotkey_actions: Dict[str, Callable[[], None]] = hotkey_actions
+        
+        self._events: SimpleQueue[Tuple[str, int]] = SimpleQueue()
+        self._drain_lock: Lock = Lock()
+        self._drain_scheduled: bool = False
+    
+    
+    def enqueue(self, hotkey: str, press_time_ns: int) -> None:
+        self._events.put((hotkey, press_time_ns)) # the only work done inside the os hook callback
+        
+        with self._drain_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self._overlay.add_mainloop_task(0, self.drain)
+    
+    
+    def drain(self) -> None:
+        with self._drain_lock:
+            self._drain_scheduled = False # events that arrive while draining schedule the next batch
+        
+        # the counter and timer are only changed on the mainloop, the overlay coalesces the label updates of a batch into one repaint
+        for _ in range(self._events.qsize()):
+            try:
+                hotkey, press_time_ns = self._events.get_nowait()
+            except Empty:
+                return
+            self._apply_event(hotkey, press_time_ns)
+    
+    
+    # helper methods below
+    
+    def _apply_event(self, hotkey: str, press_time_ns: int) -> None:
+        hotkey_action: Callable[[], None] | None = self._hotkey_actions.get(hotkey)
+        
+        if hotkey_action is None:
+            return # e.g. the counter bank hotkeys while no bank is available
+        
+        LatencyMonitor.begin(hotkey, press_time_ns) # the press time was stamped in the hook, so the queueing delay is included
+        LatencyMonitor.mark("queue")
+        
+        try:
+            hotkey_action()
+        finally:
+            LatencyMonitor.end()
\ No newline at end of file
@@ -1,5 +1,7 @@
 from pathlib import Path
+from typing import Callable, List
 
+from file_io import SettingsDbHandler
 from file_io.json import PersistentJsonHandler
 from infrastructure import Directory
 from schemas import HotkeyModel
@@ -7,12 +9,14 @@ from schemas import HotkeyModel
 class HotkeyManager:
     
     def __init__(self):
-        self._pers_json_handler: PersistentJsonHandler = PersistentJsonHandler(
+        self._pers_json_handler: PersistentJsonHandler = SettingsDbHandler.create(
             main_file_path=HotkeyManager._HK_FILE_PATH,
             backup_file_path=HotkeyManager._BACKUP_FILE_PATH,
-            default_data=HotkeyModel()
+            default_data=HotkeyModel(),
+            write_behind=True
         )
         self._pers_json_handler.load_data()
+        self._keybind_listeners: List[Callable[[dict], None]] = []
     
     
     _HK_FILE: str = "hotkeys.json"
@@ -26,7 +30,15 @@ class HotkeyManager:
         hotkeys[hotkey] = new_keybind
         
         self._pers_json_handler.set_data(hotkeys)
+        
+        for keybind_listener in self._keybind_listeners:
+            keybind_listener(hotkeys)
     
     
     def get_current_hotkeys(self) -> dict:
-        return self._pers_json_handler.get_data()
\ No newline at end of file
+        return self._pers_json_handler.get_data()
+    
+    
+    def add_keybind_listener(self, keybind_listener: Callable[[dict], None]) -> None:
+        self._keybind_listeners.append(keybind_listener)
+        keybind_listener(self._pers_json_handler.get_data()) # the listener starts with the current keybinds
\ No newline at end of file
@@ -1,128 +1,205 @@
-from threading import Thread
-from typing import Callable, Set
+from __future__ import annotations
 
-from pynput.keyboard import Listener, Key, KeyCode
+from enum import Enum
+from time import perf_counter_ns
+from typing import Callable, Dict, Set, TYPE_CHECKING
 
 from .counter import Counter
+from .counter_bank import CounterBank
+from .hotkey_dispatcher import HotkeyDispatcher
 from .hotkey_manager import HotkeyManager
+from .keybind_table import KeybindTable
+from .repeat_filter import RepeatFilter
 from .timer import Timer
-from infrastructure import MessageHub
+from infrastructure import LatencyMonitor, MessageHub
 from infrastructure.interfaces import IOverlay
 from schemas import HotkeyNames
 
+if TYPE_CHECKING:
+    from pynput.keyboard import Listener, Key, KeyCode
+
+class ListenerMode(str, Enum):
+    IDLE: str = "idle"
+    TRACKING: str = "tracking"
+    REBIND: str = "rebind"
+
+
 class KeyListener:
     
-    def __init__(self, hk_manager: HotkeyManager, counter: Counter, timer: Timer, overlay: IOverlay):
+    def __init__(self, hk_manager: HotkeyManager, counter: Counter, timer: Timer, overlay: IOverlay, listener_factory: Callable[..., Listener] | None = None, clock: Callable[[], int] = perf_counter_ns, counter_bank: CounterBank | None = None):
         self._hk_manager: HotkeyManager = hk_manager
         self._counter: Counter = counter
         self._timer: Timer = timer
         self._overlay: IOverlay = overlay
+        self._listener_factory: Callable[..., Listener] | None = listener_factory # the pynput listener if None
+        self._clock: Callable[[], int] = clock
         
         self._msg_provider: MessageHub = MessageHub()
         self._key_listener: Listener | None = None
-        self._listener_thread: Thread | None = None
+        self._canonical: Callable[[Key | KeyCode], Key | KeyCode] | None = None # normalizes the keys of a held ctrl chord
+        self._mode: ListenerMode = ListenerMode.IDLE # routes the events of the one global hook
+        
+        self._helper_keys: Set[str] = {"Key.shift", "Key.shift_l", "Key.shift_r"}
+        self._modifier_mask: int = 0 # bitmask of the currently held modifiers
+        self._repeat_filter: RepeatFilter = RepeatFilter()
+        
+        self._keybind_table: KeybindTable = KeybindTable()
+        hotkey_actions: Dict[str, Callable[[], None]] = {
+            HotkeyNames.COUNTER_INC: self._count_death,
+            HotkeyNames.COUNTER_DEC: counter.decrease,
+            HotkeyNames.COUNTER_RESET: counter.reset,
+            HotkeyNames.TIMER_START: timer.start,
+            HotkeyNames.TIMER_PAUSE: timer.toggle_pause,
+            HotkeyNames.TIMER_STOP: timer.stop,
+            HotkeyNames.TIMER_RESET: timer.reset,
+            HotkeyNames.TIMER_SPLIT: timer.split
+        }
+        
+        if counter_bank is not None:
+            hotkey_actions[HotkeyNames.SLOT_NEXT] = counter_bank.select_next
+            hotkey_actions[HotkeyNames.SLOT_PREVIOUS] = counter_bank.select_previous
+        self._dispatcher: HotkeyDispatcher = HotkeyDispatcher(overlay, hotkey_actions)
+        self._hk_manager.add_keybind_listener(self._keybind_table.rebuild) # the table is only rebuilt if a keybind changes
+    
+    
+    def install(self) -> None:
+        if self._key_listener is not None:
+            return
+        
+        if self._listener_factory is None:
+            from pynput.keyboard import Listener # pynput is only imported once the hook is actually installed
+            self._listener_factory = Listener
+        
+        self._key_listener = self._listener_factory(on_press=self._on_press, on_release=self._on_release) # runs as a daemon thread until the app quits
+        self._canonical = getattr(self._key_listener, "canonical", None) # synthetic listeners do not provide it
+        self._key_listener.start()
+    
+    
+    def uninstall(self) -> None:
+        if self._key_listener is None:
+            return
         
-        self._helper_keys: Set[str] = {str(Key.shift_l), str(Key.shift_r)}
+        self._key_listener.stop()
+        self._key_listener = None
     
     
     def start_key_listener(self) -> None:
-        self._start_listener(
-            target_method=self._on_key_listener,
-            start_msg="A key listener started in a seperat thread"
-        )
+        self._activate_mode(ListenerMode.TRACKING, "The key listener is now tracking the hotkeys")
     
     
-    def _on_key_listener(self) -> None:
-        self._on_start_listener(on_press_method=self._on_press)
-        self._overlay.destroy_instance()
-        self._timer.check_timer_stopped()
-        self._msg_provider.invoke("Make sure to save the data using the 'stats save' command", "note")
+    def _on_press(self, key: Key | KeyCode) -> None:
+        if self._mode == ListenerMode.TRACKING:
+            self._on_tracking_press(key, perf_counter_ns()) # stamped on the latency clock as soon as the hook reports the press
+        elif self._mode == ListenerMode.REBIND:
+            self._on_change_keybind(key)
+        else:
+            self._track_modifier(KeybindTable.get_key_name(key, self._canonical)) # keeps the mask valid for the next mode
     
     
-    def _on_press(self, key: Key | KeyCode) -> bool | None:
-        dict_of_hotkeys: dict = self._hk_manager.get_current_hotkeys()
+    def _on_tracking_press(self, key: Key | KeyCode, press_time_ns: int) -> None:
+        callback_start_ns: int = self._clock()
+        key_name: str = KeybindTable.get_key_name(key, self._canonical)
+        
+        if self._track_modifier(key_name):
+            return
+        
+        hotkey: str | None = self._keybind_table.get_hotkey(self._modifier_mask, key_name)
+        
+        if hotkey is None:
+            return
+        if hotkey == HotkeyNames.LISTENER_END:
+            self._mode = ListenerMode.IDLE # further key presses are not routed to the session anymore
+            self._overlay.add_mainloop_task(0, self._end_session) # the session state is owned by the mainloop
+            return
+        if not self._repeat_filter.accept(hotkey, key_name, callback_start_ns):
+            return
         
-        try:
-            if self._equals_hotkey(key, HotkeyNames.LISTENER_END, dict_of_hotkeys):
-                return False # false stops the with statement
-            elif self._equals_hotkey(key, HotkeyNames.COUNTER_INC, dict_of_hotkeys):
-                self._counter.increase()
-            elif self._equals_hotkey(key, HotkeyNames.COUNTER_DEC, dict_of_hotkeys):
-                self._counter.decrease()
-            elif self._equals_hotkey(key, HotkeyNames.COUNTER_RESET, dict_of_hotkeys):
-                self._counter.reset()
-            elif self._equals_hotkey(key, HotkeyNames.TIMER_START, dict_of_hotkeys):
-                self._timer.start()
-            elif self._equals_hotkey(key, HotkeyNames.TIMER_PAUSE, dict_of_hotkeys):
-                self._timer.toggle_pause()
-            elif self._equals_hotkey(key, HotkeyNames.TIMER_STOP, dict_of_hotkeys):
-                self._timer.stop()
-            elif self._equals_hotkey(key, HotkeyNames.TIMER_RESET, dict_of_hotkeys):
-                self._timer.reset()
-        except AttributeError as e:
-            cleaned_key_input: str = str(key).replace("'", "")
-            self._msg_provider.invoke(
-                f"An unexpected error occurred while pressing the key \"{cleaned_key_input}\".\n"
-                f"Exception: {e}", "error")
+        self._dispatcher.enqueue(hotkey, press_time_ns)
+        LatencyMonitor.complete((hotkey, press_time_ns), "callback")
+    
+    
+    def _count_death(self) -> None:
+        self._counter.increase()
+        self._timer.end_attempt() # a death ends the attempt, the next split starts with the first segment again
+    
+    
+    def _end_session(self) -> None:
+        self._dispatcher.drain() # presses before the end hotkey still count
+        self._report_stopped()
+        self._overlay.destroy_instance()
+        self._timer.check_timer_stopped()
+        self._msg_provider.invoke("Make sure to save the data using the 'stats save' command", "note")
     
     
     # keybind change methods below
     
     def start_hotkey_config_listener(self) -> None:
-        self._start_listener(
-            target_method=self._on_hotkey_config_listener,
-            start_msg=(
-                "A key listener started in a seperat thread\n"
-                "Press a key to change the keybind of the selected hotkey <...>"
-            )
-        )
+        self._activate_mode(ListenerMode.REBIND, "Press a key to change the keybind of the selected hotkey <...>")
     
     
-    def _on_hotkey_config_listener(self) -> None:
-        self._on_start_listener(on_press_method=self._on_change_keybind)
+    def _on_change_keybind(self, key: Key | KeyCode) -> None:
+        key_name: str = KeybindTable.get_key_name(key, self._canonical)
+        
+        if self._track_modifier(key_name): # held modifiers become part of the keybind
+            return
+        if self._check_helper_keys(key_name):
+            return
+        
+        cleaned_key_input: str = KeybindTable.format_keybind(self._modifier_mask, key_name)
+        
+        self._mode = ListenerMode.IDLE # only the first key press is taken as the new keybind
+        self._overlay.add_mainloop_task(0, lambda: self._change_keybind(cleaned_key_input)) # writing the hotkeys file would block the hook
     
     
-    def _on_change_keybind(self, key: Key | KeyCode) -> bool | None:
+    def _change_keybind(self, cleaned_key_input: str) -> None:
         dict_of_hotkeys: dict = self._hk_manager.get_current_hotkeys()
-        cleaned_key_input: str = str(key).replace("'", "")
-        
-        if self._check_helper_keys(cleaned_key_input):
-            return
         
         self._msg_provider.invoke(cleaned_key_input, "request")
+        self._report_stopped()
         
         for keybind in dict_of_hotkeys.values():
             if cleaned_key_input == keybind:
                 self._msg_provider.invoke(f"The keybind \"{cleaned_key_input}\" is already assigned to a hotkey. Make sure to select another key and try again", "invalid")
-                return False
+                return
         
         self._hk_manager.set_new_keybind(self._hotkey, cleaned_key_input)
         self._msg_provider.invoke(f"The keybind was successfully changed to \"{cleaned_key_input}\"", "success")
-        return False
     
     
     # helper methods below
     
-    def _start_listener(self, target_method: Callable[..., bool | None], start_msg: str) -> None:
-        if self._listener_thread is None or not self._listener_thread.is_alive():
-            self._listener_thread = Thread(target=target_method, daemon=True)
-            self._listener_thread.start()
-            self._msg_provider.invoke(start_msg, "normal")
+    def _activate_mode(self, mode: ListenerMode, start_msg: str) -> None:
+        if self._mode != ListenerMode.IDLE:
+            self._msg_provider.invoke("The key listener is already running", "warning")
             return
         
-        self._msg_provider.invoke("The key listener is already running", "warning")
+        self.install() # only installs the hook if the deferred startup has not done it yet
+        self._repeat_filter.clear_pressed_keys()
+        self._mode = mode
+        self._msg_provider.invoke(start_msg, "normal")
     
     
-    def _on_start_listener(self, on_press_method: Callable[..., bool | None]) -> None:
-        with Listener(on_press=on_press_method) as self._key_listener:
-            self._key_listener.join()
+    def _report_stopped(self) -> None:
         self._msg_provider.invoke("The key listener was stopped", "normal")
     
     
-    @staticmethod
-    def _equals_hotkey(key: Key | KeyCode, hotkey: str, dict_of_hotkeys: dict) -> bool:
-        cleaned_key_input: str = str(key).replace("'", "")
-        return cleaned_key_input == dict_of_hotkeys.get(hotkey)
+    def _track_modifier(self, key_name: str) -> bool:
+        modifier_mask: int | None = KeybindTable.press_modifier(self._modifier_mask, key_name)
+        
+        if modifier_mask is None:
+            return False
+        self._modifier_mask = modifier_mask
+        return True
+    
+    
+    def _on_release(self, key: Key | KeyCode) -> None:
+        key_name: str = KeybindTable.get_key_name(key, self._canonical)
+        self._modifier_mask &= ~KeybindTable.get_modifier_bit(key_name)
+        self._repeat_filter.release(key_name)
+    
+    
+    def get_suppressed_counts(self) -> Dict[str, Dict[str, int]]:
+        return self._repeat_filter.get_suppressed_counts()
     
     
     def set_new_keybind(self, hotkey: str) -> None:
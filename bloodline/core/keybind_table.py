@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
+
+from schemas import ValidationPattern
+
+if TYPE_CHECKING:
+    from pynput.keyboard import Key, KeyCode
+
+class KeybindTable:
+    
+    def __init__(self):
+        self._dispatch_table: Dict[Tuple[int, str], str] = {}
+    
+    
+    _MODIFIER_BITS: Dict[str, int] = {"ctrl": 1, "alt": 2, "cmd": 4}
+    _MODIFIER_KEYS: Dict[str, int] = {
+        "Key.ctrl": 1, "Key.ctrl_l": 1, "Key.ctrl_r": 1,
+        "Key.alt": 2, "Key.alt_l": 2, "Key.alt_r": 2,
+        "Key.cmd": 4, "Key.cmd_l": 4, "Key.cmd_r": 4
+    }
+    _ALT_GR_KEY: str = "Key.alt_gr" # reported together with a synthetic "Key.ctrl_l" on windows
+    _CONTROL_CHAR_LIMIT: int = 32 # chars below are control characters, e.g. "\x01" for ctrl+a
+    _CONTROL_CHAR_OFFSET: int = ord("a") - 1
+    
+    
+    def rebuild(self, hotkeys: dict) -> None:
+        # maps (modifier bitmask, key) to the hotkey, so a key press only costs a single lookup
+        self._dispatch_table = {KeybindTable._parse_keybind(keybind): hotkey for hotkey, keybind in hotkeys.items()}
+    
+    
+    def get_hotkey(self, modifier_mask: int, key_name: str) -> str | None:
+        hotkey: str | None = self._dispatch_table.get((modifier_mask, key_name))
+        
+        if hotkey is None and modifier_mask:
+            return self._dispatch_table.get((0, key_name)) # modifiers held in the game, e.g. ctrl to crouch, do not block the plain keybind
+        return hotkey
+    
+    
+    @classmethod
+    def get_key_name(cls, key: Key | KeyCode, canonical: Callable[[Key | KeyCode], Key | KeyCode] | None = None) -> str:
+        char: str | None = getattr(key, "char", None)
+        
+        if char is None:
+            return str(key)
+        if len(char) == 1 and ord(char) < cls._CONTROL_CHAR_LIMIT:
+            return cls._get_control_key_name(key, char, canonical) # pynput reports the control character while ctrl is held
+        return char
+    
+    
+    @classmethod
+    def get_modifier_bit(cls, key_name: str) -> int:
+        return cls._MODIFIER_KEYS.get(key_name, 0)
+    
+    
+    @classmethod
+    def press_modifier(cls, modifier_mask: int, key_name: str) -> int | None:
+        if key_name == cls._ALT_GR_KEY:
+            return modifier_mask & ~cls._MODIFIER_BITS.get("ctrl") # the ctrl of altgr is not held by the player, so "@" or "{" keep their plain keybind
+        
+        modifier_bit: int | None = cls._MODIFIER_KEYS.get(key_name)
+        
+        if modifier_bit is None:
+            return None # not a modifier
+        return modifier_mask | modifier_bit
+    
+    
+    @classmethod
+    def format_keybind(cls, modifier_mask: int, key_name: str) -> str:
+        modifiers: str = "".join(f"<{modifier}>+" for modifier, bit in cls._MODIFIER_BITS.items() if modifier_mask & bit)
+        return f"{modifiers}{key_name}"
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _get_control_key_name(cls, key: Key | KeyCode, char: str, canonical: Callable[[Key | KeyCode], Key | KeyCode] | None) -> str:
+        canonical_char: str | None = getattr(canonical(key), "char", None) if canonical is not None else None
+        
+        if canonical_char and ord(canonical_char[0]) >= cls._CONTROL_CHAR_LIMIT:
+            return canonical_char # e.g. the windows listener resolves the letter from the scan code
+        if 1 <= ord(char) <= 26:
+            return chr(ord(char) + cls._CONTROL_CHAR_OFFSET) # "\x01" to "\x1a" are ctrl+a to ctrl+z
+        return char
+    
+    
+    @classmethod
+    def _parse_keybind(cls, keybind: str) -> Tuple[int, str]:
+        modifiers, key_name = ValidationPattern.split_keybind(keybind)
+        modifier_mask: int = 0
+        
+        for modifier in modifiers:
+            modifier_mask |= cls._MODIFIER_BITS.get(modifier)
+        return (modifier_mask, key_name)
\ No newline at end of file
@@ -0,0 +1,75 @@
+from enum import Enum
+from threading import Lock
+from typing import Dict, Set, Tuple
+
+from schemas import HotkeyNames
+
+class RepeatPolicy(str, Enum):
+    IGNORE: str = "ignore" # held keys only trigger once
+    RATE_LIMIT: str = "rate_limit" # held keys trigger again once the interval passed
+    ALLOW: str = "allow" # every auto-repeat triggers
+
+
+class RepeatFilter:
+    
+    def __init__(self):
+        self._pressed_keys: Set[str] = set()
+        self._last_accepted_ns: Dict[str, int] = {}
+        self._suppressed_counts: Dict[str, Dict[str, int]] = {}
+        self._counts_lock: Lock = Lock() # the counts are updated on the hook thread and read on the mainloop
+    
+    
+    # (repeat policy, rate limit interval, debounce interval) in ns
+    _POLICIES: Dict[str, Tuple[RepeatPolicy, int, int]] = {
+        HotkeyNames.COUNTER_INC: (RepeatPolicy.IGNORE, 0, 80_000_000),
+        HotkeyNames.COUNTER_DEC: (RepeatPolicy.RATE_LIMIT, 250_000_000, 80_000_000),
+        HotkeyNames.COUNTER_RESET: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.TIMER_START: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.TIMER_PAUSE: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.TIMER_STOP: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.TIMER_RESET: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.TIMER_SPLIT: (RepeatPolicy.IGNORE, 0, 250_000_000),
+        HotkeyNames.SLOT_NEXT: (RepeatPolicy.RATE_LIMIT, 250_000_000, 80_000_000), # held keys cycle through the slots
+        HotkeyNames.SLOT_PREVIOUS: (RepeatPolicy.RATE_LIMIT, 250_000_000, 80_000_000)
+    }
+    _DEFAULT_POLICY: Tuple[RepeatPolicy, int, int] = (RepeatPolicy.ALLOW, 0, 0)
+    
+    
+    def accept(self, hotkey: str, key_name: str, press_time_ns: int) -> bool:
+        is_repeat: bool = key_name in self._pressed_keys
+        self._pressed_keys.add(key_name)
+        
+        policy, rate_limit_ns, debounce_ns = RepeatFilter._POLICIES.get(hotkey, RepeatFilter._DEFAULT_POLICY)
+        elapsed_ns: int = press_time_ns - self._last_accepted_ns.get(hotkey, press_time_ns - debounce_ns - rate_limit_ns)
+        
+        if is_repeat and policy == RepeatPolicy.IGNORE:
+            return self._suppress(hotkey, "repeat")
+        if is_repeat and policy == RepeatPolicy.RATE_LIMIT and elapsed_ns < rate_limit_ns:
+            return self._suppress(hotkey, "rate_limit")
+        if not is_repeat and elapsed_ns < debounce_ns:
+            return self._suppress(hotkey, "debounce") # e.g. key chatter or auto-repeats that arrive as release/press pairs
+        
+        self._last_accepted_ns[hotkey] = press_time_ns
+        return True
+    
+    
+    def release(self, key_name: str) -> None:
+        self._pressed_keys.discard(key_name)
+    
+    
+    def clear_pressed_keys(self) -> None:
+        self._pressed_keys.clear() # releases are missed while no listener is running
+    
+    
+    def get_suppressed_counts(self) -> Dict[str, Dict[str, int]]:
+        with self._counts_lock:
+            return {hotkey: dict(counts) for hotkey, counts in self._suppressed_counts.items()}
+    
+    
+    # helper methods below
+    
+    def _suppress(self, hotkey: str, reason: str) -> bool:
+        with self._counts_lock:
+            hotkey_counts: Dict[str, int] = self._suppressed_counts.setdefault(hotkey, {})
+            hotkey_counts[reason] = hotkey_counts.get(reason, 0) + 1
+        return False
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import List
+from sqlite3 import DatabaseError
+from typing import Dict, List, Tuple
 
 from file_io import DatabaseHandler
 from infrastructure import Directory, MessageHub
@@ -23,7 +24,7 @@ class SaveFile:
     _DB_FILE_PATH: Path = Directory.get_persistent_data_path().joinpath(_DB_FILE)
     _BACKUP_FILE_PATH: Path = Directory.get_backup_path().joinpath(_BACKUP_FILE)
     
-    _LATEST_VERSION: int = 1
+    _LATEST_VERSION: int = 2
     _DB_STRUCURE: str = """
         CREATE TABLE IF NOT EXISTS Game (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,22 +40,33 @@ class SaveFile:
                                         
             UNIQUE (name, gameId),
             FOREIGN KEY (gameId) REFERENCES Game (id) ON DELETE CASCADE
+        );
+                                        
+        CREATE TABLE IF NOT EXISTS Segment (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bossId INTEGER NOT NULL,
+            attempt INTEGER NOT NULL,
+            segmentIndex INTEGER NOT NULL,
+            duration INTEGER NOT NULL,
+                                        
+            UNIQUE (bossId, attempt, segmentIndex),
+            FOREIGN KEY (bossId) REFERENCES Boss (id) ON DELETE CASCADE
         );"""
     
     _UNKNOWN_GAME_TITLE: str = "Unknown Game"
     _UNKNOWN_BOSS_NAME: str = "Unknown Boss"
     
     
-    def _update_history(self, curr_version: int) -> None:
-        """try:
+    def _update_history(self, db_handler: DatabaseHandler, curr_version: int) -> None:
+        try:
             if curr_version == 1:
-                # update 1
-                # increment version number
-            elif curr_version == 2:
-                # update 2
-                # increment version number
-            etc.
-        except ..."""
+                # update 1: the Segment table is already created by the db structure, so only the version number is incremented
+                db_handler.set_version(2)
+        except DatabaseError as e:
+            self._msg_provider.invoke(
+                f"An unexpected error occurred while updating the file \"{SaveFile._DB_FILE}\" to version {SaveFile._LATEST_VERSION}.\n"
+                f"Exception: {e}", "error"
+            )
     
     
     def close_connection(self) -> None:
@@ -266,7 +278,7 @@ class SaveFile:
         )
     
     
-    def update_boss(self, boss_name: str, game_title: str, deaths: int | None, required_time: int | None) -> bool:
+    def update_boss(self, boss_name: str, game_title: str, deaths: int | None, required_time: int | None, segments: List[Tuple[int, int, int]] | None = None) -> bool:
         if not self._get_game_exists(game_title):
             self._msg_provider.invoke(f"The game \"{game_title}\" you selected a boss from to save the stats to does not exist in the save file so far", "invalid")
             return False
@@ -274,6 +286,9 @@ class SaveFile:
             self._msg_provider.invoke(f"The boss \"{boss_name}\" you selected to save the stats to does not exist in the game \"{self._get_cased_game_title(game_title)}\" so far", "invalid")
             return False
         
+        if segments and not self._add_segments_operation(boss_name, game_title, segments):
+            return False
+        
         sql: str = """
             UPDATE Boss
                 SET deaths = (?), requiredTime = (?)
@@ -287,6 +302,27 @@ class SaveFile:
         )
     
     
+    def update_bosses(self, list_of_bosses: List[Tuple[int | None, int | None, int]], segments: List[Tuple[int, int, int, int]] | None = None) -> bool:
+        sql: str = """
+            UPDATE Boss
+                SET deaths = (?), requiredTime = (?)
+                WHERE id = (?)"""
+        
+        try:
+            if segments:
+                self._add_bank_segments_operation(segments) # committed together with the bosses
+            self._db_handler.execute_many_dml(sql, list_of_bosses) # all bosses of the counter bank are updated within one transaction
+            self._msg_provider.invoke(f"The stats of {len(list_of_bosses)} boss(es) were saved", "success")
+            self._db_handler.ensure_backup()
+            return True
+        except Exception as e:
+            self._msg_provider.invoke(
+                f"An unexpected error occurred while saving the stats of the counter bank.\n"
+                f"Exception: {e}", "error"
+            )
+            return False
+    
+    
     # db selection methods below
     
     def get_all_games_by(self, sort_filter: str, order_filter: str) -> List[tuple]:
@@ -348,6 +384,30 @@ class SaveFile:
         return fetched_list_of_bosses
     
     
+    def get_bank_bosses(self, game_title: str) -> List[tuple]:
+        sql: str = """
+            SELECT b.id, b.name, b.deaths, b.requiredTime FROM Boss b
+                JOIN Game g ON b.gameId = g.id
+                WHERE g.title = (?) COLLATE NOCASE
+                ORDER BY b.id"""
+        
+        fetched_list_of_bosses: List[tuple] = self._db_handler.fetch(sql, game_title)
+        return fetched_list_of_bosses
+    
+    
+    def get_bank_segments(self, game_title: str) -> List[tuple]:
+        sql: str = """
+            SELECT s.bossId, s.segmentIndex, MIN(s.duration), SUM(s.duration), COUNT(s.duration) FROM Segment s
+                JOIN Boss b ON s.bossId = b.id
+                JOIN Game g ON b.gameId = g.id
+                WHERE g.title = (?) COLLATE NOCASE
+                GROUP BY s.bossId, s.segmentIndex
+                ORDER BY s.bossId, s.segmentIndex"""
+        
+        fetched_bank_segments: List[tuple] = self._db_handler.fetch(sql, game_title)
+        return fetched_bank_segments
+    
+    
     def get_boss_deaths(self, boss_name: str, game_title: str) -> int | None:
         sql: str = """
             SELECT b.deaths FROM Boss b
@@ -374,6 +434,19 @@ class SaveFile:
         return fetched_boss_time[0][0]
     
     
+    def get_boss_segments(self, boss_name: str, game_title: str) -> List[tuple]:
+        sql: str = """
+            SELECT s.segmentIndex, MIN(s.duration), SUM(s.duration), COUNT(s.duration) FROM Segment s
+                JOIN Boss b ON s.bossId = b.id
+                JOIN Game g ON b.gameId = g.id
+                WHERE b.name = (?) COLLATE NOCASE and g.title = (?) COLLATE NOCASE
+                GROUP BY s.segmentIndex
+                ORDER BY s.segmentIndex"""
+        
+        fetched_boss_segments: List[tuple] = self._db_handler.fetch(sql, boss_name, game_title)
+        return fetched_boss_segments
+    
+    
     def get_all_games_sum(self) -> List[tuple]:
         return self.get_all_bosses_sum()
     
@@ -549,6 +622,52 @@ class SaveFile:
         )
     
     
+    def _add_segments_operation(self, boss_name: str, game_title: str, segments: List[Tuple[int, int, int]]) -> bool:
+        sql: str = """
+            SELECT b.id, (SELECT COALESCE(MAX(s.attempt), 0) FROM Segment s WHERE s.bossId = b.id) FROM Boss b
+                JOIN Game g ON b.gameId = g.id
+                WHERE b.name = (?) COLLATE NOCASE and g.title = (?) COLLATE NOCASE"""
+        
+        boss_id, last_attempt = self._db_handler.fetch(sql, boss_name, game_title)[0]
+        
+        sql = """
+            INSERT INTO Segment (bossId, attempt, segmentIndex, duration)
+                VALUES (?, ?, ?, ?)"""
+        
+        try:
+            # the attempts are numbered per session, so they continue after the last saved attempt of the boss
+            # the rows are committed together with the update of the boss, a failed update rolls them back
+            self._db_handler.execute_many_dml(sql, ((boss_id, last_attempt + attempt, segment_index, duration) for attempt, segment_index, duration in segments), commit=False)
+            return True
+        except Exception as e:
+            self._msg_provider.invoke(
+                f"An unexpected error occurred while saving the segments to the boss \"{self._get_cased_boss_name(boss_name, game_title)}\" of the game \"{self._get_cased_game_title(game_title)}\".\n"
+                f"Exception: {e}", "error"
+            )
+            return False
+    
+    
+    def _add_bank_segments_operation(self, segments: List[Tuple[int, int, int, int]]) -> None:
+        boss_ids: List[int] = sorted({boss_id for boss_id, *_ in segments})
+        sql: str = f"""
+            SELECT bossId, MAX(attempt) FROM Segment
+                WHERE bossId IN ({", ".join("?" * len(boss_ids))})
+                GROUP BY bossId"""
+        
+        last_attempts: Dict[int, int] = dict(self._db_handler.fetch(sql, *boss_ids))
+        
+        sql = """
+            INSERT INTO Segment (bossId, attempt, segmentIndex, duration)
+                VALUES (?, ?, ?, ?)"""
+        
+        # the attempts continue after the last saved attempt of each boss, the caller reports a failure
+        self._db_handler.execute_many_dml(
+            sql,
+            ((boss_id, last_attempts.get(boss_id, 0) + attempt, segment_index, duration) for boss_id, attempt, segment_index, duration in segments),
+            commit=False
+        )
+    
+    
     def _validate_filters(self, sort_filter: str, order_filter: str, allowed_sort_filters: List[str]) -> bool:
         allowed_order_filters: List[str] = ["desc", "asc"]
         
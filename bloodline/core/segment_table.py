@@ -0,0 +1,97 @@
+from array import array
+from typing import Iterator, List, Tuple
+
+class SegmentTable:
+    
+    def __init__(self):
+        # the stats of each segment are kept in flat arrays indexed by the segment index instead of a list of objects
+        self._best_durations: array = array("q")
+        self._duration_sums: array = array("q")
+        self._duration_counts: array = array("q")
+        
+        self._pending_segments: array = array("q") # (attempt, segment index, duration) triples that were not saved yet
+        self._attempt: int = 1
+        self._segment_index: int = 0
+    
+    
+    def load(self, segment_stats: List[Tuple[int, int, int, int]]) -> None:
+        self.reset()
+        
+        # (segment index, best duration, sum of durations, number of durations) as aggregated by the save file
+        for segment_index, best_duration, duration_sum, duration_count in segment_stats:
+            self._ensure_segment(segment_index)
+            self._best_durations[segment_index] = best_duration
+            self._duration_sums[segment_index] = duration_sum
+            self._duration_counts[segment_index] = duration_count
+    
+    
+    def add(self, duration: int) -> int:
+        segment_index: int = self._segment_index
+        self._ensure_segment(segment_index)
+        
+        if not self._duration_counts[segment_index] or duration < self._best_durations[segment_index]:
+            self._best_durations[segment_index] = duration
+        self._duration_sums[segment_index] += duration
+        self._duration_counts[segment_index] += 1
+        
+        self._pending_segments.extend((self._attempt, segment_index, duration))
+        self._segment_index += 1
+        return segment_index
+    
+    
+    def end_attempt(self) -> None:
+        if self._segment_index:
+            self._attempt += 1
+        self._segment_index = 0 # an unfinished segment is not recorded, it would distort the best and average
+    
+    
+    def get_segment_index(self) -> int:
+        return self._segment_index
+    
+    
+    def get_best(self, segment_index: int) -> int | None:
+        if segment_index >= len(self._duration_counts) or not self._duration_counts[segment_index]:
+            return None
+        return self._best_durations[segment_index]
+    
+    
+    def get_average(self, segment_index: int) -> int | None:
+        if segment_index >= len(self._duration_counts) or not self._duration_counts[segment_index]:
+            return None
+        return round(self._duration_sums[segment_index] / self._duration_counts[segment_index])
+    
+    
+    def get_is_used(self) -> bool:
+        return bool(self._duration_counts)
+    
+    
+    def get_pending_segments(self) -> List[Tuple[int, int, int]]:
+        pending_iterator: Iterator[int] = iter(self._pending_segments)
+        return list(zip(pending_iterator, pending_iterator, pending_iterator))
+    
+    
+    def get_is_pending(self) -> bool:
+        return bool(self._pending_segments)
+    
+    
+    @staticmethod
+    def format_duration(duration: int) -> str:
+        total_seconds, milliseconds = divmod(duration, 1000)
+        return f"{total_seconds // 60}:{total_seconds % 60:02}.{milliseconds // 100}"
+    
+    
+    def reset(self) -> None:
+        for segment_array in (self._best_durations, self._duration_sums, self._duration_counts, self._pending_segments):
+            del segment_array[:]
+        self._attempt = 1
+        self._segment_index = 0
+    
+    
+    # helper methods below
+    
+    def _ensure_segment(self, segment_index: int) -> None:
+        missing_segments: int = segment_index + 1 - len(self._duration_counts)
+        
+        if missing_segments > 0:
+            for segment_array in (self._best_durations, self._duration_sums, self._duration_counts):
+                segment_array.extend([0] * missing_segments)
\ No newline at end of file
@@ -0,0 +1,146 @@
+from atexit import register
+from pathlib import Path
+from threading import Lock, Timer
+from time import monotonic_ns, time
+from typing import Any, Dict, List
+
+from file_io import JournalFileOperations
+from infrastructure import Directory, MessageHub
+
+class SessionJournal:
+    
+    def __init__(self):
+        self._msg_provider: MessageHub = MessageHub()
+        
+        self._pending_entries: List[dict] = []
+        self._commit_lock: Lock = Lock()
+        self._write_lock: Lock = Lock() # keeps the groups in order without blocking new events during the fsync
+        self._commit_timer: Timer | None = None
+        self._journal_enabled: bool = True
+        
+        register(self.commit)
+    
+    
+    _JOURNAL_FILE: str = "session_journal.jsonl"
+    _JOURNAL_FILE_PATH: Path = Directory.get_persistent_data_path() / _JOURNAL_FILE
+    _COMMIT_DELAY_SECONDS: float = 0.2 # bounds the events that a crash can lose
+    
+    
+    def start_session(self, boss_name: str | None, game_title: str | None, deaths: int | None, required_time: int | None) -> None:
+        self.clear()
+        self.record("session", boss=boss_name, game=game_title, deaths=deaths, time=required_time)
+    
+    
+    def start_bank(self, game_title: str, list_of_bosses: List[tuple]) -> None:
+        self.clear()
+        self.record("bank", game=game_title, bosses=[list(boss) for boss in list_of_bosses]) # the saved values of every slot, ordered by slot
+    
+    
+    def record(self, event: str, **values: Any) -> None:
+        if not self._journal_enabled:
+            return
+        
+        with self._commit_lock:
+            self._pending_entries.append({"event": event, "mono_ns": monotonic_ns(), "wall": time(), **values})
+            
+            # entries within the delay are committed together with a single fsync
+            if self._commit_timer is None:
+                self._commit_timer = Timer(SessionJournal._COMMIT_DELAY_SECONDS, self.commit)
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+    
+    
+    def commit(self) -> None:
+        with self._write_lock:
+            with self._commit_lock:
+                if self._commit_timer is not None:
+                    self._commit_timer.cancel()
+                    self._commit_timer = None
+                
+                entries_to_commit: List[dict] = self._pending_entries
+                self._pending_entries = []
+            
+            if not entries_to_commit:
+                return
+            
+            try:
+                JournalFileOperations.perform_append(SessionJournal._JOURNAL_FILE_PATH, entries_to_commit)
+            except OSError as e:
+                self._disable_journal(e)
+    
+    
+    def clear(self) -> None:
+        with self._write_lock:
+            with self._commit_lock:
+                if self._commit_timer is not None:
+                    self._commit_timer.cancel()
+                    self._commit_timer = None
+                self._pending_entries = []
+            
+            try:
+                JournalFileOperations.perform_clear(SessionJournal._JOURNAL_FILE_PATH) # the saved session no longer needs to be replayed
+            except OSError as e:
+                self._disable_journal(e)
+    
+    
+    def replay(self) -> dict | None:
+        try:
+            entries: List[dict] = JournalFileOperations.perform_load(SessionJournal._JOURNAL_FILE_PATH)
+        except OSError as e:
+            self._disable_journal(e)
+            return None
+        
+        session: dict | None = None
+        
+        # every entry carries the state after the event, so the last entry of each kind wins
+        for entry in entries:
+            event: str | None = entry.get("event")
+            
+            if event == "session":
+                session = {"boss": entry.get("boss"), "game": entry.get("game"), "deaths": entry.get("deaths"), "time": entry.get("time"), "count": None, "elapsed_ns": None}
+            elif event == "bank":
+                session = {"game": entry.get("game"), "bosses": entry.get("bosses"), "slots": {}, "active_slot": 0}
+                continue
+            elif session is None:
+                continue
+            
+            SessionJournal._apply_entry(session, event, entry)
+        
+        if session is None or not SessionJournal._get_is_tracked(session):
+            return None
+        return session
+    
+    
+    # helper methods below
+    
+    @staticmethod
+    def _apply_entry(session: dict, event: str | None, entry: dict) -> None:
+        tracked_values: dict = session
+        
+        if "slots" in session:
+            # counter and timer events belong to the selected slot, the final values of a slot are journaled when it is left
+            slot: int = entry.get("slot", session.get("active_slot"))
+            
+            if event == "select":
+                session["active_slot"] = slot
+                return
+            tracked_values = session.get("slots").setdefault(slot, {"count": None, "elapsed_ns": None})
+        
+        if "count" in entry:
+            tracked_values["count"] = entry.get("count")
+        if "elapsed_ns" in entry:
+            tracked_values["elapsed_ns"] = entry.get("elapsed_ns")
+    
+    
+    @staticmethod
+    def _get_is_tracked(session: dict) -> bool:
+        slots: Dict[int, dict] = session.get("slots", {0: session})
+        return any(values.get("count") is not None or values.get("elapsed_ns") is not None for values in slots.values())
+    
+    
+    def _disable_journal(self, e: OSError) -> None:
+        self._journal_enabled = False
+        self._msg_provider.invoke(
+            f"An unexpected error occurred while accessing the file \"{SessionJournal._JOURNAL_FILE}\". Tracking sessions will not be recoverable for this session.\n"
+            f"Exception: {e}", "error"
+        )
\ No newline at end of file
@@ -0,0 +1,108 @@
+from typing import Callable, List, Tuple
+
+from infrastructure.interfaces import IOverlay
+
+class SessionMetrics:
+    
+    def __init__(self, overlay: IOverlay):
+        self._overlay: IOverlay = overlay
+        
+        self._count_source: Callable[[], int | None] = lambda: None
+        self._time_source: Callable[[], Tuple[int | None, int]] = lambda: (None, 0)
+        
+        # running aggregates that are updated per event, so no metric has to be recomputed from the history of the session
+        self._last_death_time: int = 0 # live time of the last death in ns
+        self._attempt_time_sum: int = 0
+        self._completed_attempts: int = 0
+        self._longest_attempt: int = 0
+        self._last_attempt: Tuple[int, int] | None = None # (duration, previous longest attempt) to undo the last death
+        self._last_metrics_text: str = ""
+    
+    
+    _NS_PER_SECOND: int = 1_000_000_000
+    _NS_PER_HOUR: int = 3600 * _NS_PER_SECOND
+    _MIN_RATE_TIME_NS: int = 60 * _NS_PER_SECOND # the rate of deaths is only meaningful after a while
+    
+    
+    def set_sources(self, count_source: Callable[[], int | None], time_source: Callable[[], Tuple[int | None, int]]) -> None:
+        self._count_source = count_source
+        self._time_source = time_source
+    
+    
+    def count_death(self) -> None:
+        live_time: int = self._time_source()[1]
+        attempt_time: int = live_time - self._last_death_time
+        
+        if not live_time:
+            self.refresh()
+            return # attempts can only be timed once the timer was started
+        
+        self._last_attempt = (attempt_time, self._longest_attempt)
+        self._attempt_time_sum += attempt_time
+        self._completed_attempts += 1
+        self._longest_attempt = max(self._longest_attempt, attempt_time)
+        self._last_death_time = live_time
+        self.refresh()
+    
+    
+    def uncount_death(self) -> None:
+        if self._last_attempt is not None:
+            attempt_time, previous_longest_attempt = self._last_attempt
+            
+            # only the last death can be undone, as the longest attempt before it is not known otherwise
+            self._last_attempt = None
+            self._attempt_time_sum -= attempt_time
+            self._completed_attempts -= 1
+            self._longest_attempt = previous_longest_attempt
+            self._last_death_time -= attempt_time
+        self.refresh()
+    
+    
+    def restart(self) -> None:
+        self._last_death_time = self._time_source()[1]
+        self._attempt_time_sum = 0
+        self._completed_attempts = 0
+        self._longest_attempt = 0
+        self._last_attempt = None
+        self._last_metrics_text = "" # forces a repaint, e.g. for the overlay instance of a new session
+        self.refresh()
+    
+    
+    def refresh(self) -> None:
+        metrics_text: str = self._get_metrics_text()
+        
+        if not metrics_text or metrics_text == self._last_metrics_text:
+            return # most timer ticks do not change any of the displayed values
+        
+        self._last_metrics_text = metrics_text
+        self._overlay.update_metrics_label(metrics_text)
+    
+    
+    # helper methods below
+    
+    def _get_metrics_text(self) -> str:
+        deaths: int | None = self._count_source()
+        time_already_required, live_time = self._time_source()
+        total_time: int = (time_already_required or 0) * SessionMetrics._NS_PER_SECOND + live_time
+        current_attempt: int = live_time - self._last_death_time
+        metrics: List[str] = []
+        
+        if deaths is not None and total_time >= SessionMetrics._MIN_RATE_TIME_NS:
+            metrics.append(f"{deaths * SessionMetrics._NS_PER_HOUR / total_time:.1f} D/h")
+        if self._completed_attempts:
+            metrics.append(f"avg {SessionMetrics._format_duration(self._attempt_time_sum // self._completed_attempts)}")
+        if live_time:
+            metrics.append(f"alive {SessionMetrics._format_duration(current_attempt)}")
+        if self._longest_attempt:
+            delta: int = current_attempt - self._longest_attempt
+            metrics.append(f"best {"+" if delta >= 0 else "-"}{SessionMetrics._format_duration(abs(delta))}")
+        return " | ".join(metrics)
+    
+    
+    @staticmethod
+    def _format_duration(duration: int) -> str:
+        total_seconds: int = duration // SessionMetrics._NS_PER_SECOND
+        
+        if total_seconds >= 3600:
+            return f"{total_seconds // 3600}:{total_seconds // 60 % 60:02}:{total_seconds % 60:02}"
+        return f"{total_seconds // 60}:{total_seconds % 60:02}"
\ No newline at end of file
@@ -0,0 +1,43 @@
+from types import MappingProxyType
+from typing import Mapping, Set
+
+from schemas import TSectionKeys
+
+class ThemeCompiler:
+    
+    @classmethod
+    def compile_theme(cls, theme: dict) -> Mapping:
+        font_props: dict = theme.get(TSectionKeys.FONT)
+        widget_props: dict = theme.get(TSectionKeys.WIDGETS)
+        
+        # the shared props are merged into each window section once, so the getters only have to look them up
+        return MappingProxyType({
+            TSectionKeys.COLORS: MappingProxyType(dict(theme.get(TSectionKeys.COLORS))),
+            TSectionKeys.FONT: cls._compile_section(font_props),
+            TSectionKeys.WIDGETS: cls._compile_section(widget_props)
+        })
+    
+    
+    @staticmethod
+    def get_changed_keys(old_props: Mapping, new_props: Mapping) -> Set[str]:
+        return {key for key in new_props if old_props.get(key) != new_props.get(key)}
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _compile_section(cls, category_props: dict) -> Mapping:
+        shared_props: dict = cls._get_shared_props(category_props)
+        
+        return MappingProxyType({
+            TSectionKeys.ROOT: MappingProxyType({**shared_props, **category_props.get(TSectionKeys.ROOT)}),
+            TSectionKeys.TOPLEVEL: MappingProxyType({**shared_props, **category_props.get(TSectionKeys.TOPLEVEL)})
+        })
+    
+    
+    @staticmethod
+    def _get_shared_props(category_props: dict) -> dict:
+        shared_props: dict = {
+            key: value for key, value in category_props.items() if not isinstance(value, dict)
+        }
+        return shared_props
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, List, Mapping, override
+
+from .theme_compiler import ThemeCompiler
+from file_io import SettingsDbHandler
+from file_io.json import PersistentJsonHandler
+from infrastructure import Directory
+from infrastructure.interfaces import IThemeManager
+from schemas import ThemeModel, TSectionKeys
+
+class ThemeManager(IThemeManager):
+    
+    _instance: ThemeManager | None = None
+    _pers_json_handler: PersistentJsonHandler | None = None
+    _compiled_theme: Mapping | None = None
+    _theme_listeners: List[Callable[[Mapping, Mapping], None]] = []
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            
+            cls._instance._pers_json_handler = SettingsDbHandler.create(
+                main_file_path=cls._instance._THEME_FILE_PATH,
+                backup_file_path=cls._instance._BACKUP_FILE_PATH,
+                default_data=ThemeModel()
+            )
+            cls._instance._pers_json_handler.load_data()
+            cls._instance._compiled_theme = ThemeCompiler.compile_theme(cls._instance._pers_json_handler.get_data())
+        return cls._instance
+    
+    
+    _THEME_FILE: str = "theme.json"
+    _BACKUP_FILE: str = f"{_THEME_FILE}.bak"
+    _THEME_FILE_PATH: Path = Directory.get_persistent_data_path() / _THEME_FILE
+    _BACKUP_FILE_PATH: Path = Directory.get_backup_path() / _BACKUP_FILE
+    
+    
+    @override
+    def get_theme(self) -> dict:
+        return self._pers_json_handler.get_data()
+    
+    
+    @override
+    def set_theme(self, loaded_theme: dict) -> None:
+        self._pers_json_handler.set_data(loaded_theme)
+        self._recompile_theme()
+    
+    
+    def reload_theme(self) -> None:
+        self._pers_json_handler.load_data()
+        self._recompile_theme()
+    
+    
+    def add_theme_listener(self, listener: Callable[[Mapping, Mapping], None]) -> None:
+        self._theme_listeners.append(listener)
+    
+    
+    def get_theme_file_path(self) -> Path:
+        return ThemeManager._THEME_FILE_PATH
+    
+    
+    def get_compiled_theme(self) -> Mapping:
+        return self._compiled_theme
+    
+    
+    def get_colors(self) -> Mapping:
+        return self._compiled_theme.get(TSectionKeys.COLORS)
+    
+    
+    def get_root_font_props(self) -> Mapping:
+        return self._compiled_theme.get(TSectionKeys.FONT).get(TSectionKeys.ROOT)
+    
+    
+    def get_toplevel_font_props(self) -> Mapping:
+        return self._compiled_theme.get(TSectionKeys.FONT).get(TSectionKeys.TOPLEVEL)
+    
+    
+    def get_root_widget_props(self) -> Mapping:
+        return self._compiled_theme.get(TSectionKeys.WIDGETS).get(TSectionKeys.ROOT)
+    
+    
+    def get_toplevel_widget_props(self) -> Mapping:
+        return self._compiled_theme.get(TSectionKeys.WIDGETS).get(TSectionKeys.TOPLEVEL)
+    
+    
+    # helper methods below
+    
+    def _recompile_theme(self) -> None:
+        old_compiled_theme: Mapping = self._compiled_theme
+        self._compiled_theme = ThemeCompiler.compile_theme(self._pers_json_handler.get_data())
+        
+        if self._compiled_theme == old_compiled_theme:
+            return
+        
+        for listener in self._theme_listeners:
+            listener(old_compiled_theme, self._compiled_theme) # listeners only reconfigure what differs between both themes
\ No newline at end of file
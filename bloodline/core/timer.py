@@ -1,41 +1,122 @@
-from time import time
+from math import ceil
+from time import perf_counter_ns
+from typing import Callable, Tuple
 
-from infrastructure import MessageHub
+from .segment_table import SegmentTable
+from .session_journal import SessionJournal
+from .session_metrics import SessionMetrics
+from infrastructure import EventBus, LatencyMonitor, MessageHub, TimerTick, Topic
 from infrastructure.interfaces import IOverlay
+from schemas import TimerPrecision
 
 class Timer:
     
-    def __init__(self, overlay: IOverlay):
+    def __init__(self, overlay: IOverlay, precision: str = TimerPrecision.SECONDS, clock: Callable[[], int] = perf_counter_ns, journal: SessionJournal | None = None, segments: SegmentTable | None = None, metrics: SessionMetrics | None = None):
         self._overlay: IOverlay = overlay
+        self._journal: SessionJournal | None = journal
+        self._segments: SegmentTable = segments if segments is not None else SegmentTable()
+        self._metrics: SessionMetrics | None = metrics
+        self._clock: Callable[[], int] = clock # monotonic, so clock adjustments of the system do not affect the durations
         
         self._msg_provider: MessageHub = MessageHub()
         self._time_already_required: int | None = None
-        self._start_time: float | None = None
-        self._end_time: float | None = None
-        self._pause_time: float = 0.0
+        self._start_time: int | None = None
+        self._end_time: int | None = None
+        self._pause_time: int = 0
         self._total_time: int = 0
+        self._split_time: int = 0 # live time at the start of the current segment
         
         self._timer_active: bool = False
         self._timer_paused: bool = False
+        
+        self._precision: str = TimerPrecision.SECONDS
+        self._tick_ns: int = Timer._NS_PER_SECOND
+        self.set_precision(precision)
+        self._live_timer_session: int = 0 # invalidates the pending tick of a previous start
+        self._last_formated_time: str = ""
+        self._last_journal_tick: int = 0
+        self._last_segment_text: str = ""
+    
+    
+    _NS_PER_SECOND: int = 1_000_000_000
+    _NS_PER_MS: int = 1_000_000
+    _JOURNAL_TICK_NS: int = 5 * _NS_PER_SECOND # a running timer is journaled periodically, so a crash loses at most this much time
+    _TICKS_NS: dict = {
+        TimerPrecision.SECONDS: _NS_PER_SECOND,
+        TimerPrecision.TENTHS: _NS_PER_SECOND // 10,
+        TimerPrecision.HUNDREDTHS: _NS_PER_SECOND // 100
+    }
     
     
     def set_time_already_required(self, time: int | None) -> None:
+        self._last_formated_time = "" # a new session starts with a new overlay instance
+        self._last_segment_text = ""
+        
         if time is not None:
             self._time_already_required = time
-            self._overlay.update_timer_label(self._format_time(time))
+            self._update_timer_label(0)
+        
+        if self._metrics is not None:
+            self._metrics.restart()
+    
+    
+    def get_time_state(self) -> Tuple[int | None, int]:
+        return (self._time_already_required, self._calc_live_time())
+    
+    
+    def swap_time(self, time: int | None, live_time: int) -> None:
+        self._time_already_required = time
+        self._total_time = live_time
+        
+        if self._timer_active:
+            self._start_time = self._clock() # a running timer keeps running for the swapped in values
+            self._pause_time = self._start_time
+        
+        self._segments.end_attempt()
+        self._split_time = live_time
+        self._last_journal_tick = live_time // Timer._JOURNAL_TICK_NS
+        self._update_timer_label(live_time)
+        
+        if self._metrics is not None:
+            self._metrics.restart() # the attempts of the previous boss do not apply to the swapped in one
+    
+    
+    def swap_segments(self, segments: SegmentTable) -> None:
+        if self._last_segment_text and not segments.get_is_used():
+            self._overlay.update_segment_label("") # the segments of the previous boss do not apply to the swapped in one
+        
+        self._segments = segments
+        self._last_segment_text = ""
+    
+    
+    def restore_time(self, time: int | None) -> None:
+        self._time_already_required = time # the overlay is updated once a session continues
+    
+    
+    def set_precision(self, precision: str | None) -> None:
+        if precision not in Timer._TICKS_NS:
+            precision = TimerPrecision.SECONDS # a missing or unknown precision of a stale config must not break the live timer
+        
+        self._precision = precision
+        self._tick_ns = Timer._TICKS_NS.get(precision) # a running live timer switches the format with its next tick
     
     
     def start(self) -> None:
         if not self._timer_active:
-            self._start_time = time()
+            self._start_time = self._clock()
+            self._split_time = self._total_time
             self._timer_active = True
-            self._run_live_timer()
+            LatencyMonitor.mark("state")
+            self._live_timer_session += 1
+            self._record("timer_start", self._total_time)
+            self._run_live_timer(self._live_timer_session)
             self._msg_provider.invoke("The timer has started", "normal")
     
     
     def toggle_pause(self) -> None:
         if self._timer_active:
             self._timer_paused = not self._timer_paused
+            LatencyMonitor.mark("state")
             
             if self._timer_paused:
                 self._pause()
@@ -46,25 +127,64 @@ class Timer:
     
     
     def _pause(self) -> None:
-        self._pause_time = time()
+        self._pause_time = self._clock()
+        self._record("timer_pause", self._calc_live_time())
         self._msg_provider.invoke("The timer has been paused", "normal")
     
     
     def _resume(self) -> None:
-        self._start_time += time() - self._pause_time
+        self._start_time += self._clock() - self._pause_time
+        self._record("timer_resume", self._calc_live_time())
         self._msg_provider.invoke("The timer has been resumed", "normal")
     
     
+    def split(self) -> None:
+        if not self._timer_active or self._timer_paused:
+            self._msg_provider.invoke("The timer must be running to mark a split", "invalid")
+            return
+        
+        live_time: int = self._calc_live_time()
+        duration: int = (live_time - self._split_time) // Timer._NS_PER_MS
+        self._split_time = live_time
+        
+        segment_index: int = self._segments.get_segment_index()
+        best_duration: int | None = self._segments.get_best(segment_index) # compared before the new duration is added
+        average_duration: int | None = self._segments.get_average(segment_index)
+        
+        self._segments.add(duration)
+        LatencyMonitor.mark("state")
+        
+        if best_duration is None:
+            self._msg_provider.invoke(f"Segment {segment_index + 1}: {SegmentTable.format_duration(duration)}", "normal")
+        else:
+            self._msg_provider.invoke(
+                f"Segment {segment_index + 1}: {SegmentTable.format_duration(duration)} "
+                f"(best {Timer._format_delta(duration - best_duration)}, avg {Timer._format_delta(duration - average_duration)})", "normal"
+            )
+        self._update_segment_label(live_time)
+    
+    
+    def end_attempt(self) -> None:
+        self._segments.end_attempt()
+        self._split_time = self._calc_live_time() # the next attempt starts with the first segment
+        
+        if self._timer_active:
+            self._update_segment_label(self._split_time)
+    
+    
     def stop(self, hard_shutdown: bool = False) -> None:
         if not self._timer_active:
             return
         
         if self._timer_paused:
-            self._start_time += time() - self._pause_time
+            self._start_time += self._clock() - self._pause_time
         
-        self._end_time = time()
-        self._total_time += int(self._end_time - self._start_time)
+        self._end_time = self._clock()
+        self._total_time += self._end_time - self._start_time
         self._timer_active, self._timer_paused = False, False
+        LatencyMonitor.mark("state")
+        self._record("timer_stop", self._total_time)
+        self._segments.end_attempt()
         
         if hard_shutdown:
             self._msg_provider.invoke("The timer was stopped by the system to prevent data loss", "warning")
@@ -76,17 +196,26 @@ class Timer:
         if self._timer_active:
             self._msg_provider.invoke("The timer must first be stopped for the reset to work", "invalid")
             return
-        elif self.get_is_none():
+        elif self.get_is_none() and not hard_reset:
             return
         
         self._start_time, self._end_time = None, None
-        self._pause_time = 0.0
+        self._pause_time = 0
         self._total_time = 0
+        self._split_time = 0
+        self._last_journal_tick = 0
         self._timer_active, self._timer_paused = False, False
+        LatencyMonitor.mark("state")
         
         if hard_reset:
             self._time_already_required = None
+            self._segments.reset()
         else:
+            self._segments.end_attempt()
+            self._record("timer_reset", 0)
+            
+            if self._metrics is not None:
+                self._metrics.restart()
             self._msg_provider.invoke("The timer has been reset", "normal")
     
     
@@ -94,7 +223,8 @@ class Timer:
         if self.get_is_none() and self._time_already_required is None:
             return None # None if timer wasnt started -> req. time == N/A instead of 0
         
-        return self._total_time + (self._time_already_required if self._time_already_required is not None else 0)
+        # the sessions are summed up in ns and only rounded down once, so no fractions of a second get lost
+        return self._total_time // Timer._NS_PER_SECOND + (self._time_already_required if self._time_already_required is not None else 0)
     
     
     def check_timer_stopped(self) -> None:
@@ -108,31 +238,91 @@ class Timer:
     
     # overlay methods below
     
-    def _run_live_timer(self) -> None:
-        if not self._timer_active:
+    def _run_live_timer(self, live_timer_session: int) -> None:
+        if not self._timer_active or live_timer_session != self._live_timer_session:
             return
         
         live_time: int = self._calc_live_time()
-        formated_time: str = self._format_time(live_time)
-        self._overlay.update_timer_label(formated_time)
-        self._overlay.add_mainloop_task(1000, self._run_live_timer)
+        self._update_timer_label(live_time)
+        self._update_segment_label(live_time)
+        
+        if self._metrics is not None:
+            self._metrics.refresh() # only repaints the metrics whose displayed value changed
+        
+        if live_time // Timer._JOURNAL_TICK_NS != self._last_journal_tick:
+            self._last_journal_tick = live_time // Timer._JOURNAL_TICK_NS
+            self._record("timer_tick", live_time)
+        
+        # the next tick is scheduled for the next whole tick of the elapsed time instead of a fixed delay, so the display does not drift
+        next_tick_ms: int = ceil((self._tick_ns - live_time % self._tick_ns) / 1_000_000)
+        self._overlay.add_mainloop_task(next_tick_ms, lambda: self._run_live_timer(live_timer_session))
     
     
     def _calc_live_time(self) -> int:
-        current_time: float = time()
+        if self.get_is_none():
+            elapsed_time: int = 0
+        elif self._timer_paused:
+            elapsed_time: int = self._pause_time - self._start_time
+        elif self._timer_active:
+            elapsed_time: int = self._clock() - self._start_time
+        else:
+            elapsed_time: int = 0
+        return self._total_time + elapsed_time
+    
+    
+    def _update_timer_label(self, live_time: int) -> None:
+        formated_time: str = self._format_time(live_time + (self._time_already_required or 0) * Timer._NS_PER_SECOND)
         
-        if self._timer_paused:
-            elapsed_time: float = self._pause_time - self._start_time
+        if formated_time == self._last_formated_time:
+            return # most ticks of a lower precision do not change the text
+        
+        self._last_formated_time = formated_time
+        self._overlay.update_timer_label(formated_time)
+        
+        if EventBus.get_has_subscribers(Topic.TIMER_TICK):
+            EventBus.publish(Topic.TIMER_TICK, TimerTick(formated_time))
+    
+    
+    def _update_segment_label(self, live_time: int) -> None:
+        if not self._segments.get_is_used():
+            return # the overlay only shows segments once splits are used
+        
+        segment_index: int = self._segments.get_segment_index()
+        segment_time: int = (live_time - self._split_time) // Timer._NS_PER_MS
+        best_duration: int | None = self._segments.get_best(segment_index)
+        
+        if best_duration is None:
+            segment_text: str = f"S{segment_index + 1} {SegmentTable.format_duration(segment_time)}"
         else:
-            elapsed_time: float = current_time - self._start_time
-        return self._total_time + int(elapsed_time) + (self._time_already_required if self._time_already_required is not None else 0)
+            segment_text: str = f"S{segment_index + 1} {Timer._format_delta(segment_time - best_duration)}"
+        
+        if segment_text == self._last_segment_text:
+            return
+        
+        self._last_segment_text = segment_text
+        self._overlay.update_segment_label(segment_text)
     
     
     # helper methods below
     
+    def _record(self, event: str, elapsed_time: int) -> None:
+        if self._journal is not None:
+            self._journal.record(event, elapsed_ns=elapsed_time)
+    
+    
+    def _format_time(self, time: int) -> str:
+        total_seconds, fraction = divmod(time, Timer._NS_PER_SECOND)
+        seconds: int = total_seconds % 60
+        minutes: int = total_seconds // 60 % 60
+        hours: int = total_seconds // 3600
+        
+        if self._precision == TimerPrecision.TENTHS:
+            return f"{hours:02}:{minutes:02}:{seconds:02}.{fraction // self._tick_ns}"
+        if self._precision == TimerPrecision.HUNDREDTHS:
+            return f"{hours:02}:{minutes:02}:{seconds:02}.{fraction // self._tick_ns:02}"
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+    
+    
     @staticmethod
-    def _format_time(time: int) -> str:
-        seconds: int = time % 60
-        minutes: int = int(time / 60) % 60
-        hours: int = int(time / 3600)
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
\ No newline at end of file
+    def _format_delta(delta: int) -> str:
+        return f"{"+" if delta >= 0 else "-"}{abs(delta) / 1000:.1f}"
\ No newline at end of file
@@ -3,10 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import override
 
+from file_io import SettingsDbHandler
 from file_io.json import PersistentJsonHandler
 from infrastructure import Directory
 from infrastructure.interfaces import IWindowManager
-from schemas import WindowModel, WSectionKeys, WindowKeys
+from schemas import WindowModel, WSectionKeys, WindowKeys, TimerPrecision
 
 class WindowManager(IWindowManager):
     
@@ -17,10 +18,11 @@ class WindowManager(IWindowManager):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             
-            cls._instance._pers_json_handler = PersistentJsonHandler(
+            cls._instance._pers_json_handler = SettingsDbHandler.create(
                 main_file_path=cls._instance._STATE_FILE_PATH,
                 backup_file_path=cls._instance._BACKUP_FILE_PATH,
-                default_data=WindowModel()
+                default_data=WindowModel(),
+                write_behind=True
             )
             cls._instance._pers_json_handler.load_data()
         return cls._instance
@@ -46,6 +48,23 @@ class WindowManager(IWindowManager):
         return True
     
     
+    @override
+    def get_timer_precision(self) -> str:
+        return self._pers_json_handler.get_data().get(WSectionKeys.TOPLEVEL).get(WindowKeys.TIMER_PRECISION, TimerPrecision.SECONDS.value)
+    
+    
+    @override
+    def set_timer_precision(self, new_precision: str) -> bool:
+        window_state: dict = self._pers_json_handler.get_data()
+        
+        if new_precision == window_state.get(WSectionKeys.TOPLEVEL).get(WindowKeys.TIMER_PRECISION):
+            return False
+        window_state[WSectionKeys.TOPLEVEL][WindowKeys.TIMER_PRECISION] = new_precision
+        
+        self._pers_json_handler.set_data(window_state)
+        return True
+    
+    
     def get_root_props(self) -> dict:
         return self._pers_json_handler.get_data().get(WSectionKeys.ROOT)
     
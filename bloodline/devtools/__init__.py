@@ -0,0 +1,3 @@
+from .fake_clock import FakeClock
+from .key_event_injector import KeyEventInjector
+from .recording_overlay import RecordingOverlay
\ No newline at end of file
@@ -0,0 +1,16 @@
+class FakeClock:
+    
+    def __init__(self, start_ns: int = 0):
+        self._now_ns: int = start_ns
+    
+    
+    def __call__(self) -> int:
+        return self._now_ns # has the signature of perf_counter_ns, so it can replace it wherever a clock is injected
+    
+    
+    def advance(self, duration_ns: int) -> None:
+        self._now_ns += duration_ns
+    
+    
+    def advance_ms(self, duration_ms: float) -> None:
+        self.advance(int(duration_ms * 1_000_000))
\ No newline at end of file
@@ -0,0 +1,89 @@
+from argparse import ArgumentParser, Namespace
+from os import environ
+from time import perf_counter_ns
+from typing import List
+
+from .fake_clock import FakeClock
+from .key_event_injector import KeyEventInjector
+from .recording_overlay import RecordingOverlay
+from core.counter import Counter
+from core.hotkey_manager import HotkeyManager
+from core.key_listener import KeyListener
+from core.timer import Timer
+from infrastructure import Directory, MessageHub
+from infrastructure.latency_histogram import LatencyHistogram
+from schemas import HotkeyNames
+
+class HotkeyBenchmark:
+    
+    def __init__(self, event_count: int, batch_size: int):
+        self._event_count: int = event_count
+        self._batch_size: int = batch_size
+        
+        self._clock: FakeClock = FakeClock(perf_counter_ns())
+        self._injector: KeyEventInjector = KeyEventInjector()
+        self._overlay: RecordingOverlay = RecordingOverlay(self._clock)
+        self._counter: Counter = Counter(self._overlay)
+        self._key_listener: KeyListener = KeyListener(
+            hk_manager=HotkeyManager(),
+            counter=self._counter,
+            timer=Timer(self._overlay),
+            overlay=self._overlay,
+            listener_factory=self._injector.create_listener,
+            clock=self._clock
+        )
+    
+    
+    _PRESS_INTERVAL_MS: float = 100.0 # simulated time between two presses, longer than any debounce interval
+    
+    
+    def run(self) -> None:
+        keybind: str = HotkeyManager().get_current_hotkeys().get(HotkeyNames.COUNTER_INC)
+        press_times: List[int] = []
+        
+        self._key_listener.start_key_listener()
+        start_ns: int = perf_counter_ns()
+        
+        for event_index in range(1, self._event_count + 1):
+            press_times.append(perf_counter_ns())
+            self._injector.tap(keybind)
+            self._clock.advance_ms(HotkeyBenchmark._PRESS_INTERVAL_MS)
+            
+            if event_index % self._batch_size == 0:
+                self._overlay.run_pending_tasks() # one mainloop iteration drains the whole batch
+        self._overlay.run_pending_tasks()
+        
+        duration_ns: int = perf_counter_ns() - start_ns
+        self._print_results(press_times, duration_ns)
+    
+    
+    # helper methods below
+    
+    def _print_results(self, press_times: List[int], duration_ns: int) -> None:
+        latency_histogram: LatencyHistogram = LatencyHistogram()
+        
+        for press_time, (update_time, _) in zip(press_times, self._overlay.get_counter_updates()):
+            latency_histogram.record(update_time - press_time)
+        
+        print(f"events: {self._event_count} (batch size {self._batch_size}), applied: {self._counter.get_count() or 0}")
+        print(f"throughput: {self._event_count / (duration_ns / 1_000_000_000):,.0f} events/s")
+        print(
+            f"press to overlay update: p50 {latency_histogram.get_percentile(50) / 1000:.1f} µs | "
+            f"p99 {latency_histogram.get_percentile(99) / 1000:.1f} µs | max {latency_histogram.get_max() / 1000:.1f} µs"
+        )
+
+
+def _parse_args() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog="hotkey_benchmark")
+    parser.add_argument("--events", type=int, default=10_000, help="number of injected counter presses")
+    parser.add_argument("--batch-size", type=int, default=1, help="number of presses that are queued before the simulated mainloop drains them")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args: Namespace = _parse_args()
+    environ.setdefault("PYNPUT_BACKEND", "dummy") # no display or input device is needed, pynput is imported lazily
+    
+    Directory.create_data_dirs()
+    MessageHub.link_callback(lambda text, text_type, optional_arg: None)
+    HotkeyBenchmark(args.events, args.batch_size).run()
\ No newline at end of file
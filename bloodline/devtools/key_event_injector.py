@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Callable, List, TYPE_CHECKING
+
+from schemas import ValidationPattern
+
+if TYPE_CHECKING:
+    from pynput.keyboard import Key, KeyCode
+
+class _SyntheticKey:
+    
+    def __init__(self, key_name: str):
+        self._key_name: str = key_name
+    
+    
+    def __str__(self) -> str:
+        return self._key_name
+
+
+class KeyEventInjector:
+    
+    def __init__(self):
+        self._on_press: Callable[[Key | KeyCode], None] | None = None
+        self._on_release: Callable[[Key | KeyCode], None] | None = None
+        self._is_running: bool = False
+    
+    
+    _MODIFIER_KEYS: dict = {"ctrl": "ctrl_l", "alt": "alt_l", "cmd": "cmd"}
+    
+    
+    def create_listener(self, on_press: Callable[[Key | KeyCode], None], on_release: Callable[[Key | KeyCode], None]) -> KeyEventInjector:
+        # replaces the pynput listener factory, the key listener then receives the injected events instead of the os hook
+        self._on_press = on_press
+        self._on_release = on_release
+        return self
+    
+    
+    def start(self) -> None:
+        self._is_running = True
+    
+    
+    def stop(self) -> None:
+        self._is_running = False
+    
+    
+    def press(self, key: Key | KeyCode) -> None:
+        if self._is_running:
+            self._on_press(key)
+    
+    
+    def release(self, key: Key | KeyCode) -> None:
+        if self._is_running:
+            self._on_release(key)
+    
+    
+    def tap(self, keybind: str) -> None:
+        keys: List[Key | KeyCode] = KeyEventInjector.get_keys(keybind)
+        
+        for key in keys:
+            self.press(key)
+        for key in reversed(keys):
+            self.release(key)
+    
+    
+    @classmethod
+    def get_keys(cls, keybind: str) -> List[Key | KeyCode]:
+        modifiers, key_name = ValidationPattern.split_keybind(keybind)
+        return [cls._get_key(f"Key.{cls._MODIFIER_KEYS.get(modifier)}") for modifier in modifiers] + [cls._get_key(key_name)]
+    
+    
+    # helper methods below
+    
+    @staticmethod
+    def _get_key(key_name: str) -> Key | KeyCode | _SyntheticKey:
+        from pynput.keyboard import Key, KeyCode
+        
+        if not key_name.startswith("Key."):
+            return KeyCode.from_char(key_name)
+        
+        key: Key = Key[key_name.removeprefix("Key.")]
+        
+        if str(key) != key_name:
+            return _SyntheticKey(key_name) # backends without a keyboard, e.g. the dummy backend, map every special key to the same member
+        return key
\ No newline at end of file
@@ -0,0 +1,100 @@
+from heapq import heappop, heappush
+from itertools import count
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, List, Tuple, override
+
+from infrastructure.interfaces import IOverlay
+
+class RecordingOverlay(IOverlay):
+    
+    def __init__(self, clock: Callable[[], int]):
+        self._clock: Callable[[], int] = clock
+        
+        self._tasks: List[Tuple[int, int, Any]] = [] # (due time, insertion order, task) like the tk after queue
+        self._task_order: Iterator[int] = count()
+        self._is_created: bool = False
+        
+        self._counter_updates: List[Tuple[int, int]] = [] # (perf_counter_ns, count)
+        self._timer_updates: List[Tuple[int, str]] = [] # (perf_counter_ns, formated time)
+        self._segment_updates: List[Tuple[int, str]] = [] # (perf_counter_ns, segment text)
+        self._slot_updates: List[Tuple[int, str]] = [] # (perf_counter_ns, slot text)
+        self._metrics_updates: List[Tuple[int, str]] = [] # (perf_counter_ns, metrics text)
+    
+    
+    @override
+    def update_counter_label(self, count: int) -> None:
+        self._counter_updates.append((perf_counter_ns(), count)) # the real clock, so latencies stay measurable with a fake clock
+    
+    
+    @override
+    def update_timer_label(self, formated_time: str) -> None:
+        self._timer_updates.append((perf_counter_ns(), formated_time))
+    
+    
+    @override
+    def update_segment_label(self, segment_text: str) -> None:
+        self._segment_updates.append((perf_counter_ns(), segment_text))
+    
+    
+    @override
+    def update_slot_label(self, slot_text: str) -> None:
+        self._slot_updates.append((perf_counter_ns(), slot_text))
+    
+    
+    @override
+    def update_metrics_label(self, metrics_text: str) -> None:
+        self._metrics_updates.append((perf_counter_ns(), metrics_text))
+    
+    
+    @override
+    def add_mainloop_task(self, delay: int, task: Any) -> None:
+        heappush(self._tasks, (self._clock() + delay * 1_000_000, next(self._task_order), task))
+    
+    
+    @override
+    def display_lock_animation(self, animation_time: int, lock_state: bool) -> None:
+        pass
+    
+    
+    @override
+    def create_instance(self) -> None:
+        self._is_created = True
+    
+    
+    @override
+    def destroy_instance(self) -> None:
+        self._is_created = False
+    
+    
+    def get_counter_updates(self) -> List[Tuple[int, int]]:
+        return self._counter_updates
+    
+    
+    def get_timer_updates(self) -> List[Tuple[int, str]]:
+        return self._timer_updates
+    
+    
+    def get_segment_updates(self) -> List[Tuple[int, str]]:
+        return self._segment_updates
+    
+    
+    def get_slot_updates(self) -> List[Tuple[int, str]]:
+        return self._slot_updates
+    
+    
+    def get_metrics_updates(self) -> List[Tuple[int, str]]:
+        return self._metrics_updates
+    
+    
+    def get_is_created(self) -> bool:
+        return self._is_created
+    
+    
+    def run_pending_tasks(self) -> int:
+        executed_tasks: int = 0
+        
+        # tasks that are scheduled while running are executed as well if they are already due
+        while self._tasks and self._tasks[0][0] <= self._clock():
+            heappop(self._tasks)[2]()
+            executed_tasks += 1
+        return executed_tasks
\ No newline at end of file
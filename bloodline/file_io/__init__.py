@@ -1,2 +1,5 @@
 from .csv_file_operations import CsvFileOperations
-from .db_handler import DatabaseHandler
\ No newline at end of file
+from .db_handler import DatabaseHandler
+from .history_file_operations import HistoryFileOperations
+from .journal_file_operations import JournalFileOperations
+from .settings_db_handler import SettingsDbHandler
\ No newline at end of file
@@ -1,18 +1,19 @@
 from pathlib import Path
 from shutil import copy2
 from sqlite3 import Connection, Cursor, connect, DatabaseError
-from typing import Any, Callable, List
+from typing import Any, Callable, Iterable, List
 
-from infrastructure import MessageHub
+from infrastructure import DbWrite, EventBus, MessageHub, StartupTracer, Topic
 
 class DatabaseHandler:
     
-    def __init__(self, db_file_path: Path, backup_file_path: Path, latest_version: int, db_structure: str, db_updates: Callable):
+    def __init__(self, db_file_path: Path, backup_file_path: Path, latest_version: int, db_structure: str, db_updates: Callable, check_same_thread: bool = True):
         self._db_file_path: Path = db_file_path
         self._backup_file_path: Path = backup_file_path
         self._latest_version: int = latest_version
         self._db_structure: str = db_structure
         self._db_updates: Callable = db_updates
+        self._check_same_thread: bool = check_same_thread
         
         self._db_file_name: str = db_file_path.name
         self._backup_file_name: str = backup_file_path.name
@@ -21,7 +22,8 @@ class DatabaseHandler:
         self._conn: Connection | None = None
         self._cursor: Cursor | None = None
         
-        self._setup_files()
+        with StartupTracer.phase(f"setup {self._db_file_name}"):
+            self._setup_files()
     
     
     def _setup_files(self) -> None:
@@ -47,8 +49,29 @@ class DatabaseHandler:
     
     
     def execute_dml(self, sql: str, *params: Any) -> None:
-        self._cursor.execute(sql, params)
-        self._conn.commit()
+        try:
+            self._cursor.execute(sql, params)
+            self._conn.commit() # also commits the rows of a previous uncommitted execute_many_dml
+        except Exception:
+            self.rollback()
+            raise
+        self._publish_write()
+    
+    
+    def execute_many_dml(self, sql: str, params: Iterable[tuple], commit: bool = True) -> None:
+        try:
+            self._cursor.executemany(sql, params) # all rows are written within one transaction
+            
+            if commit:
+                self._conn.commit()
+        except Exception:
+            self.rollback()
+            raise
+        self._publish_write()
+    
+    
+    def rollback(self) -> None:
+        self._conn.rollback() # a failed statement never leaves a partial transaction behind to be committed by the next one
     
     
     def fetch(self, sql: str, *params: Any) -> List[tuple]:
@@ -68,6 +91,11 @@ class DatabaseHandler:
             self._reinitialize_backup_file()
     
     
+    def set_version(self, version: int) -> None:
+        self._cursor.execute(f"PRAGMA user_version = {version}")
+        self._conn.commit()
+    
+    
     def close_connection(self) -> None:
         if self._conn:
             self._conn.close()
@@ -77,8 +105,13 @@ class DatabaseHandler:
     
     # helper methods below
     
+    def _publish_write(self) -> None:
+        if EventBus.get_has_subscribers(Topic.DB_WRITE):
+            EventBus.publish(Topic.DB_WRITE, DbWrite(self._db_file_name, self._cursor.rowcount))
+    
+    
     def _open_connection(self) -> None:
-        self._conn = connect(self._db_file_path)
+        self._conn = connect(self._db_file_path, check_same_thread=self._check_same_thread)
         self._conn.execute("PRAGMA foreign_keys = ON") # activates foreign key restriction
         self._cursor = self._conn.cursor()
     
@@ -101,14 +134,13 @@ class DatabaseHandler:
         curr_version: int = self._cursor.fetchone()[0]
         
         if not curr_version:
-            self._cursor.execute(f"PRAGMA user_version = {self._latest_version}")
-            self._conn.commit()
+            self.set_version(self._latest_version)
             return
         
         if curr_version == self._latest_version:
             return
         
-        self._db_updates(curr_version)
+        self._db_updates(self, curr_version) # the handler is passed, as the owner does not hold a reference to it yet
     
     
     def _handle_file_restore(self) -> None:
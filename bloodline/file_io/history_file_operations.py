@@ -0,0 +1,32 @@
+from os import replace
+from pathlib import Path
+from typing import Iterable, List
+
+class HistoryFileOperations:
+    
+    @staticmethod
+    def perform_load(src_file_path: Path) -> List[str]:
+        if not src_file_path.exists():
+            return []
+        
+        with open(src_file_path, "r", encoding="utf-8", errors="replace") as input:
+            lines: List[str] = input.read().split("\n") # splitlines would also split entries at e.g. "\x0c" or "\u2028", which are not line ends in this log
+        
+        if lines[-1] == "":
+            lines.pop() # the log ends with the newline of its last line
+        return lines
+    
+    
+    @staticmethod
+    def perform_append(dst_file_path: Path, line: str) -> None:
+        with open(dst_file_path, "a", encoding="utf-8") as output:
+            output.write(f"{line}\n")
+    
+    
+    @staticmethod
+    def perform_rewrite(dst_file_path: Path, lines: Iterable[str]) -> None:
+        tmp_file_path: Path = dst_file_path.with_name(f"{dst_file_path.name}.tmp")
+        
+        with open(tmp_file_path, "w", encoding="utf-8") as output:
+            output.writelines(f"{line}\n" for line in lines)
+        replace(tmp_file_path, dst_file_path) # the old log stays intact until the compacted one is complete
\ No newline at end of file
@@ -0,0 +1,36 @@
+from json import dumps, loads, JSONDecodeError
+from os import fsync
+from pathlib import Path
+from typing import List
+
+class JournalFileOperations:
+    
+    @staticmethod
+    def perform_load(src_file_path: Path) -> List[dict]:
+        if not src_file_path.exists():
+            return []
+        
+        entries: List[dict] = []
+        
+        with open(src_file_path, "r", encoding="utf-8", errors="replace") as input:
+            for line in input:
+                try:
+                    entries.append(loads(line))
+                except JSONDecodeError:
+                    break # a crash during a write can only tear the last entry
+        return entries
+    
+    
+    @staticmethod
+    def perform_append(dst_file_path: Path, entries: List[dict]) -> None:
+        with open(dst_file_path, "a", encoding="utf-8") as output:
+            output.writelines(f"{dumps(entry, separators=(",", ":"))}\n" for entry in entries)
+            output.flush()
+            fsync(output.fileno()) # one fsync commits the whole group of entries
+    
+    
+    @staticmethod
+    def perform_clear(dst_file_path: Path) -> None:
+        with open(dst_file_path, "w", encoding="utf-8") as output:
+            output.flush()
+            fsync(output.fileno())
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .external_json_handler import ExternalJsonHandler
 from .migration_json_handler import MigrationJsonHandler
-from .persistent_json_handler import PersistentJsonHandler
\ No newline at end of file
+from .persistent_json_handler import PersistentJsonHandler
+from .validation_cache import ValidationCache
\ No newline at end of file
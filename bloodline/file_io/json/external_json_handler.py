@@ -4,6 +4,7 @@ from pathlib import Path
 from pydantic import BaseModel, RootModel
 
 from .json_file_operations import JsonFileOperations
+from .validation_cache import ValidationCache
 from infrastructure import MessageHub
 
 class ExternalJsonHandler(JsonFileOperations):
@@ -12,9 +13,18 @@ class ExternalJsonHandler(JsonFileOperations):
     
     @classmethod
     def load_and_validate_data(cls, src_file_path: Path, model: BaseModel | RootModel, strict_load: bool = False, silent: bool = False) -> dict | None:
+        validated_model: BaseModel | RootModel | None = cls.load_and_validate_model(src_file_path, model, silent)
+        
+        if validated_model is None:
+            return None
+        return validated_model.model_dump(exclude_unset=strict_load)
+    
+    
+    @classmethod
+    def load_and_validate_model(cls, src_file_path: Path, model: BaseModel | RootModel, silent: bool = False) -> BaseModel | RootModel | None:
         try:
             raw_json: dict = super()._perform_load(src_file_path)
-            return model.model_validate(raw_json).model_dump(exclude_unset=strict_load)
+            return ValidationCache.validate(model, raw_json)
         except JSONDecodeError:
             if not silent:
                 cls._msg_provider.invoke(f"The file \"{src_file_path.name}\" is corrupted. Please make sure to check it", "error")
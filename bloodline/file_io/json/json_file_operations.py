@@ -1,4 +1,5 @@
-from json import load, dump
+from json import load, dumps
+from os import fsync, replace
 from pathlib import Path
 
 class JsonFileOperations:
@@ -16,7 +17,37 @@ class JsonFileOperations:
             return load(input)
     
     
+    @classmethod
+    def _perform_save(cls, dst_file_path: Path, data: dict) -> None:
+        cls._perform_write(dst_file_path, cls._serialize(data))
+    
+    
+    @staticmethod
+    def _serialize(data: dict) -> str:
+        return dumps(data, indent=4)
+    
+    
+    @staticmethod
+    def _perform_read(src_file_path: Path) -> str:
+        with open(src_file_path, "r") as input:
+            return input.read()
+    
+    
+    @staticmethod
+    def _perform_read_bytes(src_file_path: Path) -> bytes:
+        with open(src_file_path, "rb") as input:
+            return input.read()
+    
+    
     @staticmethod
-    def _perform_save(dst_file_path: Path, data: dict) -> None:
-        with open(dst_file_path, "w") as output:
-            dump(data, output, indent=4)
\ No newline at end of file
+    def _perform_write(dst_file_path: Path, serialized_data: str) -> None:
+        tmp_file_path: Path = dst_file_path.with_name(f"{dst_file_path.name}.tmp")
+        
+        try:
+            with open(tmp_file_path, "w", encoding="utf-8", newline="") as output: # the bytes on disk match the checksum of the text on every platform
+                output.write(serialized_data)
+                output.flush()
+                fsync(output.fileno())
+            replace(tmp_file_path, dst_file_path) # a crash mid-write can only leave the tmp file behind, never a truncated target
+        finally:
+            tmp_file_path.unlink(missing_ok=True) # only left over if the write failed before the replace
\ No newline at end of file
@@ -25,6 +25,17 @@ class MigrationJsonHandler(JsonFileOperations):
         super()._perform_save(dst_file_path, raw_data)
     
     
+    @classmethod
+    def load_marker(cls, src_file_path: Path) -> dict:
+        if not src_file_path.exists():
+            return {}
+        
+        try:
+            return super()._perform_load(src_file_path)
+        except JSONDecodeError:
+            return {} # a broken marker only leads to probing the legacy paths again
+    
+    
     # helper methods below
     
     @classmethod
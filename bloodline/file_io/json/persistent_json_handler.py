@@ -1,29 +1,63 @@
-from json import JSONDecodeError
+from __future__ import annotations
+
+from atexit import register
+from json import JSONDecodeError, loads
+from os import replace
 from pathlib import Path
 from shutil import copy2
+from threading import Lock, Timer
+from typing import List
 
 from pydantic import BaseModel
 
 from .json_file_operations import JsonFileOperations
-from infrastructure import MessageHub
+from .validation_cache import ValidationCache
+from infrastructure import MessageHub, StartupTracer
 
 class PersistentJsonHandler(JsonFileOperations):
     
-    def __init__(self, main_file_path: Path, backup_file_path: Path, default_data: BaseModel):
+    _write_behind_handlers: List[PersistentJsonHandler] = []
+    
+    def __init__(self, main_file_path: Path, backup_file_path: Path, default_data: BaseModel, write_behind: bool = False):
         self._main_file_path: Path = main_file_path
         self._backup_file_path: Path = backup_file_path
         self._default_data: BaseModel = default_data
-        self._data: dict = default_data.model_dump() # is initialized with the default to prevent empty value
+        self._data: dict = default_data.model_dump(by_alias=True) # is initialized with the default to prevent empty value
+        self._unparsed_data: bytes | None = None # verified file content that is only parsed once the data is used
         
+        self._checksum_file_path: Path = main_file_path.with_name(f"{main_file_path.name}.sha256")
         self._main_file_name: str = main_file_path.name
         self._backup_file_name: str = backup_file_path.name
         
         self._msg_provider: MessageHub = MessageHub()
+        self._created_defaults: bool = False
+        self._setup_write_behind_vars(write_behind)
+        
+        with StartupTracer.phase(f"setup {self._main_file_name}"):
+            self._setup_files()
+    
+    
+    _WRITE_DELAY_SECONDS: float = 0.5
+    
+    
+    def _setup_write_behind_vars(self, write_behind: bool) -> None:
+        self._write_behind: bool = write_behind
+        self._write_lock: Lock = Lock()
+        self._write_timer: Timer | None = None
+        self._persisted_snapshot: str | None = None # serialized data that is currently on disk
+        self._pending_snapshot: str | None = None
+        
+        if not write_behind:
+            return
         
-        self._setup_files()
+        if not PersistentJsonHandler._write_behind_handlers:
+            register(PersistentJsonHandler.flush_all) # pending writes are not lost on exit
+        PersistentJsonHandler._write_behind_handlers.append(self)
     
     
     def _setup_files(self) -> None:
+        self._remove_stale_tmp_files()
+        
         main_file_exists: bool = self._main_file_path.exists()
         backup_file_exists: bool = self._backup_file_path.exists()
         
@@ -31,6 +65,7 @@ class PersistentJsonHandler(JsonFileOperations):
             return
         
         if not main_file_exists and not backup_file_exists:
+            self._created_defaults = True
             self._create_main_file()
             self._ensure_backup()
             return
@@ -43,48 +78,144 @@ class PersistentJsonHandler(JsonFileOperations):
     
     
     def load_data(self) -> None:
-        try:
-            self._load_validate_and_synchronize()
-        except JSONDecodeError:
-            self._msg_provider.invoke(f"The file \"{self._main_file_name}\" is corrupted. An attempt is made to load the last backup", "error")
-            self._handle_file_restore()
+        with StartupTracer.phase(f"load {self._main_file_name}"):
+            try:
+                self._load_validate_and_synchronize()
+            except JSONDecodeError:
+                self._msg_provider.invoke(f"The file \"{self._main_file_name}\" is corrupted. An attempt is made to load the last backup", "error")
+                self._handle_file_restore()
+    
+    
+    def get_created_defaults(self) -> bool:
+        return self._created_defaults
     
     
     def get_data(self) -> dict:
+        if self._unparsed_data is not None:
+            self._data = loads(self._unparsed_data)
+            self._unparsed_data = None
         return self._data
     
     
     def set_data(self, new_data: dict) -> None:
         self._data = new_data
-        self._save_data()
-        self._ensure_backup()
+        self._unparsed_data = None
+        serialized_data: str = self._serialize(new_data) # taken right away, so later changes of the dict by the caller do not leak into the write
+        
+        with self._write_lock:
+            if serialized_data == self._persisted_snapshot:
+                self._pending_snapshot = None # no-op writes never touch the disk, even if they revert a pending change
+                return
+            self._pending_snapshot = serialized_data
+            
+            if self._write_behind:
+                # writes within the delay are coalesced into the one that is already scheduled
+                if self._write_timer is None:
+                    self._write_timer = Timer(PersistentJsonHandler._WRITE_DELAY_SECONDS, self.flush)
+                    self._write_timer.daemon = True
+                    self._write_timer.start()
+                return
+        
+        self.flush()
+    
+    
+    def flush(self) -> None:
+        with self._write_lock:
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+                self._write_timer = None
+            
+            if self._pending_snapshot is None:
+                return
+            
+            try:
+                self._write_main_file(self._pending_snapshot)
+                self._persisted_snapshot = self._pending_snapshot
+            except Exception as e:
+                self._msg_provider.invoke(
+                    f"An unexpected error occurred while saving the file \"{self._main_file_name}\".\n"
+                    f"Exception: {e}", "error"
+                )
+                return
+            finally:
+                self._pending_snapshot = None
+            
+            self._ensure_backup()
+    
+    
+    @classmethod
+    def flush_all(cls) -> None:
+        for pers_json_handler in cls._write_behind_handlers:
+            pers_json_handler.flush()
     
     
     # helper methods below
     
     def _save_data(self) -> None:
-        return self._perform_save(self._main_file_path, self._data)
+        serialized_data: str = self._serialize(self.get_data())
+        
+        with self._write_lock:
+            self._write_main_file(serialized_data)
+            self._persisted_snapshot = serialized_data
+            self._pending_snapshot = None
+    
+    
+    def _write_main_file(self, serialized_data: str) -> None:
+        self._perform_write(self._main_file_path, serialized_data)
+        self._perform_write(self._checksum_file_path, ValidationCache.get_cache_key(serialized_data, type(self._default_data)))
     
     
     def _load_validate_and_synchronize(self) -> None:
-        raw_json: dict = self._perform_load(self._main_file_path)
-        self._data = self._default_data.model_validate(raw_json).model_dump(by_alias=True)
-            
-        if raw_json != self._data: # data changed
-            self._save_data()
-            self._ensure_backup()
+        serialized_json: bytes = self._read_serialized_data()
+        
+        if ValidationCache.get_cache_key(serialized_json, type(self._default_data)) == self._read_checksum():
+            # the file was written by this handler and already validated against the same schema, so it is not even parsed yet
+            self._unparsed_data = serialized_json
+            self._persisted_snapshot = serialized_json.decode("utf-8")
+            return
+        
+        # a mismatch means the file was edited by hand or the schema changed, it is only restored if it can not be parsed anymore
+        raw_json: dict = loads(serialized_json)
+        self._unparsed_data = None
+        self._data = ValidationCache.validate(type(self._default_data), raw_json).model_dump(by_alias=True)
+        self._save_data() # stores the validated data together with its cache key
+        self._ensure_backup()
+    
+    
+    def _read_serialized_data(self) -> bytes:
+        return self._perform_read_bytes(self._main_file_path)
+    
+    
+    def _read_checksum(self) -> str | None:
+        try:
+            return self._perform_read(self._checksum_file_path).strip()
+        except OSError:
+            return None
     
     
     def _ensure_backup(self) -> None:
+        tmp_file_path: Path = self._backup_file_path.with_name(f"{self._backup_file_path.name}.tmp")
+        
         try:
-            copy2(self._main_file_path, self._backup_file_path)
+            copy2(self._main_file_path, tmp_file_path)
+            replace(tmp_file_path, self._backup_file_path) # the old backup stays intact until the copy is complete
         except Exception as e:
+            tmp_file_path.unlink(missing_ok=True)
             self._msg_provider.invoke(
                 f"An unexpected error occurred while loading the backup to the file \"{self._main_file_name}\".\n"
                 f"Exception: {e}", "error"
             )
     
     
+    def _remove_stale_tmp_files(self) -> None:
+        # a write that was interrupted by a crash leaves its tmp file next to the still intact target
+        for file_path in (self._main_file_path, self._checksum_file_path, self._backup_file_path):
+            try:
+                file_path.with_name(f"{file_path.name}.tmp").unlink(missing_ok=True)
+            except OSError:
+                pass # removed on the next start
+    
+    
     def _handle_file_restore(self) -> None:
         if not self._backup_file_path.exists():
             self._msg_provider.invoke("No backup could be found. Both files will be re-initialized", "error")
@@ -138,4 +269,5 @@ class PersistentJsonHandler(JsonFileOperations):
     
     
     def _set_default_value(self) -> None:
-        self._data: dict = self._default_data.model_dump()
\ No newline at end of file
+        self._data: dict = self._default_data.model_dump(by_alias=True)
+        self._unparsed_data = None
\ No newline at end of file
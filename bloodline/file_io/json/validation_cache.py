@@ -0,0 +1,40 @@
+from hashlib import sha256
+from json import dumps
+from typing import Dict
+
+from pydantic import BaseModel, TypeAdapter
+
+from infrastructure import Directory
+
+class ValidationCache:
+    
+    _type_adapters: Dict[type, TypeAdapter] = {}
+    _schema_keys: Dict[type, str] = {}
+    
+    @classmethod
+    def get_type_adapter(cls, model: type[BaseModel]) -> TypeAdapter:
+        if model not in cls._type_adapters:
+            cls._type_adapters[model] = TypeAdapter(model) # compiled once and shared by every handler of the same model
+        return cls._type_adapters[model]
+    
+    
+    @classmethod
+    def validate(cls, model: type[BaseModel], raw_data: dict) -> BaseModel:
+        return cls.get_type_adapter(model).validate_python(raw_data)
+    
+    
+    @classmethod
+    def get_cache_key(cls, serialized_data: str | bytes, model: type[BaseModel]) -> str:
+        raw_data: bytes = serialized_data.encode("utf-8") if isinstance(serialized_data, str) else serialized_data
+        return f"{sha256(raw_data).hexdigest()} {cls._get_schema_key(model)}"
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _get_schema_key(cls, model: type[BaseModel]) -> str:
+        if model not in cls._schema_keys:
+            # a new program version or any change of the schema, including nested models and defaults, invalidates every snapshot validated with the old one
+            schema_signature: str = dumps(model.model_json_schema(), sort_keys=True)
+            cls._schema_keys[model] = f"{model.__name__}@{Directory.get_version()}#{sha256(schema_signature.encode("utf-8")).hexdigest()[:12]}"
+        return cls._schema_keys[model]
\ No newline at end of file
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from atexit import register
+from json import JSONDecodeError, loads
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Tuple
+
+from pydantic import BaseModel
+
+from .db_handler import DatabaseHandler
+from .json import PersistentJsonHandler, ValidationCache
+from infrastructure import Directory
+
+class SettingsDbHandler(PersistentJsonHandler):
+    
+    _enabled: bool = False
+    _db_handler: DatabaseHandler | None = None
+    _db_lock: Lock = Lock()
+    _rows: Dict[str, Tuple[str, str | None]] = {} # setting key mapped to its serialized value and cache key
+    
+    def __init__(self, main_file_path: Path, backup_file_path: Path, default_data: BaseModel, write_behind: bool = False):
+        self._setting_key: str = main_file_path.name
+        super().__init__(main_file_path, backup_file_path, default_data, write_behind)
+    
+    
+    _DB_FILE: str = "settings.sqlite"
+    _BACKUP_FILE: str = f"{_DB_FILE}.bak"
+    _DB_FILE_PATH: Path = Directory.get_persistent_data_path() / _DB_FILE
+    _BACKUP_FILE_PATH: Path = Directory.get_backup_path() / _BACKUP_FILE
+    
+    _LATEST_VERSION: int = 1
+    _DB_STRUCTURE: str = """
+        CREATE TABLE IF NOT EXISTS Setting (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            cacheKey TEXT
+        );"""
+    
+    
+    @classmethod
+    def enable(cls) -> None:
+        cls._enabled = True
+    
+    
+    @classmethod
+    def get_enabled(cls) -> bool:
+        return cls._enabled or cls._DB_FILE_PATH.exists() # once created, the database stays the source of the settings
+    
+    
+    @classmethod
+    def create(cls, main_file_path: Path, backup_file_path: Path, default_data: BaseModel, write_behind: bool = False) -> PersistentJsonHandler:
+        handler_type: type[PersistentJsonHandler] = cls if cls.get_enabled() else PersistentJsonHandler
+        return handler_type(
+            main_file_path=main_file_path,
+            backup_file_path=backup_file_path,
+            default_data=default_data,
+            write_behind=write_behind
+        )
+    
+    
+    @classmethod
+    def close_db(cls) -> None:
+        PersistentJsonHandler.flush_all() # pending writes have to reach the database before it is closed
+        
+        with cls._db_lock:
+            if cls._db_handler is None:
+                return
+            
+            cls._db_handler.ensure_backup()
+            cls._db_handler.close_connection()
+            cls._db_handler = None
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _open_db(cls) -> None:
+        if cls._db_handler is not None:
+            return
+        
+        cls._db_handler = DatabaseHandler(
+            db_file_path=cls._DB_FILE_PATH,
+            backup_file_path=cls._BACKUP_FILE_PATH,
+            latest_version=cls._LATEST_VERSION,
+            db_structure=cls._DB_STRUCTURE,
+            db_updates=lambda db_handler, curr_version: None,
+            check_same_thread=False # write-behind handlers persist from their timer threads
+        )
+        
+        # every setting is read with a single query, later loads are served from memory
+        cls._rows = {key: (value, cache_key) for key, value, cache_key in cls._db_handler.fetch("SELECT key, value, cacheKey FROM Setting")}
+        register(cls.close_db)
+    
+    
+    @classmethod
+    def _write_row(cls, key: str, value: str, cache_key: str | None) -> None:
+        sql: str = """
+            INSERT INTO Setting (key, value, cacheKey)
+            VALUES (?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET value = excluded.value, cacheKey = excluded.cacheKey
+        """
+        
+        with cls._db_lock:
+            cls._db_handler.execute_dml(sql, key, value, cache_key) # commits the row as a single transaction
+            cls._rows[key] = (value, cache_key)
+    
+    
+    def _setup_files(self) -> None:
+        with SettingsDbHandler._db_lock:
+            SettingsDbHandler._open_db()
+        
+        if self._setting_key in SettingsDbHandler._rows:
+            return
+        
+        imported_json: str | None = self._read_legacy_json()
+        
+        if imported_json is None:
+            self._created_defaults = True
+            self._save_data()
+            return
+        
+        # the cache key is left empty, so the imported settings are validated on their first load
+        SettingsDbHandler._write_row(self._setting_key, imported_json, None)
+    
+    
+    def _read_legacy_json(self) -> str | None:
+        for json_file_path in (self._main_file_path, self._backup_file_path):
+            try:
+                serialized_json: str = self._perform_read(json_file_path)
+                loads(serialized_json)
+                return serialized_json
+            except (OSError, JSONDecodeError):
+                continue
+        return None
+    
+    
+    def _write_main_file(self, serialized_data: str) -> None:
+        SettingsDbHandler._write_row(self._setting_key, serialized_data, ValidationCache.get_cache_key(serialized_data, type(self._default_data)))
+    
+    
+    def _read_serialized_data(self) -> bytes:
+        return SettingsDbHandler._rows.get(self._setting_key)[0].encode("utf-8")
+    
+    
+    def _read_checksum(self) -> str | None:
+        return SettingsDbHandler._rows.get(self._setting_key)[1]
+    
+    
+    def _ensure_backup(self) -> None:
+        pass # the whole database is backed up once when it is closed
+    
+    
+    def _handle_file_restore(self) -> None:
+        self._msg_provider.invoke(f"The stored settings of \"{self._setting_key}\" are corrupted. They will be re-initialized", "error")
+        self._set_default_value()
+        self._save_data()
\ No newline at end of file
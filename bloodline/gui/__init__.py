@@ -1,3 +1 @@
-from .console import Application
-from .theme_manager import ThemeManager
-from .window_manager import WindowManager
\ No newline at end of file
+from .console import Application
\ No newline at end of file
@@ -1,54 +1,83 @@
 from datetime import datetime
 from inspect import signature, Signature
-from tkinter import Tk, Frame, Label, Entry, StringVar, Event
-from tkinter.font import Font, families, nametofont
+from sys import stderr
+from tkinter import Tk, Frame, Label, Entry, StringVar, Event, TclError
+from tkinter.font import Font
 from tkinter.scrolledtext import ScrolledText
-from typing import List, Callable, override
+from typing import List, Callable, Mapping, Set, override
 
 from .overlay import Overlay
 from .shell_mechanics import ShellMechanics
-from .theme_manager import ThemeManager
-from .window_manager import WindowManager
-from core import CommandManager
-from infrastructure import Directory, MessageHub, MigrationPipeline
+from .font_registry import FontRegistry
+from .theme_watcher import ThemeWatcher
+from core import CommandManager, ThemeCompiler, ThemeManager, WindowManager
+from infrastructure import Directory, MessageHub, MigrationPipeline, StartupTracer
 from infrastructure.interfaces import IConsole
 from schemas import WindowKeys, ColorKeys, FontKeys, WidgetKeys
 from services import UpdateService, WebManager
 
 class Application(IConsole):
     
-    MigrationPipeline.run_all_migrations()
-    
-    def __init__(self):
+    def __init__(self, watch_theme: bool = False):
+        Directory.create_data_dirs()
+        with StartupTracer.phase("migrations"):
+            MigrationPipeline.run_all_migrations() # legacy files have to be migrated before any of them is loaded
+        
         self._msg_provider: MessageHub = MessageHub()
         self._theme_manager: ThemeManager = ThemeManager()
         self._window_manager: WindowManager = WindowManager()
         self._setup_config_vars()
         
-        self._root: Tk = Tk()
-        self._setup_window()
-        self._setup_entry_callback()
-        self._setup_ui_elements()
-        self._setup_font()
+        with StartupTracer.phase("tk window"):
+            self._root: Tk = Tk()
+            self._setup_window()
+            self._setup_entry_callback()
+            self._setup_ui_elements()
+        with StartupTracer.phase("font resolution"):
+            self._setup_font()
         self._setup_console_tags()
         self._setup_text_config()
         
         self._print_output(Application._META, "normal")
-        self._msg_provider.link_callback(self._print_output) # also iterates over the msg buffer to prevent the texts from being displayed in the wrong order
+        self._msg_provider.link_callback(self._print_output, self._wake_message_drain) # also iterates over the msg buffer to prevent the texts from being displayed in the wrong order
         
-        self._cmd_manager: CommandManager = CommandManager(
-            console=self,
-            overlay=Overlay(),
-            theme_manager=self._theme_manager,
-            window_manager=self._window_manager
-        )
+        with StartupTracer.phase("command manager"):
+            self._overlay: Overlay = Overlay()
+            self._cmd_manager: CommandManager = CommandManager(
+                console=self,
+                overlay=self._overlay,
+                theme_manager=self._theme_manager,
+                window_manager=self._window_manager
+            )
         self._shell_mechanics: ShellMechanics = ShellMechanics(self._cmd_manager.get_list_of_commands)
         self._setup_bindings()
-        UpdateService(request_interval_minutes=60.0).check_for_update()
+        self._setup_theme_updates(watch_theme)
+        
+        with StartupTracer.phase("first paint"):
+            self._root.update() # paints the first frame before the deferred startup work is done
+        self._report_first_prompt()
+        self._root.after_idle(self._run_deferred_startup)
     
 
+    _FIRST_PROMPT_TARGET_MS: float = 250.0
+    _TAG_COLORS: dict = {
+        "normal": {"foreground": ColorKeys.NORMAL},
+        "list": {"foreground": ColorKeys.NORMAL},
+        "command": {"foreground": ColorKeys.COMMAND},
+        "success": {"foreground": ColorKeys.SUCCESS},
+        "invalid": {"foreground": ColorKeys.INVALID},
+        "note": {"foreground": ColorKeys.NOTE},
+        "warning": {"foreground": ColorKeys.WARNING},
+        "error": {"foreground": ColorKeys.ERROR},
+        "hyperlink": {"foreground": ColorKeys.HYPERLINK},
+        
+        # special tags
+        "preview_command": {"foreground": ColorKeys.COMMAND},
+        "preview_selection": {"foreground": ColorKeys.NORMAL, "background": ColorKeys.SELECTION}
+    }
     _CURSOR_UNFOCUSED: str = "_"
     _PREFIX: chr = ">"
+    _MODIFIER_KEYSYMS: set = {"Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R", "Caps_Lock"}
     _META: str = (
         f"{Directory.get_app_name()} {Directory.get_version()}\n"
         f"By {Directory.get_author()}\n"
@@ -70,9 +99,9 @@ class Application(IConsole):
     
     def _setup_config_vars(self) -> None:
         self._root_props: dict = self._window_manager.get_root_props()
-        self._colors: dict = self._theme_manager.get_colors()
-        self._font_props: dict = self._theme_manager.get_root_font_props()
-        self._widget_props: dict = self._theme_manager.get_root_widget_props()
+        self._colors: Mapping = self._theme_manager.get_colors()
+        self._font_props: Mapping = self._theme_manager.get_root_font_props()
+        self._widget_props: Mapping = self._theme_manager.get_root_widget_props()
     
     
     def _setup_window(self) -> None:
@@ -145,14 +174,9 @@ class Application(IConsole):
     def _setup_font(self) -> None:
         desired_font_family: str = self._font_props.get(FontKeys.FAMILY)
         
-        if desired_font_family in families():
-            font_to_use: Font = Font(
-                                    family=desired_font_family,
-                                    size=self._font_props.get(FontKeys.SIZE),
-                                    weight="normal"
-                                )
-        else:
-            font_to_use: Font = nametofont("TkFixedFont")
+        font_to_use: Font = FontRegistry.get_font(desired_font_family, self._font_props.get(FontKeys.SIZE))
+        
+        if not FontRegistry.has_family(desired_font_family):
             self._msg_provider.invoke(f"The font \"{desired_font_family}\" could not be found on this system. The Tkinters default will be restored", "warning")
             self._msg_provider.invoke(
                 "Make sure to select an already installed font using the 'setup import theme' command.\n"
@@ -167,19 +191,9 @@ class Application(IConsole):
     
     
     def _setup_console_tags(self) -> None:
-        self._console.tag_config("normal", foreground=self._colors.get(ColorKeys.NORMAL))
-        self._console.tag_config("list", foreground=self._colors.get(ColorKeys.NORMAL), lmargin1=self._char_width_in_px * 4, lmargin2=self._char_width_in_px * 9)
-        self._console.tag_config("command", foreground=self._colors.get(ColorKeys.COMMAND))
-        self._console.tag_config("success", foreground=self._colors.get(ColorKeys.SUCCESS))
-        self._console.tag_config("invalid", foreground=self._colors.get(ColorKeys.INVALID))
-        self._console.tag_config("note", foreground=self._colors.get(ColorKeys.NOTE))
-        self._console.tag_config("warning", foreground=self._colors.get(ColorKeys.WARNING))
-        self._console.tag_config("error", foreground=self._colors.get(ColorKeys.ERROR))
-        self._console.tag_config("hyperlink", foreground=self._colors.get(ColorKeys.HYPERLINK), underline=True)
-        
-        # special tags
-        self._console.tag_config("preview_command", foreground=self._colors.get(ColorKeys.COMMAND))
-        self._console.tag_config("preview_selection", foreground=self._colors.get(ColorKeys.NORMAL), background=self._colors.get(ColorKeys.SELECTION))
+        self._apply_tag_colors(set(ColorKeys))
+        self._apply_list_margins()
+        self._console.tag_config("hyperlink", underline=True)
     
     
     def _setup_text_config(self) -> None:
@@ -209,11 +223,43 @@ class Application(IConsole):
         self._input_entry.bind("<FocusIn>", self._on_focus_in)
         self._input_entry.bind("<FocusOut>", self._on_focus_out)
         
-        self._input_entry.bind("<Return>", lambda event: self._cmd_manager.process_input(self._input_entry.get().strip()))
+        self._input_entry.bind("<Return>", lambda event: self._run_after_search(lambda input_entry: self._cmd_manager.process_input(input_entry.get().strip())))
         
-        self._input_entry.bind("<Tab>", lambda event: self._shell_mechanics.auto_complete(self._input_entry))
-        self._input_entry.bind("<Up>", lambda event: self._shell_mechanics.get_last_input(self._input_entry))
-        self._input_entry.bind("<Down>", lambda event: self._shell_mechanics.get_prev_input(self._input_entry))
+        self._input_entry.bind("<Tab>", lambda event: self._run_after_search(self._shell_mechanics.auto_complete))
+        self._input_entry.bind("<Up>", lambda event: self._run_after_search(self._shell_mechanics.get_last_input))
+        self._input_entry.bind("<Down>", lambda event: self._run_after_search(self._shell_mechanics.get_prev_input))
+        
+        self._input_entry.bind("<Control-r>", self._on_reverse_search)
+        self._input_entry.bind("<Control-g>", self._on_cancel_search)
+        self._input_entry.bind("<Escape>", self._on_cancel_search)
+        self._input_entry.bind("<KeyPress>", self._on_search_key)
+    
+    
+    def _setup_theme_updates(self, watch_theme: bool) -> None:
+        self._theme_manager.add_theme_listener(self._on_theme_change)
+        
+        if watch_theme:
+            ThemeWatcher(self._root, self._theme_manager).start()
+    
+    
+    def _run_deferred_startup(self) -> None:
+        with StartupTracer.phase("command warm-up"):
+            self._cmd_manager.warm_up()
+        with StartupTracer.phase("overlay"):
+            self._overlay.prewarm() # built hidden, so tracking sessions only have to show it
+        with StartupTracer.phase("keyboard hook"):
+            self._cmd_manager.install_key_listener() # installed after the first frame so tracking sessions start without hook latency
+        with StartupTracer.phase("update service"):
+            UpdateService(request_interval_minutes=60.0).check_for_update()
+        StartupTracer.finish()
+    
+    
+    def _report_first_prompt(self) -> None:
+        first_prompt_ms: float = StartupTracer.get_elapsed_ms()
+        StartupTracer.mark("first prompt")
+        
+        if first_prompt_ms > Application._FIRST_PROMPT_TARGET_MS:
+            print(f"The time to the first prompt was {first_prompt_ms:.0f} ms and exceeded the target of {Application._FIRST_PROMPT_TARGET_MS:.0f} ms", file=stderr)
     
     
     def _on_close(self) -> None:
@@ -239,10 +285,60 @@ class Application(IConsole):
     
     
     def _on_focus_out(self, event: Event) -> None:
+        self._end_reverse_search()
         entry_var_input: str = self._entry_var.get() + Application._CURSOR_UNFOCUSED
         self._entry_var.set(entry_var_input)
     
     
+    def _on_reverse_search(self, event: Event) -> str:
+        search_prompt: str = self._shell_mechanics.reverse_search(self._input_entry)
+        self._input_prefix.config(text=search_prompt)
+        return "break" # prevents the default binding from being executed
+    
+    
+    def _on_cancel_search(self, event: Event) -> str | None:
+        if not self._shell_mechanics.get_search_active():
+            return None
+        
+        self._shell_mechanics.cancel_search(self._input_entry)
+        self._input_prefix.config(text=Application._PREFIX)
+        return "break"
+    
+    
+    def _on_search_key(self, event: Event) -> str | None:
+        if not self._shell_mechanics.get_search_active():
+            return None
+        
+        if event.keysym == "BackSpace":
+            search_prompt: str = self._shell_mechanics.shorten_search_query(self._input_entry)
+        elif len(event.char) == 1 and event.char.isprintable():
+            search_prompt: str = self._shell_mechanics.extend_search_query(event.char, self._input_entry)
+        elif event.keysym in Application._MODIFIER_KEYSYMS:
+            return "break" # pressing a modifier alone does not end the search
+        else:
+            self._end_reverse_search()
+            return None
+        
+        self._input_prefix.config(text=search_prompt)
+        return "break"
+    
+    
+    def _on_theme_change(self, old_theme: Mapping, new_theme: Mapping) -> None:
+        old_colors, old_font_props, old_widget_props = self._colors, self._font_props, self._widget_props
+        self._setup_config_vars()
+        
+        changed_colors: Set[str] = ThemeCompiler.get_changed_keys(old_colors, self._colors)
+        
+        if changed_colors:
+            self._apply_widget_colors(changed_colors)
+            self._apply_tag_colors(changed_colors)
+        if ThemeCompiler.get_changed_keys(old_font_props, self._font_props):
+            self._setup_font()
+            self._apply_list_margins() # the margins depend on the character width
+        if ThemeCompiler.get_changed_keys(old_widget_props, self._widget_props):
+            self._apply_widget_props()
+    
+    
     def _on_entry_change(self, *args: tuple) -> None:
         cleaned_entry_var: str = self._entry_var.get().strip()
         self._shell_mechanics.set_entry_var(cleaned_entry_var)
@@ -268,11 +364,65 @@ class Application(IConsole):
     
     
     def run(self) -> None:
+        self._root.after_idle(self._msg_provider.drain) # also prints the messages of threads that could not wake up the drain before the mainloop ran
         self._root.mainloop()
     
     
+    def _wake_message_drain(self) -> None:
+        # tk widgets may only be changed on the mainloop, so messages of other threads, e.g. the update check or the key listener, are printed there
+        try:
+            self._root.after(0, self._msg_provider.drain)
+        except (RuntimeError, TclError):
+            pass # the mainloop is not running yet or anymore, the pending messages are printed by the next drain
+    
+    
     # helper methods below
     
+    def _apply_tag_colors(self, changed_colors: Set[str]) -> None:
+        for tag, tag_colors in Application._TAG_COLORS.items():
+            if not changed_colors.isdisjoint(tag_colors.values()):
+                self._console.tag_config(tag, **{option: self._colors.get(color_key) for option, color_key in tag_colors.items()})
+    
+    
+    def _apply_list_margins(self) -> None:
+        self._console.tag_config("list", lmargin1=self._char_width_in_px * 4, lmargin2=self._char_width_in_px * 9)
+    
+    
+    def _apply_widget_colors(self, changed_colors: Set[str]) -> None:
+        widget_colors: List[tuple] = [
+            (self._root, {"bg": ColorKeys.BACKGROUND}),
+            (self._input_section, {"bg": ColorKeys.BACKGROUND}),
+            (self._input_prefix, {"fg": ColorKeys.COMMAND, "bg": ColorKeys.BACKGROUND}),
+            (self._input_entry, {"fg": ColorKeys.COMMAND, "bg": ColorKeys.BACKGROUND, "insertbackground": ColorKeys.COMMAND, "selectforeground": ColorKeys.NORMAL, "selectbackground": ColorKeys.SELECTION}),
+            (self._console, {"fg": ColorKeys.NORMAL, "bg": ColorKeys.BACKGROUND})
+        ]
+        
+        for widget, widget_options in widget_colors:
+            changed_options: dict = {option: self._colors.get(color_key) for option, color_key in widget_options.items() if color_key in changed_colors}
+            
+            if changed_options:
+                widget.config(**changed_options)
+    
+    
+    def _apply_widget_props(self) -> None:
+        padding: int = self._widget_props.get(WidgetKeys.PADDING)
+        self._input_section.pack_configure(padx=padding, pady=padding)
+        self._console.config(padx=padding, pady=padding)
+    
+    
+    def _run_after_search(self, shell_method: Callable[[Entry], None]) -> None:
+        self._end_reverse_search()
+        shell_method(self._input_entry)
+    
+    
+    def _end_reverse_search(self) -> None:
+        if not self._shell_mechanics.get_search_active():
+            return
+        
+        self._shell_mechanics.accept_search(self._input_entry)
+        self._input_prefix.config(text=Application._PREFIX)
+    
+    
     @staticmethod
     def _execute_insert_method(insert_method: Callable[[str, str | None], None], text: str, optional_arg: str | None) -> None:
         sig: Signature = signature(insert_method)
@@ -0,0 +1,29 @@
+from tkinter.font import Font, families, nametofont
+from typing import Dict, FrozenSet, Tuple
+
+class FontRegistry:
+    
+    _available_families: FrozenSet[str] | None = None
+    _fonts: Dict[Tuple[str, int], Font] = {}
+    
+    @classmethod
+    def has_family(cls, family: str) -> bool:
+        if cls._available_families is None:
+            cls._available_families = frozenset(families()) # enumerating every installed font is slow, so it is only done once
+        return family in cls._available_families
+    
+    
+    @classmethod
+    def get_font(cls, family: str, size: int) -> Font:
+        if not cls.has_family(family):
+            return nametofont("TkFixedFont")
+        
+        font_key: Tuple[str, int] = (family, size)
+        
+        if font_key not in cls._fonts:
+            cls._fonts[font_key] = Font(
+                family=family,
+                size=size,
+                weight="normal"
+            )
+        return cls._fonts[font_key]
\ No newline at end of file
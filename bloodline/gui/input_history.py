@@ -0,0 +1,142 @@
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Tuple
+
+from file_io import HistoryFileOperations
+from infrastructure import Directory, MessageHub
+
+class InputHistory:
+    
+    def __init__(self):
+        self._msg_provider: MessageHub = MessageHub()
+        
+        self._entries: Deque[str] = deque(maxlen=InputHistory._MAX_ENTRIES) # drops the oldest entry in constant time
+        self._search_index: Dict[str, str] = {} # unique inputs ordered from oldest to newest use, mapped to their casefolded form
+        self._entry_counts: Dict[str, int] = {} # occurrences of each unique input, so it leaves the index with its last entry
+        self._search_stack: List[Tuple[str, List[str]]] = [] # narrowed matches of each query prefix
+        self._logged_lines: int = 0 # lines in the log, including the ones that were already dropped from the entries
+        self._is_loaded: bool = False
+        self._persistence_enabled: bool = True
+    
+    
+    _HISTORY_FILE: str = "input_history.txt"
+    _HISTORY_FILE_PATH: Path = Directory.get_persistent_data_path() / _HISTORY_FILE
+    _MAX_ENTRIES: int = 50_000
+    _COMPACTION_THRESHOLD: int = int(_MAX_ENTRIES * 1.25) # the log is only rewritten once it grows well beyond the limit
+    
+    
+    def add(self, console_input: str) -> None:
+        self._ensure_loaded()
+        cleaned_input: str = console_input.replace("\r", " ").replace("\n", " ")
+        
+        if self._entries and self._entries[-1] == cleaned_input:
+            return
+        
+        if len(self._entries) == self._entries.maxlen:
+            self._unindex_entry(self._entries[0]) # the append below drops it
+        
+        self._entries.append(cleaned_input)
+        self._index_entry(cleaned_input)
+        self._search_stack.clear()
+        
+        self._append_to_file(cleaned_input)
+    
+    
+    def get_length(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
+    
+    
+    def get_entry(self, index: int) -> str:
+        self._ensure_loaded()
+        return self._entries[index]
+    
+    
+    def search(self, query: str) -> List[str]:
+        self._ensure_loaded()
+        cleaned_query: str = query.casefold()
+        
+        while self._search_stack and not cleaned_query.startswith(self._search_stack[-1][0]):
+            self._search_stack.pop()
+        
+        if self._search_stack and self._search_stack[-1][0] == cleaned_query:
+            return self._search_stack[-1][1]
+        
+        # a longer query can only match a subset of the previous matches, so only those are scanned again
+        candidates: Iterable[str] = self._search_stack[-1][1] if self._search_stack else reversed(self._search_index)
+        matches: List[str] = [entry for entry in candidates if cleaned_query in self._search_index[entry]]
+        
+        self._search_stack.append((cleaned_query, matches))
+        return matches
+    
+    
+    def end_search(self) -> None:
+        self._search_stack.clear()
+    
+    
+    # helper methods below
+    
+    def _ensure_loaded(self) -> None:
+        if self._is_loaded:
+            return
+        
+        self._is_loaded = True
+        
+        try:
+            loaded_entries: List[str] = HistoryFileOperations.perform_load(InputHistory._HISTORY_FILE_PATH)
+            
+            self._entries.extend(loaded_entries) # only the newest entries are kept
+            self._logged_lines = len(loaded_entries)
+            self._compact_file()
+        except OSError as e:
+            self._entries.clear()
+            self._disable_persistence(e)
+            return
+        
+        for entry in self._entries:
+            self._index_entry(entry)
+    
+    
+    def _index_entry(self, entry: str) -> None:
+        self._search_index.pop(entry, None) # re-inserting moves the entry to the newest position
+        self._search_index[entry] = entry.casefold()
+        self._entry_counts[entry] = self._entry_counts.get(entry, 0) + 1
+    
+    
+    def _unindex_entry(self, entry: str) -> None:
+        remaining_count: int = self._entry_counts[entry] - 1
+        
+        if remaining_count:
+            self._entry_counts[entry] = remaining_count
+            return
+        
+        del self._entry_counts[entry]
+        del self._search_index[entry]
+    
+    
+    def _append_to_file(self, entry: str) -> None:
+        if not self._persistence_enabled:
+            return
+        
+        try:
+            HistoryFileOperations.perform_append(InputHistory._HISTORY_FILE_PATH, entry)
+            self._logged_lines += 1
+            self._compact_file()
+        except OSError as e:
+            self._disable_persistence(e)
+    
+    
+    def _compact_file(self) -> None:
+        if self._logged_lines <= InputHistory._COMPACTION_THRESHOLD:
+            return
+        
+        HistoryFileOperations.perform_rewrite(InputHistory._HISTORY_FILE_PATH, self._entries)
+        self._logged_lines = len(self._entries)
+    
+    
+    def _disable_persistence(self, e: OSError) -> None:
+        self._persistence_enabled = False
+        self._msg_provider.invoke(
+            f"An unexpected error occurred while accessing the file \"{InputHistory._HISTORY_FILE}\". The input history will not be saved for this session.\n"
+            f"Exception: {e}", "error"
+        )
\ No newline at end of file
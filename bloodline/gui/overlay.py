@@ -1,9 +1,10 @@
 from tkinter import Toplevel, Frame, Label
-from tkinter.font import Font, families, nametofont
-from typing import Any, override
+from tkinter.font import Font
+from typing import Any, Dict, List, Mapping, Set, Tuple, override
 
-from .theme_manager import ThemeManager
-from .window_manager import WindowManager
+from .font_registry import FontRegistry
+from core import ThemeCompiler, ThemeManager, WindowManager
+from infrastructure import LatencyMonitor
 from infrastructure.interfaces import IOverlay
 from schemas import WindowKeys, ColorKeys, FontKeys, WidgetKeys
 
@@ -13,16 +14,41 @@ class Overlay(IOverlay):
         self._theme_manager: ThemeManager = ThemeManager()
         self._window_manager: WindowManager = WindowManager()
         self._setup_config_vars()
+        self._theme_manager.add_theme_listener(self._on_theme_change)
     
     
     @override
     def update_counter_label(self, count: int) -> None:
-        self._counter_label.config(text=count)
+        self._schedule_label_update(self._counter_label, count)
     
     
     @override
     def update_timer_label(self, formated_time: str) -> None:
-        self._timer_label.config(text=formated_time)
+        self._schedule_label_update(self._timer_label, formated_time)
+    
+    
+    @override
+    def update_segment_label(self, segment_text: str) -> None:
+        if not self._segment_label_shown:
+            self._segment_label.pack() # only shown once splits are used, otherwise the overlay keeps its size
+            self._segment_label_shown = True
+        self._schedule_label_update(self._segment_label, segment_text)
+    
+    
+    @override
+    def update_slot_label(self, slot_text: str) -> None:
+        if not self._slot_label_shown:
+            self._slot_label.pack(before=self._counter_label) # the selected boss is shown above its values
+            self._slot_label_shown = True
+        self._schedule_label_update(self._slot_label, slot_text)
+    
+    
+    @override
+    def update_metrics_label(self, metrics_text: str) -> None:
+        if not self._metrics_label_shown:
+            self._metrics_label.pack(after=self._timer_label)
+            self._metrics_label_shown = True
+        self._schedule_label_update(self._metrics_label, metrics_text)
     
     
     @override
@@ -32,40 +58,93 @@ class Overlay(IOverlay):
     
     @override
     def display_lock_animation(self, animation_time: int, lock_state: bool) -> None:
+        if not self._is_visible:
+            return
+        
         self._toplevel.config(highlightbackground=self._colors.get(ColorKeys.ERROR) if lock_state else self._colors.get(ColorKeys.SUCCESS))
         self.add_mainloop_task(animation_time, lambda: self._toplevel.config(highlightbackground=self._colors.get(ColorKeys.BACKGROUND)))
     
     
     @override
     def create_instance(self) -> None:
-        self._toplevel: Toplevel = Toplevel()
-        self._setup_window()
-        self._setup_ui_elements()
-        self._setup_font()
+        self.prewarm()
+        self._toplevel_props = self._window_manager.get_toplevel_props()
         
-        self._toplevel.update() # makes sure the window init is complete
-        self._init_width = self._toplevel.winfo_width()
+        self._origin_x, self._pos_y = Overlay._parse_position(self._toplevel_props.get(WindowKeys.GEOMETRY))
+        self._width = self._init_width
+        self._calc_alignment()
+        self._move_to(self._origin_x, self._pos_y, force=True)
         
-        self._setup_bindings()
+        self._toplevel.deiconify() # the window is only built once and is shown/hidden for every session
+        self._is_visible = True
     
     
     @override
     def destroy_instance(self) -> None:
-        self._window_manager.set_toplevel_props(f"+{self._toplevel.winfo_rootx() - self._difference_width}+{self._toplevel.winfo_rooty()}")
-        self._difference_width = 0
-        self._toplevel.destroy()
+        if self._label_update_id is not None:
+            self._toplevel.after_cancel(self._label_update_id)
+            self._label_update_id = None
+        self._pending_label_texts.clear()
+        self._pending_samples.clear()
+        
+        self._window_manager.set_toplevel_props(f"+{self._origin_x}+{self._pos_y}")
+        self._toplevel.withdraw()
+        self._is_visible = False
+        
+        self._counter_label.config(text=Overlay._PLACEHOLDER_TEXT) # the next session starts with the initial width again
+        self._timer_label.config(text=Overlay._PLACEHOLDER_TEXT)
+        self._segment_label.pack_forget()
+        self._segment_label_shown = False
+        self._slot_label.pack_forget()
+        self._slot_label_shown = False
+        self._metrics_label.pack_forget()
+        self._metrics_label_shown = False
+        
+        if self._init_width_outdated:
+            self._measure_init_width()
+    
+    
+    def prewarm(self) -> None:
+        if self._toplevel is not None:
+            return
+        
+        self._toplevel = Toplevel()
+        self._toplevel.withdraw()
+        self._setup_window()
+        self._setup_ui_elements()
+        self._setup_font()
+        self._setup_bindings()
+        
+        self._screen_width = self._toplevel.winfo_screenwidth()
+        self._measure_init_width()
     
     
     def _setup_config_vars(self) -> None:
         self._toplevel_props: dict = self._window_manager.get_toplevel_props()
-        self._colors: dict = self._theme_manager.get_colors()
-        self._font_props: dict = self._theme_manager.get_toplevel_font_props()
-        self._widget_props: dict = self._theme_manager.get_toplevel_widget_props()
+        self._colors: Mapping = self._theme_manager.get_colors()
+        self._font_props: Mapping = self._theme_manager.get_toplevel_font_props()
+        self._widget_props: Mapping = self._theme_manager.get_toplevel_widget_props()
+        
+        self._toplevel: Toplevel | None = None
+        self._is_visible: bool = False
+        self._segment_label_shown: bool = False
+        self._slot_label_shown: bool = False
+        self._metrics_label_shown: bool = False
+        self._pending_label_texts: Dict[Label, Any] = {}
+        self._pending_samples: List[Tuple[str, int]] = []
+        self._label_update_id: str | None = None
+        self._alignment_update_id: str | None = None
+        self._init_width_outdated: bool = False
         
+        # the geometry is cached, so moving and resizing does not query the window
+        self._screen_width: int = 0
+        self._init_width: int = 0
+        self._width: int = 0
+        self._origin_x: int = 0 # left edge of the window at its initial width, which is also what gets saved
+        self._pos_x: int = 0
+        self._pos_y: int = 0
         self._offset_x: int = 0
         self._offset_y: int = 0
-        self._init_width: int = 0
-        self._difference_width: int = 0
         self._alignment: dict = {
             "left": True,
             "centered": False,
@@ -73,8 +152,10 @@ class Overlay(IOverlay):
         }
     
     
+    _PLACEHOLDER_TEXT: str = "No value yet"
+    
+    
     def _setup_window(self) -> None:
-        self._toplevel.geometry(self._toplevel_props.get(WindowKeys.GEOMETRY))
         self._toplevel.attributes("-topmost", True)
         self._toplevel.overrideredirect(True)
         self._toplevel.config(
@@ -98,7 +179,7 @@ class Overlay(IOverlay):
             master=self._container,
             fg=self._colors.get(ColorKeys.NORMAL),
             bg=self._colors.get(ColorKeys.BACKGROUND),
-            text="No value yet"
+            text=Overlay._PLACEHOLDER_TEXT
         )
         self._counter_label.pack()
         
@@ -106,25 +187,37 @@ class Overlay(IOverlay):
             master=self._container,
             fg=self._colors.get(ColorKeys.NORMAL),
             bg=self._colors.get(ColorKeys.BACKGROUND),
-            text="No value yet"
+            text=Overlay._PLACEHOLDER_TEXT
         )
         self._timer_label.pack()
+        
+        self._segment_label: Label = Label(
+            master=self._container,
+            fg=self._colors.get(ColorKeys.NORMAL),
+            bg=self._colors.get(ColorKeys.BACKGROUND)
+        )
+        
+        self._slot_label: Label = Label(
+            master=self._container,
+            fg=self._colors.get(ColorKeys.NORMAL),
+            bg=self._colors.get(ColorKeys.BACKGROUND)
+        )
+        
+        self._metrics_label: Label = Label(
+            master=self._container,
+            fg=self._colors.get(ColorKeys.NORMAL),
+            bg=self._colors.get(ColorKeys.BACKGROUND)
+        )
     
     
     def _setup_font(self) -> None:
-        desired_font_family: str = self._font_props.get(FontKeys.FAMILY)
-        
-        if desired_font_family in families():
-            font_to_use: Font = Font(
-                                    family=desired_font_family,
-                                    size=self._font_props.get(FontKeys.SIZE),
-                                    weight="normal"
-                                )
-        else:
-            font_to_use: Font = nametofont("TkFixedFont")
+        font_to_use: Font = FontRegistry.get_font(self._font_props.get(FontKeys.FAMILY), self._font_props.get(FontKeys.SIZE)) # the same font object is reused by every instance
         
         self._counter_label.config(font=font_to_use)
         self._timer_label.config(font=font_to_use)
+        self._segment_label.config(font=font_to_use)
+        self._slot_label.config(font=font_to_use)
+        self._metrics_label.config(font=font_to_use)
     
     
     def _setup_bindings(self) -> None:
@@ -134,45 +227,114 @@ class Overlay(IOverlay):
         self._container.bind("<Configure>", self._on_resize)
     
     
+    def _on_theme_change(self, old_theme: Mapping, new_theme: Mapping) -> None:
+        old_colors, old_font_props, old_widget_props = self._colors, self._font_props, self._widget_props
+        self._colors = self._theme_manager.get_colors()
+        self._font_props = self._theme_manager.get_toplevel_font_props()
+        self._widget_props = self._theme_manager.get_toplevel_widget_props()
+        
+        if self._toplevel is None:
+            return # the window is built with the new theme anyway
+        
+        changed_colors: Set[str] = ThemeCompiler.get_changed_keys(old_colors, self._colors)
+        
+        if not changed_colors.isdisjoint({ColorKeys.BACKGROUND, ColorKeys.NORMAL}):
+            self._apply_colors()
+        if ThemeCompiler.get_changed_keys(old_font_props, self._font_props):
+            self._setup_font()
+            self._measure_init_width()
+        if ThemeCompiler.get_changed_keys(old_widget_props, self._widget_props):
+            self._apply_widget_props()
+            self._measure_init_width()
+    
+    
     def _on_lmb_click(self, event: Any) -> None:
         if self._toplevel_props.get(WindowKeys.LOCKED):
             return
         
-        self._offset_x = self._toplevel.winfo_pointerx() - self._toplevel.winfo_rootx()
-        self._offset_y = self._toplevel.winfo_pointery() - self._toplevel.winfo_rooty()
+        self._offset_x = event.x_root - self._pos_x
+        self._offset_y = event.y_root - self._pos_y
     
     
     def _on_lmb_drag(self, event: Any) -> None:
         if self._toplevel_props.get(WindowKeys.LOCKED):
             return
         
-        pos_x: int = self._toplevel.winfo_pointerx() - self._offset_x
-        pos_y: int = self._toplevel.winfo_pointery() - self._offset_y
-        self._toplevel.geometry(f"+{pos_x}+{pos_y}")
+        self._origin_x = event.x_root - self._offset_x - self._get_alignment_shift()
+        self._calc_alignment()
+        self._move_to(self._origin_x, event.y_root - self._offset_y)
     
     
     def _on_resize(self, event: Any) -> None:
-        self._calc_alignment()
-        
-        if self._alignment.get("left"):
-            return # tkinters default is left aligned
+        if self._alignment_update_id is None:
+            self._alignment_update_id = self._toplevel.after_idle(self._apply_alignment) # a burst of configure events is handled once
+    
+    
+    def _apply_alignment(self) -> None:
+        self._alignment_update_id = None
         
-        self._difference_width: int = self._init_width - self._toplevel.winfo_width()
-        toplevel_x: int = self._toplevel.winfo_rootx()
-        toplevle_y: int = self._toplevel.winfo_rooty()
+        if not self._is_visible:
+            return
         
-        if self._alignment.get("centered"):
-            self._difference_width = int(self._difference_width / 2)
-            self._toplevel.geometry(f"+{toplevel_x + self._difference_width}+{toplevle_y}")
-        elif self._alignment.get("right"):
-            self._toplevel.geometry(f"+{toplevel_x + self._difference_width}+{toplevle_y}")
+        self._width = self._toplevel.winfo_reqwidth()
+        self._move_to(self._origin_x, self._pos_y) # only moves the window if the alignment requires it
     
     
     # helper methods below
     
+    def _schedule_label_update(self, label: Label, text: Any) -> None:
+        self._pending_label_texts[label] = text
+        sample: Tuple[str, int] | None = LatencyMonitor.get_sample()
+        
+        if sample is not None:
+            self._pending_samples.append(sample)
+        if self._label_update_id is None:
+            self._label_update_id = self._toplevel.after_idle(self._apply_label_updates) # all updates of a hotkey batch share one repaint
+    
+    
+    def _apply_label_updates(self) -> None:
+        self._label_update_id = None
+        
+        for label, text in self._pending_label_texts.items():
+            label.config(text=text)
+        for sample in self._pending_samples:
+            self._toplevel.after_idle(LatencyMonitor.complete, sample, "paint") # idle callbacks run after the pending redraw of the labels
+        
+        self._pending_label_texts.clear()
+        self._pending_samples.clear()
+    
+    
+    def _apply_colors(self) -> None:
+        self._toplevel.config(bg=self._colors.get(ColorKeys.BACKGROUND), highlightbackground=self._colors.get(ColorKeys.BACKGROUND))
+        self._container.config(bg=self._colors.get(ColorKeys.BACKGROUND))
+        self._counter_label.config(fg=self._colors.get(ColorKeys.NORMAL), bg=self._colors.get(ColorKeys.BACKGROUND))
+        self._timer_label.config(fg=self._colors.get(ColorKeys.NORMAL), bg=self._colors.get(ColorKeys.BACKGROUND))
+        self._segment_label.config(fg=self._colors.get(ColorKeys.NORMAL), bg=self._colors.get(ColorKeys.BACKGROUND))
+        self._slot_label.config(fg=self._colors.get(ColorKeys.NORMAL), bg=self._colors.get(ColorKeys.BACKGROUND))
+        self._metrics_label.config(fg=self._colors.get(ColorKeys.NORMAL), bg=self._colors.get(ColorKeys.BACKGROUND))
+    
+    
+    def _apply_widget_props(self) -> None:
+        self._toplevel.config(highlightthickness=self._widget_props.get(WidgetKeys.HIGHLIGHTTHICKNESS))
+        self._container.pack_configure(
+            padx=self._widget_props.get(WidgetKeys.PADDING),
+            pady=self._widget_props.get(WidgetKeys.PADDING)
+        )
+    
+    
+    def _measure_init_width(self) -> None:
+        if self._is_visible:
+            self._init_width_outdated = True # measured once the window is hidden and shows the placeholder text again
+            return
+        
+        self._init_width_outdated = False
+        self._toplevel.update_idletasks() # only computes the requested size of the withdrawn window, nothing is drawn
+        self._init_width = self._toplevel.winfo_reqwidth()
+    
+    
     def _calc_alignment(self) -> None:
-        display_third: int = int(self._toplevel.winfo_screenwidth() / 3)
-        toplevel_center_x: int = self._toplevel.winfo_rootx() + int(self._toplevel.winfo_width() / 2)
+        display_third: int = int(self._screen_width / 3)
+        toplevel_center_x: int = self._origin_x + int(self._init_width / 2)
         
         self._alignment = {key: False for key in self._alignment}
         
@@ -181,4 +343,30 @@ class Overlay(IOverlay):
         elif toplevel_center_x <= (display_third * 2):
             self._alignment["centered"] = True
         else:
-            self._alignment["right"] = True
\ No newline at end of file
+            self._alignment["right"] = True
+    
+    
+    def _get_alignment_shift(self) -> int:
+        difference_width: int = self._init_width - self._width
+        
+        if self._alignment.get("centered"):
+            return int(difference_width / 2)
+        if self._alignment.get("right"):
+            return difference_width
+        return 0
+    
+    
+    def _move_to(self, origin_x: int, pos_y: int, force: bool = False) -> None:
+        pos_x: int = origin_x + self._get_alignment_shift()
+        
+        if not force and (pos_x, pos_y) == (self._pos_x, self._pos_y):
+            return
+        
+        self._pos_x, self._pos_y = pos_x, pos_y
+        self._toplevel.geometry(f"+{pos_x}+{pos_y}")
+    
+    
+    @staticmethod
+    def _parse_position(geometry: str) -> Tuple[int, int]:
+        pos_x, pos_y = geometry.lstrip("+").split("+")
+        return int(pos_x), int(pos_y)
\ No newline at end of file
@@ -1,6 +1,8 @@
 from tkinter import Entry
 from typing import List, Callable
 
+from .input_history import InputHistory
+
 class ShellMechanics:
     
     def __init__(self, get_list_of_commands: Callable[..., List[str]]):
@@ -9,6 +11,7 @@ class ShellMechanics:
         
         self._setup_auto_complete_vars()
         self._setup_input_history_vars()
+        self._setup_reverse_search_vars()
     
     
     def _setup_auto_complete_vars(self) -> None:
@@ -20,8 +23,16 @@ class ShellMechanics:
     
     
     def _setup_input_history_vars(self) -> None:
-        self._input_history: List[str] = []
-        self._history_index: int = 0
+        self._input_history: InputHistory = InputHistory() # the history file is only read on first access
+        self._history_index: int | None = None
+    
+    
+    def _setup_reverse_search_vars(self) -> None:
+        self._search_active: bool = False
+        self._search_query: str = ""
+        self._search_origin: str = ""
+        self._search_matches: List[str] = []
+        self._search_match_index: int = 0
     
     
     def set_entry_var(self, entry_var: str) -> None:
@@ -53,36 +64,35 @@ class ShellMechanics:
     
     
     def add_input_to_history(self, console_input: str) -> None:
-        history_is_empty: bool = not self._input_history
-        
-        if history_is_empty:
-            self._input_history.append(console_input)
-        else:
-            curr_input_equals_last: bool = console_input == self._input_history[len(self._input_history) - 1]
-            
-            if not curr_input_equals_last:
-                self._input_history.append(console_input)
-        
-        self._history_index = len(self._input_history)
+        self._input_history.add(console_input)
+        self._history_index = self._input_history.get_length()
     
     
     def get_last_input(self, input_entry: Entry) -> None:
-        if not self._input_history:
+        history_length: int = self._input_history.get_length()
+        
+        if not history_length:
             return
+        if self._history_index is None:
+            self._history_index = history_length
         if self._history_index <= 0:
             return
         
         self._history_index -= 1
         
         input_entry.delete(0, "end")
-        input_entry.insert(0, self._input_history[self._history_index])
+        input_entry.insert(0, self._input_history.get_entry(self._history_index))
     
     
     def get_prev_input(self, input_entry: Entry) -> None:
-        if not self._input_history:
+        history_length: int = self._input_history.get_length()
+        
+        if not history_length:
             return
+        if self._history_index is None:
+            self._history_index = history_length
         
-        number_of_input_history: int = len(self._input_history) - 1
+        number_of_input_history: int = history_length - 1
         
         if self._history_index > number_of_input_history:
             return
@@ -93,7 +103,51 @@ class ShellMechanics:
         if self._history_index > number_of_input_history:
             return
         
-        input_entry.insert(0, self._input_history[self._history_index])
+        input_entry.insert(0, self._input_history.get_entry(self._history_index))
+    
+    
+    # reverse search methods below
+    
+    def get_search_active(self) -> bool:
+        return self._search_active
+    
+    
+    def reverse_search(self, input_entry: Entry) -> str:
+        if not self._search_active:
+            self._search_active = True
+            self._search_origin = input_entry.get()
+            self._search_query = self._entry_var
+            self._update_search_matches()
+        elif self._search_match_index < len(self._search_matches) - 1:
+            self._search_match_index += 1 # repeated searches step to the next older match
+        
+        self._display_search_match(input_entry)
+        return self._get_search_prompt()
+    
+    
+    def extend_search_query(self, char: str, input_entry: Entry) -> str:
+        self._search_query += char
+        self._update_search_matches()
+        self._display_search_match(input_entry)
+        return self._get_search_prompt()
+    
+    
+    def shorten_search_query(self, input_entry: Entry) -> str:
+        self._search_query = self._search_query[0:-1]
+        self._update_search_matches()
+        self._display_search_match(input_entry)
+        return self._get_search_prompt()
+    
+    
+    def accept_search(self, input_entry: Entry) -> None:
+        self._end_search()
+        self.set_entry_var(input_entry.get().strip())
+    
+    
+    def cancel_search(self, input_entry: Entry) -> None:
+        self._set_entry_text(input_entry, self._search_origin)
+        self._end_search()
+        self.set_entry_var(self._search_origin.strip())
     
     
     # helper methods below
@@ -103,4 +157,34 @@ class ShellMechanics:
         self._match_index = -1
         
         list_of_commands: List[str] = self._get_list_of_commands()
-        self._matching_commands = [command for command in list_of_commands if self._entry_var in command]
\ No newline at end of file
+        self._matching_commands = [command for command in list_of_commands if self._entry_var in command]
+    
+    
+    def _update_search_matches(self) -> None:
+        self._search_matches = self._input_history.search(self._search_query)
+        self._search_match_index = 0
+    
+    
+    def _display_search_match(self, input_entry: Entry) -> None:
+        if not self._search_matches:
+            return # the last match stays visible like in a regular shell
+        self._set_entry_text(input_entry, self._search_matches[self._search_match_index])
+    
+    
+    def _get_search_prompt(self) -> str:
+        search_state: str = "reverse-i-search" if self._search_matches else "failed reverse-i-search"
+        return f"({search_state})'{self._search_query}':"
+    
+    
+    def _set_entry_text(self, input_entry: Entry, text: str) -> None:
+        self._programmatic_update = True
+        input_entry.delete(0, "end")
+        input_entry.insert(0, text)
+        self._programmatic_update = False
+    
+    
+    def _end_search(self) -> None:
+        self._search_active = False
+        self._search_query = ""
+        self._search_matches = []
+        self._input_history.end_search()
\ No newline at end of file
@@ -0,0 +1,63 @@
+from json import loads, JSONDecodeError
+from os import stat_result
+from pathlib import Path
+from tkinter import Misc
+
+from core import ThemeManager
+from infrastructure import MessageHub
+
+class ThemeWatcher:
+    
+    def __init__(self, master: Misc, theme_manager: ThemeManager):
+        self._master: Misc = master
+        self._theme_manager: ThemeManager = theme_manager
+        self._msg_provider: MessageHub = MessageHub()
+        
+        self._theme_file_path: Path = theme_manager.get_theme_file_path()
+        self._last_signature: tuple | None = None
+        self._pending_reload: str | None = None
+    
+    
+    _POLL_INTERVAL_MS: int = 250
+    _DEBOUNCE_MS: int = 500
+    
+    
+    def start(self) -> None:
+        self._last_signature = self._get_file_signature()
+        self._master.after(ThemeWatcher._POLL_INTERVAL_MS, self._poll)
+    
+    
+    # helper methods below
+    
+    def _poll(self) -> None:
+        file_signature: tuple | None = self._get_file_signature()
+        
+        if file_signature != self._last_signature:
+            self._last_signature = file_signature
+            
+            # every further save restarts the countdown, so rapid saves only trigger a single reload
+            if self._pending_reload is not None:
+                self._master.after_cancel(self._pending_reload)
+            self._pending_reload = self._master.after(ThemeWatcher._DEBOUNCE_MS, self._reload_theme)
+        
+        self._master.after(ThemeWatcher._POLL_INTERVAL_MS, self._poll)
+    
+    
+    def _reload_theme(self) -> None:
+        self._pending_reload = None
+        
+        try:
+            loads(self._theme_file_path.read_text()) # a half written file would otherwise be replaced by the backup
+        except (OSError, JSONDecodeError):
+            self._msg_provider.invoke(f"The file \"{self._theme_file_path.name}\" could not be read. The theme will be reloaded once the file is saved again", "warning")
+            return
+        
+        self._theme_manager.reload_theme()
+    
+    
+    def _get_file_signature(self) -> tuple | None:
+        try:
+            file_stats: stat_result = self._theme_file_path.stat()
+            return (file_stats.st_mtime_ns, file_stats.st_size)
+        except OSError:
+            return None
\ No newline at end of file
@@ -1,3 +1,6 @@
 from .directory import Directory
+from .event_bus import EventBus, Subscription, Topic, ConsoleText, CounterChanged, TimerTick, DbWrite, ErrorRaised
+from .latency_monitor import LatencyMonitor
 from .message_hub import MessageHub
+from .startup_tracer import StartupTracer
 from .migration_pipeline import MigrationPipeline
\ No newline at end of file
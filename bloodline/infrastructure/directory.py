@@ -19,9 +19,16 @@ class Directory:
     _LOGS_PATH: Path = _PERS_DATA_PATH / _LOGS_DIR
     _EXPORT_PATH: Path = Path(user_documents_dir()) / _AUTHOR / _APP_NAME / _EXPORT_DIR
     
-    _PERS_DATA_PATH.mkdir(parents=True, exist_ok=True)
-    _BACKUP_PATH.mkdir(parents=True, exist_ok=True)
-    _EXPORT_PATH.mkdir(parents=True, exist_ok=True)
+    
+    @classmethod
+    def create_data_dirs(cls) -> None:
+        cls._PERS_DATA_PATH.mkdir(parents=True, exist_ok=True)
+        cls._BACKUP_PATH.mkdir(parents=True, exist_ok=True)
+    
+    
+    @classmethod
+    def create_export_dir(cls) -> None:
+        cls._EXPORT_PATH.mkdir(parents=True, exist_ok=True)
     
     
     @classmethod
@@ -0,0 +1,189 @@
+from collections import deque
+from enum import Enum
+from sys import stderr
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Tuple
+
+class Topic(str, Enum):
+    CONSOLE_TEXT: str = "console_text"
+    COUNTER_CHANGED: str = "counter_changed"
+    TIMER_TICK: str = "timer_tick"
+    DB_WRITE: str = "db_write"
+    ERROR: str = "error"
+
+
+class ConsoleText(NamedTuple):
+    text: str
+    text_type: str
+    optional_arg: str | None
+
+
+class CounterChanged(NamedTuple):
+    count: int | None
+    action: str
+
+
+class TimerTick(NamedTuple):
+    formated_time: str
+
+
+class DbWrite(NamedTuple):
+    file_name: str
+    row_count: int
+
+
+class ErrorRaised(NamedTuple):
+    text: str
+
+
+class Subscription:
+    
+    def __init__(self, name: str, topics: Tuple[Topic, ...], callback: Callable[[Topic, Any], None], max_queued_events: int | None, wake_up: Callable[[], None] | None = None):
+        self._name: str = name
+        self._topics: Tuple[Topic, ...] = topics
+        self._callback: Callable[[Topic, Any], None] = callback
+        self._max_queued_events: int | None = max_queued_events # None delivers synchronously on the publishing thread
+        
+        self._events: Deque[Tuple[Topic, Any]] = deque()
+        self._condition: Condition = Condition()
+        self._dropped_events: int = 0
+        self._drained_dropped_events: int = 0 # dropped events that were already returned by drain
+        self._is_active: bool = True
+        
+        # with a wake up, the owner delivers the queued events by calling drain, e.g. from the tk mainloop, instead of a thread of its own
+        self._wake_up: Callable[[], None] | None = wake_up
+        self._drain_scheduled: bool = False
+        
+        if max_queued_events is not None and wake_up is None:
+            Thread(target=self._deliver_events, name=f"event-bus-{name}", daemon=True).start()
+    
+    
+    def put(self, topic: Topic, event: Any) -> None:
+        if self._max_queued_events is None:
+            self._callback(topic, event)
+            return
+        
+        with self._condition:
+            # a slow subscriber loses its oldest events instead of slowing down the publisher
+            if len(self._events) >= self._max_queued_events:
+                self._events.popleft()
+                self._dropped_events += 1
+            self._events.append((topic, event))
+            self._condition.notify()
+            
+            if self._wake_up is None or self._drain_scheduled:
+                return
+            self._drain_scheduled = True # a burst of events only wakes up the owner once
+        self._wake_up()
+    
+    
+    def drain(self) -> int:
+        with self._condition:
+            self._drain_scheduled = False # events that arrive while draining wake up the owner again
+            queued_events: List[Tuple[Topic, Any]] = list(self._events)
+            self._events.clear()
+            
+            dropped_events: int = self._dropped_events - self._drained_dropped_events
+            self._drained_dropped_events = self._dropped_events
+        
+        for topic, event in queued_events:
+            self._deliver(topic, event)
+        return dropped_events # the number of events that were dropped since the last drain
+    
+    
+    def cancel(self) -> None:
+        with self._condition:
+            self._is_active = False
+            self._events.clear()
+            self._condition.notify()
+    
+    
+    def get_name(self) -> str:
+        return self._name
+    
+    
+    def get_topics(self) -> Tuple[Topic, ...]:
+        return self._topics
+    
+    
+    def get_queued_events(self) -> int:
+        return len(self._events)
+    
+    
+    def get_dropped_events(self) -> int:
+        return self._dropped_events
+    
+    
+    # helper methods below
+    
+    def _deliver_events(self) -> None:
+        while True:
+            with self._condition:
+                while self._is_active and not self._events:
+                    self._condition.wait()
+                
+                if not self._is_active:
+                    return
+                topic, event = self._events.popleft()
+            
+            self._deliver(topic, event)
+    
+    
+    def _deliver(self, topic: Topic, event: Any) -> None:
+        try:
+            self._callback(topic, event)
+        except Exception as e:
+            # not reported via the bus, as a failing error subscriber would report its own failure again
+            print(
+                f"An unexpected error occurred while delivering the event \"{topic.value}\" to \"{self._name}\".\n"
+                f"Exception: {e}", file=stderr
+            )
+
+
+class EventBus:
+    
+    _subscriptions: Dict[Topic, Tuple[Subscription, ...]] = {}
+    _lock: Lock = Lock()
+    
+    
+    _DEFAULT_MAX_QUEUED_EVENTS: int = 1024
+    
+    
+    @classmethod
+    def subscribe(cls, name: str, topics: Iterable[Topic], callback: Callable[[Topic, Any], None], max_queued_events: int | None = _DEFAULT_MAX_QUEUED_EVENTS, wake_up: Callable[[], None] | None = None) -> Subscription:
+        subscription: Subscription = Subscription(name, tuple(topics), callback, max_queued_events, wake_up)
+        
+        with cls._lock:
+            # the tuples are replaced instead of changed, so publishing never has to lock
+            for topic in subscription.get_topics():
+                cls._subscriptions[topic] = cls._subscriptions.get(topic, ()) + (subscription,)
+        return subscription
+    
+    
+    @classmethod
+    def unsubscribe(cls, subscription: Subscription) -> None:
+        with cls._lock:
+            for topic in subscription.get_topics():
+                cls._subscriptions[topic] = tuple(other for other in cls._subscriptions.get(topic, ()) if other is not subscription)
+        subscription.cancel()
+    
+    
+    @classmethod
+    def publish(cls, topic: Topic, event: Any) -> None:
+        for subscription in cls._subscriptions.get(topic, ()):
+            subscription.put(topic, event)
+    
+    
+    @classmethod
+    def get_has_subscribers(cls, topic: Topic) -> bool:
+        return bool(cls._subscriptions.get(topic))
+    
+    
+    @classmethod
+    def get_subscriptions(cls) -> List[Subscription]:
+        subscriptions: Dict[int, Subscription] = {}
+        
+        for topic_subscriptions in cls._subscriptions.values():
+            for subscription in topic_subscriptions:
+                subscriptions[id(subscription)] = subscription # a subscription of several topics is only listed once
+        return list(subscriptions.values())
\ No newline at end of file
@@ -13,6 +13,21 @@ class IOverlay(ABC):
         pass
     
     
+    @abstractmethod
+    def update_segment_label(self, segment_text: str) -> None:
+        pass
+    
+    
+    @abstractmethod
+    def update_slot_label(self, slot_text: str) -> None:
+        pass
+    
+    
+    @abstractmethod
+    def update_metrics_label(self, metrics_text: str) -> None:
+        pass
+    
+    
     @abstractmethod
     def add_mainloop_task(self, delay: int, task: Any) -> None:
         pass
@@ -4,4 +4,14 @@ class IWindowManager(ABC):
     
     @abstractmethod
     def set_toplevel_locked(self, new_lock_state: bool) -> bool:
+        pass
+    
+    
+    @abstractmethod
+    def get_timer_precision(self) -> str:
+        pass
+    
+    
+    @abstractmethod
+    def set_timer_precision(self, new_precision: str) -> bool:
         pass
\ No newline at end of file
@@ -0,0 +1,74 @@
+from math import ceil
+from typing import List
+
+class LatencyHistogram:
+    
+    def __init__(self):
+        self._counts: List[int] = []
+        self._total_count: int = 0
+        self._max_value: int = 0
+    
+    
+    _SUB_BUCKET_BITS: int = 6 # 64 linear sub buckets per power of two keep the relative error below ~3 %
+    _SUB_BUCKET_COUNT: int = 1 << _SUB_BUCKET_BITS
+    _SUB_BUCKET_HALF_COUNT: int = _SUB_BUCKET_COUNT >> 1
+    
+    
+    def record(self, value: int) -> None:
+        index: int = LatencyHistogram._get_bucket_index(max(value, 0))
+        
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        
+        self._counts[index] += 1
+        self._total_count += 1
+        self._max_value = max(self._max_value, value)
+    
+    
+    def get_count(self) -> int:
+        return self._total_count
+    
+    
+    def get_max(self) -> int:
+        return self._max_value
+    
+    
+    def get_percentile(self, percentile: float) -> int:
+        if not self._total_count:
+            return 0
+        
+        target_count: int = max(ceil(percentile / 100 * self._total_count), 1)
+        cumulative_count: int = 0
+        
+        for index, count in enumerate(self._counts):
+            cumulative_count += count
+            
+            if cumulative_count >= target_count:
+                return min(LatencyHistogram._get_highest_value(index), self._max_value) # the bucket bound can exceed the largest recorded value
+        return self._max_value
+    
+    
+    def reset(self) -> None:
+        self._counts.clear()
+        self._total_count = 0
+        self._max_value = 0
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _get_bucket_index(cls, value: int) -> int:
+        if value < cls._SUB_BUCKET_COUNT:
+            return value # small values are counted exactly
+        
+        shift: int = value.bit_length() - cls._SUB_BUCKET_BITS
+        return cls._SUB_BUCKET_COUNT + (shift - 1) * cls._SUB_BUCKET_HALF_COUNT + (value >> shift) - cls._SUB_BUCKET_HALF_COUNT
+    
+    
+    @classmethod
+    def _get_highest_value(cls, index: int) -> int:
+        if index < cls._SUB_BUCKET_COUNT:
+            return index
+        
+        shift, sub_index = divmod(index - cls._SUB_BUCKET_COUNT, cls._SUB_BUCKET_HALF_COUNT)
+        return ((sub_index + cls._SUB_BUCKET_HALF_COUNT + 1) << (shift + 1)) - 1
\ No newline at end of file
@@ -0,0 +1,76 @@
+from threading import Lock, local
+from time import perf_counter_ns
+from typing import Dict, List, Tuple
+
+from .latency_histogram import LatencyHistogram
+
+class LatencyMonitor:
+    
+    _histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+    _lock: Lock = Lock()
+    _thread_state: local = local() # every key listener thread tracks its own in-flight sample
+    
+    
+    _STAGES: Tuple[str, ...] = ("callback", "queue", "state", "dispatch", "paint")
+    
+    
+    @classmethod
+    def begin(cls, action: str, start_ns: int) -> None:
+        cls._thread_state.sample = (action, start_ns)
+    
+    
+    @classmethod
+    def mark(cls, stage: str) -> None:
+        sample: Tuple[str, int] | None = cls.get_sample()
+        
+        if sample is not None:
+            cls._record(sample, stage)
+    
+    
+    @classmethod
+    def get_sample(cls) -> Tuple[str, int] | None:
+        return getattr(cls._thread_state, "sample", None)
+    
+    
+    @classmethod
+    def end(cls) -> None:
+        cls._thread_state.sample = None
+    
+    
+    @classmethod
+    def complete(cls, sample: Tuple[str, int], stage: str) -> None:
+        cls._record(sample, stage) # records a stage that finishes on another thread, e.g. the paint on the tk mainloop
+    
+    
+    @classmethod
+    def get_report(cls) -> Dict[str, List[Tuple[str, int, int, int, int]]]:
+        report: Dict[str, List[Tuple[str, int, int, int, int]]] = {}
+        
+        with cls._lock:
+            for action, stage_histograms in cls._histograms.items():
+                report[action] = [
+                    (stage, histogram.get_count(), histogram.get_percentile(50), histogram.get_percentile(99), histogram.get_max())
+                    for stage in cls._STAGES if (histogram := stage_histograms.get(stage)) is not None
+                ]
+        return report
+    
+    
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._histograms.clear()
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _record(cls, sample: Tuple[str, int], stage: str) -> None:
+        action, start_ns = sample
+        elapsed_ns: int = perf_counter_ns() - start_ns
+        
+        with cls._lock:
+            stage_histograms: Dict[str, LatencyHistogram] = cls._histograms.setdefault(action, {})
+            
+            if stage not in stage_histograms:
+                stage_histograms[stage] = LatencyHistogram()
+            stage_histograms[stage].record(elapsed_ns)
\ No newline at end of file
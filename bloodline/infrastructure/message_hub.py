@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from queue import Queue
-from typing import Callable
+from collections import deque
+from threading import Lock
+from typing import Callable, Deque
+
+from .event_bus import ConsoleText, ErrorRaised, EventBus, Subscription, Topic
+from .latency_monitor import LatencyMonitor
 
 class MessageHub:
     
     _instance: MessageHub | None = None
-    _callback_method: Callable[[str, str], None] | None = None
-    _buffer: Queue = Queue()
+    _console_subscription: Subscription | None = None
+    _console_callback: Callable[[str, str, str | None], None] | None = None
+    _buffer: Deque[ConsoleText] = deque()
+    _dropped_messages: int = 0
+    _lock: Lock = Lock()
     
     def __new__(cls):
         if cls._instance is None:
@@ -15,19 +22,73 @@ class MessageHub:
         return cls._instance
     
     
+    _MAX_BUFFERED_MESSAGES: int = 1000 # messages before the console is linked, e.g. of a startup that keeps failing
+    _MAX_QUEUED_MESSAGES: int = 10_000 # messages between two drains of a queued console
+    
+    
     @classmethod
-    def link_callback(cls, callback_method: Callable[[str, str], None]) -> None:
-        cls._callback_method = callback_method
+    def link_callback(cls, callback_method: Callable[[str, str, str | None], None], wake_up: Callable[[], None] | None = None) -> None:
+        with cls._lock:
+            if cls._console_subscription is not None:
+                EventBus.unsubscribe(cls._console_subscription)
+            
+            while cls._buffer:
+                callback_method(*cls._buffer.popleft())
+            
+            if cls._dropped_messages:
+                callback_method(f"{cls._dropped_messages} message(s) were dropped before the console was ready", "warning", None)
+                cls._dropped_messages = 0
+            
+            # with a wake up, the console only receives its texts once it drains them, e.g. a tk console that must not be changed from other threads
+            cls._console_callback = callback_method
+            cls._console_subscription = EventBus.subscribe(
+                name="console",
+                topics=(Topic.CONSOLE_TEXT,),
+                callback=lambda topic, message: callback_method(*message),
+                max_queued_events=cls._MAX_QUEUED_MESSAGES if wake_up is not None else None,
+                wake_up=wake_up
+            )
+    
+    
+    @classmethod
+    def drain(cls) -> None:
+        if cls._console_subscription is None:
+            return
         
-        while not cls._buffer.empty():
-            text, text_type = cls._buffer.get_nowait()
-            cls._callback_method(text, text_type)
+        dropped_messages: int = cls._console_subscription.drain()
+        
+        if dropped_messages:
+            cls._console_callback(f"{dropped_messages} message(s) were dropped, as the console could not keep up with them", "warning", None)
     
     
     @classmethod
     def invoke(cls, text: str, text_type: str, optional_arg: str | None = None) -> None:
-        if cls._callback_method is None:
-            cls._buffer.put_nowait((text, text_type, optional_arg))
-            return
+        message: ConsoleText = ConsoleText(text, text_type, optional_arg)
+        
+        if cls._console_subscription is None:
+            with cls._lock:
+                if cls._console_subscription is None: # the console could have been linked in the meantime
+                    cls._buffer_message(message)
+                    cls._publish(message) # published while locked, so the console can not receive the message twice
+                    return
+        
+        cls._publish(message)
+        LatencyMonitor.mark("dispatch")
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _buffer_message(cls, message: ConsoleText) -> None:
+        if len(cls._buffer) >= cls._MAX_BUFFERED_MESSAGES:
+            cls._buffer.popleft()
+            cls._dropped_messages += 1
+        cls._buffer.append(message)
+    
+    
+    @classmethod
+    def _publish(cls, message: ConsoleText) -> None:
+        EventBus.publish(Topic.CONSOLE_TEXT, message)
         
-        cls._callback_method(text, text_type, optional_arg)
\ No newline at end of file
+        if message.text_type == "error":
+            EventBus.publish(Topic.ERROR, ErrorRaised(message.text))
\ No newline at end of file
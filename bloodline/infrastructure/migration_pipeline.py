@@ -1,14 +1,20 @@
+from os import replace
 from pathlib import Path
-from shutil import move, make_archive, rmtree
+from shutil import copy2, copytree, rmtree
+from threading import Thread
 from typing import List, Tuple
+from zipfile import ZipFile, ZIP_DEFLATED
 
 from platformdirs import user_data_dir
 
 from .directory import Directory
+from .message_hub import MessageHub
 from file_io.json import MigrationJsonHandler
 
 class MigrationPipeline:
     
+    _msg_provider: MessageHub = MessageHub()
+    
     _MIGRATION_VERSIONS: List[dict] = [
         {
             "version": "0.9.0-beta",
@@ -27,37 +33,94 @@ class MigrationPipeline:
     ]
     
     
+    _MARKER_FILE: str = "migrations.json"
+    _MARKER_FILE_PATH: Path = Directory.get_persistent_data_path() / _MARKER_FILE
+    _ARCHIVE_PROGRESS_STEP: int = 10
+    
+    
     @classmethod
     def run_all_migrations(cls) -> None:
-        pending_migrations: List[dict] = cls._get_pending_migrations()
+        marker: dict = MigrationJsonHandler.load_marker(cls._MARKER_FILE_PATH)
+        completed_versions: List[str] = marker.get("completed_versions", [])
+        pending_cleanup: List[dict] = marker.get("pending_cleanup", [])
+        
+        # only versions that were never checked are probed, so a growing registry does not slow down later starts
+        unchecked_versions: List[dict] = [legacy_data for legacy_data in cls._MIGRATION_VERSIONS if legacy_data.get("version") not in completed_versions]
         
-        if not pending_migrations:
+        if not unchecked_versions and not pending_cleanup:
             return
         
-        cls._archive_legacy_backup(pending_migrations[-1])
+        pending_migrations: List[dict] = cls._get_pending_migrations(unchecked_versions)
         
         for legacy_data in pending_migrations:
             method_name: str = legacy_data.get("migration_method")
             getattr(cls, method_name)(legacy_data)
         
-        for legacy_data in pending_migrations:
-            cls._cleanup_legacy_data(legacy_data.get("root_dir"))
+        # the legacy data is only copied by the migrations, it is archived and removed in the background afterwards
+        pending_cleanup.extend(
+            {"version": legacy_data.get("version"), "src_path": str(legacy_data.get("src_path")), "root_dir": str(legacy_data.get("root_dir"))}
+            for legacy_data in pending_migrations
+        )
+        marker = {
+            "completed_versions": completed_versions + [legacy_data.get("version") for legacy_data in unchecked_versions],
+            "pending_cleanup": pending_cleanup
+        }
+        MigrationJsonHandler.save_raw(cls._MARKER_FILE_PATH, marker)
+        
+        if pending_cleanup:
+            Thread(target=cls._archive_and_cleanup, args=(marker,), daemon=True).start()
     
     
-    @staticmethod
-    def _archive_legacy_backup(legacy_data: dict) -> None:
+    @classmethod
+    def _archive_and_cleanup(cls, marker: dict) -> None:
+        pending_cleanup: List[dict] = marker.get("pending_cleanup")
+        
+        try:
+            for legacy_entry in pending_cleanup:
+                cls._archive_legacy_backup(legacy_entry)
+            
+            for legacy_entry in pending_cleanup:
+                cls._cleanup_legacy_data(Path(legacy_entry.get("root_dir")))
+        except Exception as e:
+            cls._msg_provider.invoke(
+                f"An unexpected error occurred while archiving the legacy data. It will be tried again on the next start.\n"
+                f"Exception: {e}", "error"
+            )
+            return
+        
+        marker["pending_cleanup"] = []
+        MigrationJsonHandler.save_raw(cls._MARKER_FILE_PATH, marker)
+    
+    
+    @classmethod
+    def _archive_legacy_backup(cls, legacy_entry: dict) -> None:
+        src_path: Path = Path(legacy_entry.get("src_path"))
+        
+        if not src_path.exists():
+            return # was already archived and removed before the last shutdown
+        
         Directory.create_archive_dir()
-        archive_path: Path = Directory.get_archive_path()
+        backup_name: str = legacy_entry.get("version")
+        dst_path: Path = Directory.get_archive_path() / f"{backup_name}.zip"
+        tmp_path: Path = dst_path.with_name(f"{dst_path.name}.tmp")
         
-        backup_name: str = legacy_data.get("version")
-        src_path: Path = legacy_data.get("src_path")
-        dst_path: Path = archive_path / backup_name
+        src_files: List[Path] = [item for item in src_path.rglob("*") if item.is_file()]
+        total_size: int = sum(item.stat().st_size for item in src_files) or 1
+        archived_size: int = 0
+        reported_percent: int = -1
         
-        make_archive(
-            base_name=str(dst_path),
-            format="zip",
-            root_dir=str(src_path)
-        )
+        # files are streamed into the archive one by one, so the progress can be reported in between
+        with ZipFile(tmp_path, "w", ZIP_DEFLATED) as archive:
+            for item in src_files:
+                archive.write(item, item.relative_to(src_path))
+                archived_size += item.stat().st_size
+                
+                percent: int = archived_size * 100 // total_size
+                
+                if percent // cls._ARCHIVE_PROGRESS_STEP > reported_percent // cls._ARCHIVE_PROGRESS_STEP:
+                    reported_percent = percent
+                    cls._msg_provider.invoke(f"Archiving the legacy data of version \"{backup_name}\": {percent}%", "counter", "migration_archive")
+        replace(tmp_path, dst_path)
     
     
     # version specific method below
@@ -68,7 +131,7 @@ class MigrationPipeline:
         dst_path: Path = Directory.get_persistent_data_path()
         backup_path: Path = Directory.get_backup_path()
         
-        cls._move_all_data(src_path, dst_path)
+        cls._copy_all_data(src_path, dst_path)
         
         entries_to_rename: List[Tuple[str, str, Path]] = [
             ("save_file.sqlite", "stats.sqlite", dst_path),
@@ -95,11 +158,11 @@ class MigrationPipeline:
     
     # helper methods below
     
-    @classmethod
-    def _get_pending_migrations(cls) -> List[dict]:
+    @staticmethod
+    def _get_pending_migrations(unchecked_versions: List[dict]) -> List[dict]:
         pending_migrations: List[dict] = []
         
-        for legacy_data in cls._MIGRATION_VERSIONS:
+        for legacy_data in unchecked_versions:
             src_path: Path = legacy_data.get("src_path")
             
             if not src_path.exists():
@@ -113,7 +176,7 @@ class MigrationPipeline:
     
     
     @staticmethod
-    def _move_all_data(src_path: Path, dst_path: Path) -> None:
+    def _copy_all_data(src_path: Path, dst_path: Path) -> None:
         for item in src_path.iterdir():
             target_item: Path = dst_path / item.name
             
@@ -123,7 +186,10 @@ class MigrationPipeline:
                 else:
                     target_item.unlink()
             
-            move(str(item), str(target_item))
+            if item.is_dir():
+                copytree(str(item), str(target_item))
+            else:
+                copy2(str(item), str(target_item))
     
     
     @staticmethod
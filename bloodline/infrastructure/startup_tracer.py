@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+from datetime import datetime
+from json import dump
+from pathlib import Path
+from sys import stderr
+from time import perf_counter_ns
+from typing import Iterator, List
+
+from .directory import Directory
+
+class StartupTracer:
+    
+    _enabled: bool = False
+    _finished: bool = False
+    _launch_time_ns: int = perf_counter_ns()
+    _depth: int = 0
+    _phases: List[dict] = []
+    
+    
+    @classmethod
+    def set_launch_time(cls, launch_time_ns: int) -> None:
+        cls._launch_time_ns = launch_time_ns
+    
+    
+    @classmethod
+    def enable(cls) -> None:
+        cls._enabled = True
+    
+    
+    @classmethod
+    def get_elapsed_ms(cls) -> float:
+        return (perf_counter_ns() - cls._launch_time_ns) / 1_000_000
+    
+    
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        if not cls._enabled or cls._finished:
+            yield
+            return
+        
+        start_ns: int = perf_counter_ns()
+        cls._depth += 1
+        
+        try:
+            yield
+        finally:
+            cls._depth -= 1
+            cls.add_phase(name, start_ns, perf_counter_ns())
+    
+    
+    @classmethod
+    def add_phase(cls, name: str, start_ns: int, end_ns: int) -> None:
+        if not cls._enabled or cls._finished:
+            return
+        
+        cls._phases.append({
+            "name": name,
+            "depth": cls._depth,
+            "start_ms": (start_ns - cls._launch_time_ns) / 1_000_000,
+            "duration_ms": (end_ns - start_ns) / 1_000_000
+        })
+    
+    
+    @classmethod
+    def mark(cls, name: str) -> None:
+        cls.add_phase(name, cls._launch_time_ns, perf_counter_ns())
+    
+    
+    @classmethod
+    def finish(cls) -> None:
+        if not cls._enabled or cls._finished:
+            return
+        
+        cls._finished = True
+        total_ms: float = cls.get_elapsed_ms()
+        cls._phases.sort(key=lambda phase: phase.get("start_ms")) # nested phases are recorded before their parents end
+        
+        cls._print_breakdown(total_ms)
+        cls._write_report(total_ms)
+    
+    
+    # helper methods below
+    
+    @classmethod
+    def _print_breakdown(cls, total_ms: float) -> None:
+        print(f"Startup trace of {Directory.get_app_name()} {Directory.get_version()}", file=stderr)
+        
+        for phase in cls._phases:
+            indented_name: str = f"{"  " * phase.get("depth")}{phase.get("name")}"
+            print(f"  {indented_name:<40} {phase.get("start_ms"):>9.1f} ms {phase.get("duration_ms"):>9.1f} ms", file=stderr)
+        print(f"  {"total":<40} {"":>12} {total_ms:>9.1f} ms", file=stderr)
+    
+    
+    @classmethod
+    def _write_report(cls, total_ms: float) -> None:
+        timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        report_path: Path = Directory.get_logs_path() / f"startup_trace_{Directory.get_version()}_{timestamp}.json"
+        
+        try:
+            Directory.create_logs_dir()
+            
+            with open(report_path, "w") as output:
+                dump({
+                    "version": Directory.get_version(),
+                    "timestamp": timestamp,
+                    "total_ms": total_ms,
+                    "phases": cls._phases
+                }, output, indent=4)
+            print(f"The startup trace was written to \"{report_path}\"", file=stderr)
+        except OSError as e:
+            print(
+                f"An unexpected error occurred while writing the startup trace.\n"
+                f"Exception: {e}", file=stderr
+            )
\ No newline at end of file
@@ -1,5 +1,52 @@
-from gui import Application
+from time import perf_counter_ns
+
+_LAUNCH_TIME_NS: int = perf_counter_ns() # taken first so the startup measurements include all imports
+
+from argparse import ArgumentParser, Namespace
+from sys import exit, stdin
+from typing import Iterable
+
+from file_io import SettingsDbHandler
+from infrastructure import StartupTracer
+
+def _parse_args() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog="bloodline")
+    parser.add_argument("--settings-db", action="store_true", help="stores the settings in a single sqlite database, existing json files are imported once")
+    parser.add_argument("--watch-theme", action="store_true", help="reloads the theme whenever the theme file is saved")
+    parser.add_argument("--trace-startup", action="store_true", help="prints the duration of each startup phase and writes a report to the logs directory")
+    subparsers = parser.add_subparsers(dest="mode")
+    
+    exec_parser: ArgumentParser = subparsers.add_parser("exec", help="runs commands without the graphical interface")
+    exec_parser.add_argument("commands", nargs="*", help="commands and request inputs in the order they are entered. Reads from stdin if omitted or '-'")
+    args: Namespace = parser.parse_args()
+    
+    if args.watch_theme and (args.settings_db or SettingsDbHandler.get_enabled()):
+        # the theme is then read from the database, so saving theme.json would never be applied
+        parser.error("--watch-theme watches theme.json and can not be used while the settings are stored in the database")
+    return args
+
+
+def _get_console_inputs(commands: list) -> Iterable[str]:
+    if not commands or commands == ["-"]:
+        return stdin
+    return commands
+
 
 if __name__ == "__main__":
-    app: Application = Application()
+    args: Namespace = _parse_args()
+    StartupTracer.set_launch_time(_LAUNCH_TIME_NS)
+    
+    if args.trace_startup:
+        StartupTracer.enable()
+    if args.settings_db:
+        SettingsDbHandler.enable()
+    
+    if args.mode == "exec":
+        from cli import HeadlessApplication # the gui and its dependencies are never imported in headless mode
+        StartupTracer.mark("imports")
+        exit(HeadlessApplication().run(_get_console_inputs(args.commands)))
+    
+    from gui import Application
+    StartupTracer.mark("imports")
+    app: Application = Application(watch_theme=args.watch_theme)
     app.run()
\ No newline at end of file
@@ -3,4 +3,5 @@ from .preset_schema import PresetModel
 from .theme_schema import ThemeModel, SectionKeys as TSectionKeys, ColorKeys, FontKeys, WidgetKeys
 from .update_schema import UpdateModel, UpdateKeys, RequestTime
 from .version_schema import VersionModel, VersionKeys
-from .window_schema import WindowModel, SectionKeys as WSectionKeys, WindowKeys
\ No newline at end of file
+from .window_schema import WindowModel, SectionKeys as WSectionKeys, WindowKeys, TimerPrecision
+from .validation_pattern import ValidationPattern
\ No newline at end of file
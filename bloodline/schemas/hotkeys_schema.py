@@ -15,6 +15,9 @@ class HotkeyNames(str, Enum):
     TIMER_PAUSE: str = "hk_timer_pause"
     TIMER_STOP: str = "hk_timer_stop"
     TIMER_RESET: str = "hk_timer_reset"
+    TIMER_SPLIT: str = "hk_timer_split"
+    SLOT_NEXT: str = "hk_slot_next"
+    SLOT_PREVIOUS: str = "hk_slot_previous"
     LISTENER_END: str = "hk_listener_end"
 
 
@@ -31,6 +34,9 @@ class HotkeyModel(AllowModel):
     timer_pause: str = Field(default="=", alias=HotkeyNames.TIMER_PAUSE.value)
     timer_stop: str = Field(default="?", alias=HotkeyNames.TIMER_STOP.value)
     timer_reset: str = Field(default="*", alias=HotkeyNames.TIMER_RESET.value)
+    timer_split: str = Field(default="!", alias=HotkeyNames.TIMER_SPLIT.value)
+    slot_next: str = Field(default="%", alias=HotkeyNames.SLOT_NEXT.value)
+    slot_previous: str = Field(default="$", alias=HotkeyNames.SLOT_PREVIOUS.value)
     listener_end: str = Field(default="°", alias=HotkeyNames.LISTENER_END.value)
     
     @field_validator("*")
@@ -10,6 +10,8 @@ from infrastructure import MessageHub
 
 class UpdateKeys(str, Enum):
     LAST_API_REQUEST: str = "last_api_request"
+    LATEST_VERSION: str = "latest_version"
+    ETAG: str = "etag"
 
 
 class RequestTime(str, Enum):
@@ -23,8 +25,10 @@ _msg_provider: MessageHub = MessageHub()
 
 class UpdateModel(AllowModel):
     last_api_request: str = Field(default_factory=lambda: datetime.now().strftime(RequestTime.TIME_FORMAT), alias=UpdateKeys.LAST_API_REQUEST.value)
+    latest_version: str = Field(default="", alias=UpdateKeys.LATEST_VERSION.value)
+    etag: str = Field(default="", alias=UpdateKeys.ETAG.value) # lets unchanged release data be answered with "304 Not Modified"
     
-    @field_validator("*")
+    @field_validator("last_api_request")
     @classmethod
     def _validate_timestamp_pattern(cls, timestamp: str, info: FieldValidationInfo) -> str:
         if not ValidationPattern.validate_timestamp_pattern(timestamp):
@@ -1,9 +1,18 @@
 from re import compile, fullmatch
-
-from pynput import keyboard
+from typing import FrozenSet, List, Tuple
 
 class ValidationPattern:
     
+    # the special keys pynput defines on every platform, kept here so a keybind can be validated without importing pynput (which fails without a display)
+    _SPECIAL_KEY_NAMES: FrozenSet[str] = frozenset((
+        "alt", "alt_l", "alt_r", "alt_gr", "backspace", "caps_lock", "cmd", "cmd_l", "cmd_r", "ctrl", "ctrl_l", "ctrl_r",
+        "delete", "down", "end", "enter", "esc", *(f"f{number}" for number in range(1, 21)), "home", "left", "page_down",
+        "page_up", "right", "shift", "shift_l", "shift_r", "space", "tab", "up", "media_play_pause", "media_volume_mute",
+        "media_volume_down", "media_volume_up", "media_previous", "media_next", "insert", "menu", "num_lock", "pause",
+        "print_screen", "scroll_lock"
+    ))
+    
+    
     @staticmethod
     def validate_hex_pattern(color: str) -> bool:
         valid_hex_pattern: str = compile(r"#([a-fA-F0-9]{6}|[a-fA-F0-9]{3})")
@@ -33,13 +42,31 @@ class ValidationPattern:
     
     @staticmethod
     def validate_keybind_pattern(keybind: str) -> bool:
-        if len(keybind) == 1:
+        modifiers, key_name = ValidationPattern.split_keybind(keybind)
+        
+        if any(modifier not in ("ctrl", "alt", "cmd") for modifier in modifiers):
+            return False
+        
+        if len(key_name) == 1:
             return True
-        elif keybind in keyboard.Key.__members__.keys():
+        
+        # special keys are stored the way pynput prints them, e.g. "Key.f5"
+        if key_name.startswith("Key.") and key_name.removeprefix("Key.") in ValidationPattern._SPECIAL_KEY_NAMES:
             return True
         return False
     
     
+    @staticmethod
+    def split_keybind(keybind: str) -> Tuple[List[str], str]:
+        modifiers: List[str] = []
+        
+        # chords are written as "<ctrl>+<alt>+Key.f5", the remainder is always the key itself
+        while keybind.startswith("<") and ">+" in keybind and len(keybind) > keybind.index(">+") + 2:
+            modifier, keybind = keybind[1:].split(">+", 1)
+            modifiers.append(modifier)
+        return (modifiers, keybind)
+    
+    
     @staticmethod
     def validate_version_pattern(version: str) -> bool:
         valid_version_pattern: str = compile(r"^(\d+\.\d+\.\d+)(-[a-zA-Z0-9.]+)?$")
@@ -16,6 +16,13 @@ class WindowKeys(str, Enum):
     GEOMETRY: str = "geometry"
     MAXIMIZED: str = "maximized"
     LOCKED: str = "locked"
+    TIMER_PRECISION: str = "timer_precision"
+
+
+class TimerPrecision(str, Enum):
+    SECONDS: str = "seconds"
+    TENTHS: str = "tenths"
+    HUNDREDTHS: str = "hundredths"
 
 
 _msg_provider: MessageHub = MessageHub()
@@ -39,6 +46,7 @@ class _RootWindow(AllowModel):
 class _ToplevelWindow(AllowModel):
     geometry: str = Field(default="+0+0", alias=WindowKeys.GEOMETRY.value)
     locked: bool = Field(default=False, alias=WindowKeys.LOCKED.value)
+    timer_precision: str = Field(default=TimerPrecision.SECONDS.value, alias=WindowKeys.TIMER_PRECISION.value)
     
     @field_validator("geometry")
     @classmethod
@@ -47,6 +55,14 @@ class _ToplevelWindow(AllowModel):
             _msg_provider.invoke(f"The value of toplevel \"{info.field_name}\" is not functional. The default will be restored", "warning")
             return cls.model_fields[info.field_name].default
         return geometry
+    
+    @field_validator("timer_precision")
+    @classmethod
+    def _validate_timer_precision(cls, timer_precision: str, info: FieldValidationInfo) -> str:
+        if timer_precision not in {precision.value for precision in TimerPrecision}:
+            _msg_provider.invoke(f"The value of toplevel \"{info.field_name}\" is not functional. The default will be restored", "warning")
+            return cls.model_fields[info.field_name].default
+        return timer_precision
 
 
 class WindowModel(AllowModel):
@@ -3,27 +3,30 @@ from itertools import zip_longest
 from json import JSONDecodeError
 from pathlib import Path
 from re import findall
-from typing import Any, List
-
-from requests import get, Response, RequestException
+from threading import Thread
+from typing import Any, Callable, List
 
 from .web_manager import WebManager
+from file_io import SettingsDbHandler
 from file_io.json import PersistentJsonHandler
 from infrastructure import Directory, MessageHub
 from schemas import UpdateModel, UpdateKeys, RequestTime
 
 class UpdateService:
     
-    def __init__(self, request_interval_minutes: float):
+    def __init__(self, request_interval_minutes: float, api_url: str | None = None, clock: Callable[[], datetime] = datetime.now):
         self._request_interval_minutes: float = request_interval_minutes
+        self._api_url: str = api_url if api_url is not None else WebManager.get_api_url() # can be pointed to a local server for testing
+        self._clock: Callable[[], datetime] = clock
+        self._check_thread: Thread | None = None
         
-        self._update_file_exists: bool = UpdateService._UPDATE_FILE_PATH.exists() or UpdateService._BACKUP_FILE_PATH.exists()
         self._msg_provider: MessageHub = MessageHub()
         
-        self._pers_json_handler: PersistentJsonHandler = PersistentJsonHandler(
+        self._pers_json_handler: PersistentJsonHandler = SettingsDbHandler.create(
             main_file_path=UpdateService._UPDATE_FILE_PATH,
             backup_file_path=UpdateService._BACKUP_FILE_PATH,
-            default_data=UpdateModel()
+            default_data=UpdateModel(),
+            write_behind=True
         )
         self._pers_json_handler.load_data()
     
@@ -34,22 +37,50 @@ class UpdateService:
     _BACKUP_FILE_PATH: Path = Directory.get_backup_path() / _BACKUP_FILE
     
     
-    def check_for_update(self) -> None:
-        if not self._get_check_allowed():
+    def check_for_update(self, in_background: bool = True) -> None:
+        if not in_background:
+            self._run_check()
+            return
+        
+        # the request must not block the tk main loop, results are posted through the message hub
+        self._check_thread = Thread(target=self._run_check, daemon=True)
+        self._check_thread.start()
+    
+    
+    def wait_for_check(self, timeout: float | None = None) -> None:
+        if self._check_thread is not None:
+            self._check_thread.join(timeout)
+    
+    
+    # helper methods below
+    
+    def _run_check(self) -> None:
+        current_timestamp: datetime = self._clock()
+        
+        if not self._get_check_allowed(current_timestamp):
             return
         
+        from requests import get, Response, RequestException # imported on demand since it noticeably delays the startup
+        
+        old_update_state: dict = self._pers_json_handler.get_data()
+        new_update_state: dict = {**old_update_state, UpdateKeys.LAST_API_REQUEST: current_timestamp.strftime(RequestTime.TIME_FORMAT)}
+        
         try:
             response: Response = get(
-                url=WebManager.get_api_url(),
-                headers=WebManager.get_headers(),
+                url=self._api_url,
+                headers=self._get_request_headers(old_update_state),
                 timeout=5
             )
             response.raise_for_status()
             
-            data: dict = response.json()
-            latest_version: str = data.get("tag_name")
+            if response.status_code != 304: # otherwise the cached release data is still up to date
+                data: dict = response.json()
+                new_update_state[UpdateKeys.LATEST_VERSION] = data.get("tag_name") or ""
+                new_update_state[UpdateKeys.ETAG] = response.headers.get("ETag", "")
+            
+            latest_version: str = new_update_state.get(UpdateKeys.LATEST_VERSION)
             
-            if self._get_new_version_available(latest_version):
+            if latest_version and self._get_new_version_available(latest_version):
                 release_url: str = WebManager.get_release_url()
                 self._msg_provider.invoke(f"A newer version \"{latest_version}\" is available to download at:", "note")
                 self._msg_provider.invoke(release_url, "hyperlink", release_url)
@@ -57,24 +88,28 @@ class UpdateService:
             self._msg_provider.invoke("The fetched update data is corrupted or invalid. The update check is being aborted", "error")
         except RequestException:
             pass
+        
+        if new_update_state != old_update_state: # the state file and its backup are only rewritten once per check if needed
+            self._pers_json_handler.set_data(new_update_state)
     
     
-    # helper methods below
-    
-    def _get_check_allowed(self) -> bool:
-        current_timestamp: datetime = datetime.now()
+    def _get_check_allowed(self, current_timestamp: datetime) -> bool:
         update_state: dict = self._pers_json_handler.get_data()
         last_api_request: datetime = datetime.strptime(update_state.get(UpdateKeys.LAST_API_REQUEST), RequestTime.TIME_FORMAT)
         
-        if not self._update_file_exists:
+        if self._pers_json_handler.get_created_defaults():
             return True
+        return current_timestamp >= last_api_request + timedelta(minutes=self._request_interval_minutes)
+    
+    
+    @staticmethod
+    def _get_request_headers(update_state: dict) -> dict:
+        headers: dict = dict(WebManager.get_headers())
+        etag: str = update_state.get(UpdateKeys.ETAG)
         
-        if current_timestamp < last_api_request + timedelta(minutes=self._request_interval_minutes):
-            return False
-        
-        update_state[UpdateKeys.LAST_API_REQUEST] = current_timestamp.strftime(RequestTime.TIME_FORMAT)
-        self._pers_json_handler.set_data(update_state)
-        return True
+        if etag and update_state.get(UpdateKeys.LATEST_VERSION):
+            headers["If-None-Match"] = etag
+        return headers
     
     
     def _get_new_version_available(self, latest_version: str) -> bool:
@@ -0,0 +1,88 @@
+from os import environ
+from pathlib import Path
+from subprocess import CompletedProcess, run
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import List, Tuple
+from unittest import TestCase, main
+
+class HeadlessApplicationTest(TestCase):
+    
+    def setUp(self):
+        self._data_dir: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(self._data_dir.cleanup)
+    
+    
+    _APP_DIR: Path = Path(__file__).resolve().parent.parent
+    _DISPLAY_VARIABLES: Tuple[str, ...] = ("DISPLAY", "WAYLAND_DISPLAY", "PYNPUT_BACKEND")
+    
+    
+    def test_gui_is_not_imported(self):
+        result: CompletedProcess = self._run_script(
+            "from runpy import run_path\n"
+            "import sys\n"
+            "sys.argv = ['main.py', 'exec', 'help']\n"
+            "try:\n"
+            "    run_path('main.py', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(module for module in sys.modules if module.split('.')[0] in ('tkinter', '_tkinter', 'gui')))\n"
+        )
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.splitlines()[-1], "[]")
+    
+    
+    def test_tracking_commands_are_rejected(self):
+        # every tracking action installs the global keyboard hook, which a headless process must never do
+        result: CompletedProcess = self._run_script(
+            "from cli import HeadlessApplication\n"
+            "application = HeadlessApplication()\n"
+            "tracking_commands = [command for command in application._cmd_manager.get_list_of_commands() if command.startswith('tracking ')]\n"
+            "print('\\n'.join(tracking_commands))\n"
+            "for command in tracking_commands:\n"
+            "    application.run([command])\n"
+        )
+        tracking_commands: List[str] = [line for line in result.stdout.splitlines() if line.startswith("tracking ")]
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("tracking bank", tracking_commands)
+        
+        for command in tracking_commands:
+            self.assertIn(f"[INVALID] The command '{command}' requires the graphical interface", result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+    
+    
+    def test_special_keybind_without_display(self):
+        # a keybind like "Key.f5" is validated on every start, pynput can not even be imported without a display
+        result: CompletedProcess = self._run_script(
+            "import sys\n"
+            "from json import dump\n"
+            "from infrastructure import Directory\n"
+            "Directory.create_data_dirs()\n"
+            "with open(Directory.get_persistent_data_path() / 'hotkeys.json', 'w') as output:\n"
+            "    dump({'hk_counter_increase': 'Key.f5'}, output)\n"
+            "from cli import HeadlessApplication\n"
+            "HeadlessApplication().run(['stats list games', 'keybinds list'])\n"
+            "print(sorted(module for module in sys.modules if module.split('.')[0] == 'pynput'))\n"
+        )
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("hk_counter_increase: Key.f5", result.stdout)
+        self.assertEqual(result.stdout.splitlines()[-1], "[]")
+        self.assertNotIn("Traceback", result.stderr)
+    
+    
+    # helper methods below
+    
+    def _run_script(self, script: str) -> CompletedProcess:
+        # the data directories are resolved on import, so every run gets its own process and data directory
+        env: dict = dict(environ, HOME=self._data_dir.name, XDG_DATA_HOME=self._data_dir.name, XDG_DOCUMENTS_DIR=self._data_dir.name)
+        
+        for display_variable in HeadlessApplicationTest._DISPLAY_VARIABLES: # runs like a scheduled job on a machine without a display
+            env.pop(display_variable, None)
+        return run([executable, "-c", script], cwd=HeadlessApplicationTest._APP_DIR, env=env, capture_output=True, text=True, timeout=60)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
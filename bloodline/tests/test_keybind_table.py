@@ -0,0 +1,55 @@
+from os import environ
+from unittest import TestCase, main
+
+environ.setdefault("PYNPUT_BACKEND", "dummy") # no display or input device is needed to create key codes
+
+from pynput.keyboard import KeyCode
+
+from core.keybind_table import KeybindTable
+from schemas import HotkeyNames
+
+class KeybindTableTest(TestCase):
+    
+    def setUp(self):
+        self._keybind_table: KeybindTable = KeybindTable()
+        self._keybind_table.rebuild({HotkeyNames.COUNTER_INC: "<ctrl>+a", HotkeyNames.COUNTER_DEC: "-"})
+        self._ctrl_mask: int = KeybindTable.get_modifier_bit("Key.ctrl_l")
+    
+    
+    def test_ctrl_letter_chord_matches(self):
+        key_name: str = KeybindTable.get_key_name(KeyCode.from_char("\x01")) # pynput reports ctrl+a as a control character
+        
+        self.assertEqual(key_name, "a")
+        self.assertEqual(self._keybind_table.get_hotkey(self._ctrl_mask, key_name), HotkeyNames.COUNTER_INC)
+    
+    
+    def test_ctrl_letter_chord_uses_canonical_key(self):
+        key_name: str = KeybindTable.get_key_name(KeyCode.from_char("\x01"), canonical=lambda key: KeyCode.from_char("a"))
+        
+        self.assertEqual(self._keybind_table.get_hotkey(self._ctrl_mask, key_name), HotkeyNames.COUNTER_INC)
+    
+    
+    def test_plain_key_is_unchanged(self):
+        key_name: str = KeybindTable.get_key_name(KeyCode.from_char("-"), canonical=lambda key: KeyCode.from_char("ß"))
+        
+        self.assertEqual(self._keybind_table.get_hotkey(0, key_name), HotkeyNames.COUNTER_DEC)
+    
+    
+    def test_held_modifier_falls_back_to_plain_keybind(self):
+        # e.g. the player crouches with ctrl while pressing the hotkey
+        self.assertEqual(self._keybind_table.get_hotkey(self._ctrl_mask, "-"), HotkeyNames.COUNTER_DEC)
+        self.assertEqual(self._keybind_table.get_hotkey(self._ctrl_mask, "a"), HotkeyNames.COUNTER_INC)
+        self.assertIsNone(self._keybind_table.get_hotkey(0, "a"))
+    
+    
+    def test_alt_gr_cancels_synthetic_ctrl(self):
+        # windows reports altgr as "Key.ctrl_l" followed by "Key.alt_gr"
+        modifier_mask: int = KeybindTable.press_modifier(0, "Key.ctrl_l")
+        modifier_mask = KeybindTable.press_modifier(modifier_mask, "Key.alt_gr")
+        
+        self.assertEqual(modifier_mask, 0)
+        self.assertIsNone(KeybindTable.press_modifier(modifier_mask, "a"))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
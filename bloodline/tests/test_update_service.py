@@ -0,0 +1,100 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from os import environ
+from pathlib import Path
+from subprocess import CompletedProcess, run
+from sys import executable
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import List
+from unittest import TestCase, main
+
+class _ReleaseStub(BaseHTTPRequestHandler):
+    
+    requests: List[dict] = []
+    
+    
+    _ETAG: str = "\"release-v99\""
+    _PAYLOAD: bytes = dumps({"tag_name": "v99.0.0"}).encode("utf-8")
+    
+    
+    def do_GET(self):
+        _ReleaseStub.requests.append(dict(self.headers))
+        
+        # answers like the github api, unchanged release data is only confirmed by its etag
+        if self.headers.get("If-None-Match") == _ReleaseStub._ETAG:
+            self.send_response(304)
+            self.send_header("ETag", _ReleaseStub._ETAG)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header("ETag", _ReleaseStub._ETAG)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_ReleaseStub._PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_ReleaseStub._PAYLOAD)
+    
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class UpdateServiceTest(TestCase):
+    
+    def setUp(self):
+        self._data_dir: TemporaryDirectory = TemporaryDirectory()
+        self.addCleanup(self._data_dir.cleanup)
+        
+        _ReleaseStub.requests = []
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), _ReleaseStub)
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+    
+    
+    _APP_DIR: Path = Path(__file__).resolve().parent.parent
+    
+    
+    def test_conditional_request_keeps_state(self):
+        # both checks run within the same minute, so only the response itself could change the stored state
+        result: CompletedProcess = self._run_script(
+            "import sys\n"
+            "from datetime import datetime\n"
+            "from file_io.json import PersistentJsonHandler\n"
+            "from infrastructure import Directory, MessageHub\n"
+            "from services import UpdateService\n"
+            "Directory.create_data_dirs()\n"
+            "MessageHub.link_callback(lambda text, text_type, optional_arg=None: print(text_type, text))\n"
+            "service = UpdateService(request_interval_minutes=0, api_url=sys.argv[1], clock=lambda: datetime(2026, 1, 1, 12, 0))\n"
+            "state_files = (Directory.get_persistent_data_path() / 'update_state.json', Directory.get_backup_path() / 'update_state.json.bak')\n"
+            "service.check_for_update(in_background=False)\n"
+            "PersistentJsonHandler.flush_all()\n"
+            "first_writes = [state_file.stat().st_mtime_ns for state_file in state_files]\n"
+            "print('etag', service._pers_json_handler.get_data().get('etag'))\n"
+            "service.check_for_update(in_background=False)\n"
+            "PersistentJsonHandler.flush_all()\n"
+            "print('rewritten', first_writes != [state_file.stat().st_mtime_ns for state_file in state_files])\n"
+        )
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(len(_ReleaseStub.requests), 2)
+        self.assertNotIn("If-None-Match", _ReleaseStub.requests[0])
+        self.assertEqual(_ReleaseStub.requests[1].get("If-None-Match"), _ReleaseStub._ETAG)
+        
+        self.assertIn("note A newer version \"v99.0.0\" is available to download at:", result.stdout)
+        self.assertIn(f"etag {_ReleaseStub._ETAG}", result.stdout)
+        self.assertEqual(result.stdout.splitlines()[-1], "rewritten False")
+    
+    
+    # helper methods below
+    
+    def _run_script(self, script: str) -> CompletedProcess:
+        # the data directories are resolved on import, so the service runs in its own process and data directory
+        env: dict = dict(environ, HOME=self._data_dir.name, XDG_DATA_HOME=self._data_dir.name, XDG_DOCUMENTS_DIR=self._data_dir.name)
+        api_url: str = f"http://127.0.0.1:{self._server.server_port}/repos/prjbl/bloodline/releases/latest"
+        return run([executable, "-c", script, api_url], cwd=UpdateServiceTest._APP_DIR, env=env, capture_output=True, text=True, timeout=60)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file